@@ -143,6 +143,11 @@ class GeminiMultiTurnRequest(BaseModel):
         alias="conversationHistory",
         description="Previous conversation messages for context"
     )
+    conversation_id: Optional[str] = Field(
+        default=None,
+        alias="conversationId",
+        description="ID from a previous response - replaces resending conversationHistory"
+    )
     aspect_ratio: Optional[AspectRatio] = Field(default="1:1", alias="aspectRatio")
     image_size: Optional[ImageSize] = Field(default="1K", alias="imageSize")
     enable_google_search: bool = Field(default=False, alias="enableGoogleSearch")
@@ -184,6 +189,11 @@ class GeminiImageResponse(BaseModel):
         alias="conversationHistory",
         description="Updated conversation history for multi-turn"
     )
+    conversation_id: Optional[str] = Field(
+        default=None,
+        alias="conversationId",
+        description="Server-side handle for the updated history (multi-turn)"
+    )
     thinking_images: Optional[List[str]] = Field(
         default=None,
         alias="thinkingImages", 
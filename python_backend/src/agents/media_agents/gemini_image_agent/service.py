@@ -11,6 +11,7 @@ API Reference: https://ai.google.dev/gemini-api/docs/image-generation
 import os
 import base64
 import logging
+import uuid
 import httpx
 from typing import Optional, List, Tuple
 
@@ -23,12 +24,19 @@ from .schemas import (
     ConversationPart,
     InlineImage,
 )
+from ....utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 # Gemini API endpoint
 GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
 
+# Multi-turn histories kept server-side so later turns can send a conversationId
+# instead of re-uploading every previous image. Per worker process; histories
+# hold base64 images, hence the small size.
+CONVERSATION_TTL_SECONDS = 3600
+_conversations = TTLCache(maxsize=128, ttl=CONVERSATION_TTL_SECONDS)
+
 
 def get_api_key() -> str:
     """Get Gemini API key from environment"""
@@ -385,17 +393,29 @@ async def multi_turn_edit(request: GeminiMultiTurnRequest) -> GeminiImageRespons
     
     Maintains conversation context across turns.
     Thought signatures from previous responses are preserved.
+    
+    History comes from conversationHistory, or - when only conversationId is
+    sent - from the server-side copy stored by the previous turn.
     """
     try:
         api_key = get_api_key()
         model = request.model
         
+        history = request.conversation_history
+        if history is None and request.conversation_id:
+            history = _conversations.get(request.conversation_id)
+            if history is None:
+                return GeminiImageResponse(
+                    success=False,
+                    error="Conversation expired or not found. Please resend conversationHistory."
+                )
+        
         # Build contents from history + new prompt
         contents = []
         
         # Add conversation history
-        if request.conversation_history:
-            for msg in request.conversation_history:
+        if history:
+            for msg in history:
                 content_parts = []
                 for part in msg.parts:
                     if part.text:
@@ -470,7 +490,7 @@ async def multi_turn_edit(request: GeminiMultiTurnRequest) -> GeminiImageRespons
         
         if result.success:
             # Build updated conversation history
-            new_history = list(request.conversation_history or [])
+            new_history = list(history or [])
             
             # Add user message
             new_history.append(ConversationMessage(
@@ -507,6 +527,10 @@ async def multi_turn_edit(request: GeminiMultiTurnRequest) -> GeminiImageRespons
             ))
             
             result.conversation_history = new_history
+            
+            # New ID per turn: earlier IDs stay valid for retries and branching
+            result.conversation_id = uuid.uuid4().hex
+            _conversations.set(result.conversation_id, new_history)
         
         return result
         
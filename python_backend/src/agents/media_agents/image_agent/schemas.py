@@ -29,6 +29,7 @@ class FrontendImageOptions(BaseModel):
     moderation: Optional[Moderation] = Field("auto", description="Moderation level")
     output_compression: Optional[int] = Field(None, ge=0, le=100, description="JPEG/WebP compression 0-100%")
     n: Optional[int] = Field(1, ge=1, le=10, description="Number of images to generate")
+    cache_bypass: Optional[bool] = Field(False, description="Always generate a fresh image, skipping the result cache")
 
 
 class FrontendImageRequest(BaseModel):
@@ -76,6 +77,7 @@ class ImageReferenceRequest(BaseModel):
     quality: Optional[ImageQuality] = Field("medium", description="Quality level")
     format: Optional[ImageFormat] = Field("png", description="Output format")
     background: Optional[ImageBackground] = Field("auto", description="Background type")
+    cache_bypass: Optional[bool] = Field(False, description="Always generate a fresh image, skipping the result cache")
 
 
 # ============================================================================
@@ -5,6 +5,7 @@ from .service import (
     remix_video,
     get_video_status,
     fetch_video_content,
+    open_video_content_stream,
     list_videos,
     delete_video,
 )
@@ -29,6 +30,7 @@ __all__ = [
     "remix_video",
     "get_video_status",
     "fetch_video_content",
+    "open_video_content_stream",
     "list_videos",
     "delete_video",
     # Request schemas
@@ -3,12 +3,14 @@ Sora Agent Service
 OpenAI Video Generation API (Sora 2) - Production Implementation
 Per latest OpenAI Video API documentation
 """
+import asyncio
 import logging
 import time
 import base64
 import httpx
 import io
-from typing import Optional
+from contextlib import AsyncExitStack
+from typing import Any, AsyncIterator, Dict, List, Optional
 from PIL import Image
 
 from openai import AsyncOpenAI
@@ -28,6 +30,20 @@ from ....config import settings
 
 logger = logging.getLogger(__name__)
 
+# Content type of each downloadable variant, and the chunk size used when
+# proxying it to the client
+VARIANT_MEDIA_TYPES = {
+    "video": "video/mp4",
+    "thumbnail": "image/webp",
+    "spritesheet": "image/jpeg",
+}
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Status polls arriving within this window are answered together: one
+# GET /videos page covers every job on it instead of one GET /videos/{id} each
+STATUS_BATCH_WINDOW_SECONDS = 0.2
+STATUS_BATCH_LIST_LIMIT = 100
+
 # Lazy client initialization
 _openai_client: Optional[AsyncOpenAI] = None
 
@@ -290,19 +306,87 @@ async def remix_video(request: SoraRemixRequest) -> SoraGenerateResponse:
         return SoraGenerateResponse(success=False, error=str(e))
 
 
+class _StatusBatcher:
+    """
+    Merges concurrent status polls into shared upstream lookups.
+    
+    Polls are collected for STATUS_BATCH_WINDOW_SECONDS. A lone job is
+    retrieved directly; several are looked up in one list page, and any
+    not on that page fall back to GET /videos/{id}. Repeated polls for the
+    same job in a window share one result.
+    """
+    
+    def __init__(self):
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    async def lookup(self, video_id: str) -> Any:
+        """Wait for the video object of video_id from the next batch"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(video_id, []).append(future)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        return await future
+    
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(STATUS_BATCH_WINDOW_SECONDS)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+        
+        try:
+            videos = await self._retrieve_many(list(pending))
+        except Exception as e:
+            videos = {video_id: e for video_id in pending}
+        
+        for video_id, futures in pending.items():
+            video = videos[video_id]
+            for future in futures:
+                if future.done():
+                    continue
+                if isinstance(video, BaseException):
+                    future.set_exception(video)
+                else:
+                    future.set_result(video)
+    
+    async def _retrieve_many(self, video_ids: List[str]) -> Dict[str, Any]:
+        """Video objects (or the exception raised fetching them) by id"""
+        client = get_openai_client()
+        found: Dict[str, Any] = {}
+        
+        if len(video_ids) > 1:
+            try:
+                page = await client.videos.list(limit=STATUS_BATCH_LIST_LIMIT, order="desc")
+                wanted = set(video_ids)
+                found = {v.id: v for v in page.data if v.id in wanted}
+            except Exception as e:
+                logger.warning(f"Batched status list failed, retrieving jobs individually: {e}")
+        
+        missing = [video_id for video_id in video_ids if video_id not in found]
+        if missing:
+            results = await asyncio.gather(
+                *(client.videos.retrieve(video_id) for video_id in missing),
+                return_exceptions=True,
+            )
+            found.update(zip(missing, results))
+        
+        return found
+
+
+_status_batcher = _StatusBatcher()
+
+
 async def get_video_status(request: SoraStatusRequest) -> SoraStatusResponse:
     """
     Get video generation status
     
     Per docs: GET /videos/{id}
     Returns status (queued, in_progress, completed, failed) and progress %
+    Concurrent polls are batched (see _StatusBatcher).
     """
     try:
-        client = get_openai_client()
-        
         logger.info(f"Checking video status: {request.videoId}")
         
-        response = await client.videos.retrieve(request.videoId)
+        response = await _status_batcher.lookup(request.videoId)
         
         video_data = {
             "video": {
@@ -396,6 +480,39 @@ async def fetch_video_content(request: SoraFetchRequest) -> SoraFetchResponse:
         return SoraFetchResponse(success=False, error=str(e))
 
 
+async def open_video_content_stream(
+    video_id: str,
+    variant: str = "video",
+) -> tuple[AsyncIterator[bytes], str]:
+    """
+    Open a streaming download of completed video content
+    
+    Unlike fetch_video_content, the file is never held in memory or base64
+    encoded - chunks are proxied from OpenAI as they arrive. The upstream
+    request is made before returning, so errors surface before any bytes
+    are sent.
+    
+    Returns:
+        (chunk iterator, media type)
+    """
+    client = get_openai_client()
+    logger.info(f"Streaming video content: {video_id}, variant={variant}")
+    
+    stack = AsyncExitStack()
+    response = await stack.enter_async_context(
+        client.videos.with_streaming_response.download_content(video_id, variant=variant)
+    )
+    
+    async def chunks() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                yield chunk
+        finally:
+            await stack.aclose()
+    
+    return chunks(), VARIANT_MEDIA_TYPES[variant]
+
+
 async def list_videos(limit: int = 20, after: Optional[str] = None, order: str = "desc") -> dict:
     """
     List videos with pagination
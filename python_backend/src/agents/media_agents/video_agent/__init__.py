@@ -7,6 +7,7 @@ from .service import (
     extend_video,
     get_video_status,
     download_video,
+    close_http_client,
 )
 from .schemas import (
     VideoGenerationRequest,
@@ -36,6 +37,7 @@ __all__ = [
     "extend_video",
     "get_video_status",
     "download_video",
+    "close_http_client",
     # Request schemas
     "VideoGenerationRequest",
     "ImageToVideoRequest",
@@ -3,11 +3,13 @@ Video Generation Service - Veo 3.1
 Production implementation using Google Veo API via google-genai SDK
 Supports: Text-to-video, Image-to-video, Video extension, Reference images, Frame interpolation
 """
+import asyncio
 import logging
 import time
 import base64
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
+import httpx
 from google import genai
 from google.genai import types
 
@@ -47,14 +49,39 @@ def get_genai_client() -> genai.Client:
     return _genai_client
 
 
+# Shared HTTP client for image/video downloads - keeps connections and TLS
+# sessions alive across requests instead of re-creating a pool per call
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the pooled HTTP client used for downloads"""
+    global _http_client
+    
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=120.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the pooled HTTP client (called on application shutdown)"""
+    global _http_client
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 async def _parse_image_input(image_url: str) -> types.Image:
     """Parse image URL or base64 data URL into google-genai Image object.
     
     Per official Veo 3.1 docs, types.Image only accepts image_bytes and mime_type,
     not image_uri. So we need to download HTTP URLs and convert to bytes.
     """
-    import httpx
-    
     if image_url.startswith("data:"):
         # Parse data URL: data:image/png;base64,xxxxx
         header, b64_data = image_url.split(",", 1)
@@ -65,17 +92,16 @@ async def _parse_image_input(image_url: str) -> types.Image:
         return types.Image(image_bytes=image_bytes, mime_type=mime_type)
     else:
         # HTTP URL - download the image and convert to bytes
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(image_url)
-            response.raise_for_status()
-            content_type = response.headers.get("content-type", "image/png")
-            # Handle cases where content-type might have charset or other params
-            mime_type = content_type.split(";")[0].strip()
-            # Ensure we have a valid image MIME type
-            if mime_type not in ["image/png", "image/jpeg", "image/jpg", "image/webp"]:
-                mime_type = "image/png"
-            logger.info(f"[Veo] Downloaded image: {len(response.content)} bytes, {mime_type}")
-            return types.Image(image_bytes=response.content, mime_type=mime_type)
+        response = await _get_http_client().get(image_url, timeout=60.0)
+        response.raise_for_status()
+        content_type = response.headers.get("content-type", "image/png")
+        # Handle cases where content-type might have charset or other params
+        mime_type = content_type.split(";")[0].strip()
+        # Ensure we have a valid image MIME type
+        if mime_type not in ["image/png", "image/jpeg", "image/jpg", "image/webp"]:
+            mime_type = "image/png"
+        logger.info("[Veo] Downloaded image: %s bytes, %s", len(response.content), mime_type)
+        return types.Image(image_bytes=response.content, mime_type=mime_type)
 
 
 def _build_video_config(
@@ -173,7 +199,7 @@ async def generate_video(request: VideoGenerationRequest) -> VideoGenerationResp
         # Model comes from frontend request (Pydantic default if not provided)
         model = request.model if request.model is not None else "veo-3.1-generate-preview"
         
-        logger.info(f"[Veo] Text-to-video: model={model}, resolution={resolution}, duration={duration}")
+        logger.info("[Veo] Text-to-video: model=%s, resolution=%s, duration=%s", model, resolution, duration)
         
         # Build config - all parameters from frontend request
         # Pydantic defaults ensure values exist even if frontend omits them
@@ -194,7 +220,7 @@ async def generate_video(request: VideoGenerationRequest) -> VideoGenerationResp
         )
         
         operation_id, operation_name = _extract_operation_info(operation)
-        logger.info(f"[Veo] Started: operation={operation_id}")
+        logger.info("[Veo] Started: operation=%s", operation_id)
         
         return VideoGenerationResponse(
             success=True,
@@ -204,7 +230,7 @@ async def generate_video(request: VideoGenerationRequest) -> VideoGenerationResp
         )
         
     except Exception as e:
-        logger.error(f"[Veo] Text-to-video error: {e}", exc_info=True)
+        logger.error("[Veo] Text-to-video error: %s", e, exc_info=True)
         return VideoGenerationResponse(success=False, error=str(e))
 
 
@@ -235,7 +261,7 @@ async def generate_image_to_video(request: ImageToVideoRequest) -> VideoGenerati
         # Model comes from frontend request (Pydantic default if not provided)
         model = request.model if request.model is not None else "veo-3.1-generate-preview"
         
-        logger.info(f"[Veo] Image-to-video: model={model}, resolution={resolution}, duration={duration}")
+        logger.info("[Veo] Image-to-video: model=%s, resolution=%s, duration=%s", model, resolution, duration)
         
         # Parse image
         image = await _parse_image_input(request.imageUrl)
@@ -258,7 +284,7 @@ async def generate_image_to_video(request: ImageToVideoRequest) -> VideoGenerati
         )
         
         operation_id, operation_name = _extract_operation_info(operation)
-        logger.info(f"[Veo] Image-to-video started: operation={operation_id}")
+        logger.info("[Veo] Image-to-video started: operation=%s", operation_id)
         
         return VideoGenerationResponse(
             success=True,
@@ -268,7 +294,7 @@ async def generate_image_to_video(request: ImageToVideoRequest) -> VideoGenerati
         )
         
     except Exception as e:
-        logger.error(f"[Veo] Image-to-video error: {e}", exc_info=True)
+        logger.error("[Veo] Image-to-video error: %s", e, exc_info=True)
         return VideoGenerationResponse(success=False, error=str(e))
 
 
@@ -295,7 +321,7 @@ async def generate_frame_specific(request: FrameSpecificRequest) -> VideoGenerat
                 error="Frame-specific generation requires Veo 3.1 model"
             )
         
-        logger.info(f"[Veo] Frame-specific (interpolation): model={model}")
+        logger.info("[Veo] Frame-specific (interpolation): model=%s", model)
         
         # Parse both frames
         first_image = await _parse_image_input(request.firstImageUrl)
@@ -321,7 +347,7 @@ async def generate_frame_specific(request: FrameSpecificRequest) -> VideoGenerat
         )
         
         operation_id, operation_name = _extract_operation_info(operation)
-        logger.info(f"[Veo] Frame-specific started: operation={operation_id}")
+        logger.info("[Veo] Frame-specific started: operation=%s", operation_id)
         
         return VideoGenerationResponse(
             success=True,
@@ -331,7 +357,7 @@ async def generate_frame_specific(request: FrameSpecificRequest) -> VideoGenerat
         )
         
     except Exception as e:
-        logger.error(f"[Veo] Frame-specific error: {e}", exc_info=True)
+        logger.error("[Veo] Frame-specific error: %s", e, exc_info=True)
         return VideoGenerationResponse(success=False, error=str(e))
 
 
@@ -364,7 +390,7 @@ async def generate_with_references(request: ReferenceImagesRequest) -> VideoGene
                 error="Maximum 3 reference images allowed"
             )
         
-        logger.info(f"[Veo] Reference images: model={model}, count={len(request.referenceImages)}")
+        logger.info("[Veo] Reference images: model=%s, count=%s", model, len(request.referenceImages))
         
         # Build reference image objects
         ref_images = []
@@ -395,7 +421,7 @@ async def generate_with_references(request: ReferenceImagesRequest) -> VideoGene
         )
         
         operation_id, operation_name = _extract_operation_info(operation)
-        logger.info(f"[Veo] Reference images started: operation={operation_id}")
+        logger.info("[Veo] Reference images started: operation=%s", operation_id)
         
         return VideoGenerationResponse(
             success=True,
@@ -405,7 +431,7 @@ async def generate_with_references(request: ReferenceImagesRequest) -> VideoGene
         )
         
     except Exception as e:
-        logger.error(f"[Veo] Reference images error: {e}", exc_info=True)
+        logger.error("[Veo] Reference images error: %s", e, exc_info=True)
         return VideoGenerationResponse(success=False, error=str(e))
 
 
@@ -438,7 +464,7 @@ async def extend_video(request: VideoExtendRequest) -> VideoGenerationResponse:
                 error="Video extension requires Veo 3.1 model"
             )
         
-        logger.info(f"[Veo] Extend video: veoVideoId={request.veoVideoId[:50]}...")
+        logger.info("[Veo] Extend video: veoVideoId=%.50s...", request.veoVideoId)
         
         # Config for extension - API requirement: 720p only for extensions
         # resolution comes from frontend request (defaults to 720p if not provided)
@@ -461,7 +487,7 @@ async def extend_video(request: VideoExtendRequest) -> VideoGenerationResponse:
         )
         
         operation_id, operation_name = _extract_operation_info(operation)
-        logger.info(f"[Veo] Extension started: operation={operation_id}")
+        logger.info("[Veo] Extension started: operation=%s", operation_id)
         
         return VideoGenerationResponse(
             success=True,
@@ -471,7 +497,7 @@ async def extend_video(request: VideoExtendRequest) -> VideoGenerationResponse:
         )
         
     except Exception as e:
-        logger.error(f"[Veo] Extend video error: {e}", exc_info=True)
+        logger.error("[Veo] Extend video error: %s", e, exc_info=True)
         return VideoGenerationResponse(success=False, error=str(e))
 
 
@@ -479,22 +505,90 @@ async def extend_video(request: VideoExtendRequest) -> VideoGenerationResponse:
 # Status Polling
 # ============================================================================
 
+# Shared status ticker: every watched operation is refreshed once per tick,
+# no matter how many clients are polling it. Clients read from _op_cache.
+_STATUS_TICK_SECONDS = 5.0
+_STATUS_IDLE_SECONDS = 60.0
+
+_active_ops: Dict[str, float] = {}  # operation name -> last time a client polled it
+_op_cache: Dict[str, Any] = {}  # operation name -> latest operation object
+_status_task: Optional[asyncio.Task] = None
+
+
+def _fetch_operation(name: str):
+    """Fetch latest operation state from Veo (blocking SDK call)"""
+    client = get_genai_client()
+    # Recreate operation object from the stored name (per official docs)
+    return client.operations.get(types.GenerateVideosOperation(name=name))
+
+
+def _fetch_operations(names: List[str]) -> Dict[str, Any]:
+    """Fetch a batch of operations in one worker thread, skipping failures"""
+    results = {}
+    for name in names:
+        try:
+            results[name] = _fetch_operation(name)
+        except Exception as e:
+            logger.warning("[Veo] Status refresh failed for %s: %s", name, e)
+    return results
+
+
+async def _status_tick() -> None:
+    """Refresh all watched operations until no client is polling any more"""
+    global _status_task
+    try:
+        while _active_ops:
+            await asyncio.sleep(_STATUS_TICK_SECONDS)
+            
+            # Forget operations nobody has asked about recently
+            now = time.monotonic()
+            for name, last_seen in list(_active_ops.items()):
+                if now - last_seen > _STATUS_IDLE_SECONDS:
+                    _active_ops.pop(name, None)
+                    _op_cache.pop(name, None)
+            
+            # Finished operations never change again - keep serving the cached result
+            names = [
+                name for name in _active_ops
+                if not getattr(_op_cache.get(name), "done", False)
+            ]
+            if names:
+                _op_cache.update(await asyncio.to_thread(_fetch_operations, names))
+    finally:
+        _status_task = None
+
+
+def _ensure_status_ticker() -> None:
+    """Start the shared status ticker if it is not already running"""
+    global _status_task
+    if _status_task is None:
+        _status_task = asyncio.create_task(_status_tick())
+
+
 async def get_video_status(request: VideoStatusRequest) -> VideoStatusResponse:
     """
     Get status of video generation operation
     Poll every 10 seconds until done=True
+    
+    Operation state is served from the shared ticker cache; only the first
+    poll for an operation goes to the API directly.
     """
     try:
-        client = get_genai_client()
+        operation_name = request.operationName
+        logger.info("[Veo] Status check: %s", operation_name)
         
-        logger.info(f"[Veo] Status check: {request.operationName}")
+        _active_ops[operation_name] = time.monotonic()
+        operation = _op_cache.get(operation_name)
         
-        # Recreate operation object from the stored name (per official docs)
-        # This allows polling from a separate request with just the operation name
-        operation_obj = types.GenerateVideosOperation(name=request.operationName)
+        if operation is None:
+            try:
+                operation = await asyncio.to_thread(_fetch_operation, operation_name)
+            except Exception:
+                _active_ops.pop(operation_name, None)
+                raise
+            _op_cache[operation_name] = operation
         
-        # Get latest operation status
-        operation = client.operations.get(operation_obj)
+        _ensure_status_ticker()
         
         if not operation.done:
             return VideoStatusResponse(
@@ -534,7 +628,7 @@ async def get_video_status(request: VideoStatusRequest) -> VideoStatusResponse:
         )
         
     except Exception as e:
-        logger.error(f"[Veo] Status error: {e}", exc_info=True)
+        logger.error("[Veo] Status error: %s", e, exc_info=True)
         return VideoStatusResponse(
             success=False,
             done=False,
@@ -558,42 +652,39 @@ async def download_video(request: VideoDownloadRequest) -> VideoDownloadResponse
     We download the video bytes and upload to Cloudinary for permanent storage.
     """
     try:
-        import httpx
-        import base64
-        
         veo_video_id = request.veoVideoId
-        logger.info(f"[Veo] Download: veoVideoId={veo_video_id[:80]}...")
+        logger.info("[Veo] Download: veoVideoId=%.80s...", veo_video_id)
         
         video_bytes = None
         
         # Check if veoVideoId is a URL (download directly)
         if veo_video_id.startswith("http://") or veo_video_id.startswith("https://"):
-            logger.info(f"[Veo] Downloading from URL directly...")
+            logger.info("[Veo] Downloading from URL directly...")
             # follow_redirects=True is essential - Google's API returns 302 to actual storage URL
             # timeout=360 for large videos that can take 4-5 minutes to download
-            async with httpx.AsyncClient(timeout=360.0, follow_redirects=True) as http_client:
-                # Add API key for authenticated download
-                headers = {}
-                api_key = settings.gemini_key
-                if api_key and "generativelanguage.googleapis.com" in veo_video_id:
-                    # Append API key to URL for Google's API
-                    if "?" in veo_video_id:
-                        download_url = f"{veo_video_id}&key={api_key}"
-                    else:
-                        download_url = f"{veo_video_id}?key={api_key}"
+            # Add API key for authenticated download
+            api_key = settings.gemini_key
+            if api_key and "generativelanguage.googleapis.com" in veo_video_id:
+                # Append API key to URL for Google's API
+                if "?" in veo_video_id:
+                    download_url = f"{veo_video_id}&key={api_key}"
                 else:
-                    download_url = veo_video_id
-                
-                response = await http_client.get(download_url)
-                if response.status_code == 200:
-                    video_bytes = response.content
-                    logger.info(f"[Veo] Downloaded {len(video_bytes)} bytes from URL")
-                else:
-                    logger.error(f"[Veo] Failed to download from URL: {response.status_code}")
-                    return VideoDownloadResponse(
-                        success=False,
-                        error=f"Failed to download video: HTTP {response.status_code}"
-                    )
+                    download_url = f"{veo_video_id}?key={api_key}"
+            else:
+                download_url = veo_video_id
+            
+            response = await _get_http_client().get(
+                download_url, timeout=360.0, follow_redirects=True
+            )
+            if response.status_code == 200:
+                video_bytes = response.content
+                logger.info("[Veo] Downloaded %s bytes from URL", len(video_bytes))
+            else:
+                logger.error("[Veo] Failed to download from URL: %s", response.status_code)
+                return VideoDownloadResponse(
+                    success=False,
+                    error=f"Failed to download video: HTTP {response.status_code}"
+                )
         else:
             # Try SDK download method for video name/ID
             try:
@@ -602,16 +693,15 @@ async def download_video(request: VideoDownloadRequest) -> VideoDownloadResponse
                 client.files.download(file=video_ref)
                 video_bytes = getattr(video_ref, "video_bytes", None) or getattr(video_ref, "_video_bytes", None)
             except Exception as sdk_err:
-                logger.warning(f"[Veo] SDK download failed: {sdk_err}, trying as URI...")
+                logger.warning("[Veo] SDK download failed: %s, trying as URI...", sdk_err)
                 # If SDK fails, try to construct download URL
                 if veo_video_id.startswith("files/"):
                     api_key = settings.gemini_key
                     download_url = f"https://generativelanguage.googleapis.com/v1beta/{veo_video_id}:download?alt=media&key={api_key}"
-                    async with httpx.AsyncClient(timeout=120.0) as http_client:
-                        response = await http_client.get(download_url)
-                        if response.status_code == 200:
-                            video_bytes = response.content
-                            logger.info(f"[Veo] Downloaded {len(video_bytes)} bytes via constructed URL")
+                    response = await _get_http_client().get(download_url)
+                    if response.status_code == 200:
+                        video_bytes = response.content
+                        logger.info("[Veo] Downloaded %s bytes via constructed URL", len(video_bytes))
         
         if not video_bytes:
             return VideoDownloadResponse(
@@ -620,11 +710,10 @@ async def download_video(request: VideoDownloadRequest) -> VideoDownloadResponse
             )
         
         # Upload to Cloudinary for permanent storage
-        logger.info(f"[Veo] Uploading {len(video_bytes)} bytes to Cloudinary...")
+        logger.info("[Veo] Uploading %s bytes to Cloudinary...", len(video_bytes))
         
         # Use Cloudinary service directly (sync method, wrap in thread)
         from src.services.cloudinary_service import CloudinaryService
-        import asyncio
         
         result = await asyncio.to_thread(
             CloudinaryService.upload_video_bytes,
@@ -635,12 +724,12 @@ async def download_video(request: VideoDownloadRequest) -> VideoDownloadResponse
         
         if result.get("success"):
             video_url = result.get("secure_url") or result.get("url")
-            logger.info(f"[Veo] Uploaded to Cloudinary: {video_url}")
+            logger.info("[Veo] Uploaded to Cloudinary: %s", video_url)
             return VideoDownloadResponse(success=True, url=video_url)
         
         # Fallback: return the original URL if Cloudinary upload fails
         if veo_video_id.startswith("http"):
-            logger.warning(f"[Veo] Cloudinary upload failed, returning original URL")
+            logger.warning("[Veo] Cloudinary upload failed, returning original URL")
             return VideoDownloadResponse(success=True, url=veo_video_id)
         
         return VideoDownloadResponse(
@@ -649,6 +738,6 @@ async def download_video(request: VideoDownloadRequest) -> VideoDownloadResponse
         )
         
     except Exception as e:
-        logger.error(f"[Veo] Download error: {e}", exc_info=True)
+        logger.error("[Veo] Download error: %s", e, exc_info=True)
         return VideoDownloadResponse(success=False, error=str(e))
 
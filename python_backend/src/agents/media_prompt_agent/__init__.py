@@ -3,12 +3,21 @@
 Expert agentic prompt improvement system using LangChain Skills Pattern.
 Uses progressive disclosure where specialized expertise is loaded on-demand.
 """
-from .service import improve_media_prompt
+from .service import (
+    improve_media_prompt,
+    improve_media_prompt_stream,
+    improve_media_prompts_batch,
+    validate_prompt_request,
+)
 from .schemas import (
     ImprovePromptRequest,
     ImprovePromptResponse,
+    ImprovePromptBatchRequest,
+    ImprovePromptBatchResult,
+    ImprovePromptBatchResponse,
     MediaType,
     MediaProvider,
+    MEDIA_TYPE_SET,
     MEDIA_TYPE_GUIDELINES
 )
 from .prompts import build_prompt_improvement_system_prompt
@@ -28,11 +37,18 @@ from .middleware import SkillMiddleware
 __all__ = [
     # Main service
     "improve_media_prompt",
+    "improve_media_prompt_stream",
+    "improve_media_prompts_batch",
+    "validate_prompt_request",
     # Schemas
     "ImprovePromptRequest",
     "ImprovePromptResponse",
+    "ImprovePromptBatchRequest",
+    "ImprovePromptBatchResult",
+    "ImprovePromptBatchResponse",
     "MediaType",
     "MediaProvider",
+    "MEDIA_TYPE_SET",
     "MEDIA_TYPE_GUIDELINES",
     # Legacy prompts
     "build_prompt_improvement_system_prompt",
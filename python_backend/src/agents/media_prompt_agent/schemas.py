@@ -2,16 +2,22 @@
 Media Prompt Improvement Schemas
 Pydantic models for AI generation prompt improvement
 """
-from typing import Optional, Literal
-from pydantic import BaseModel, Field
+from typing import List, Optional, Literal, get_args
+from pydantic import BaseModel, ConfigDict, Field
 
 
 MediaType = Literal["image-generation", "image-editing", "video-generation", "video-editing"]
 MediaProvider = Literal["openai", "google", "midjourney", "runway", "veo", "imagen", "stable-diffusion", "sora"]
 
+# Supported media types for O(1) membership checks
+MEDIA_TYPE_SET = frozenset(get_args(MediaType))
+
 
 class ImprovePromptRequest(BaseModel):
     """Request to improve AI generation prompt"""
+    # Frontend also sends extra keys (e.g. "context"), so they are ignored, not forbidden
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     originalPrompt: str = Field(..., description="Original prompt to improve")
     mediaType: MediaType = Field(..., description="Type of media being generated")
     mediaSubType: Optional[str] = Field(None, description="Specific subtype (e.g., 'portrait', 'landscape')")
@@ -23,10 +29,32 @@ class ImprovePromptRequest(BaseModel):
 
 class ImprovePromptResponse(BaseModel):
     """Response with improved prompt"""
+    model_config = ConfigDict(frozen=True)
+    
     success: bool = Field(..., description="Success status")
     improvedPrompt: str = Field(..., description="AI-improved generation prompt")
 
 
+class ImprovePromptBatchRequest(BaseModel):
+    """Request to improve several AI generation prompts at once"""
+    requests: List[ImprovePromptRequest] = Field(
+        ..., min_length=1, max_length=50, description="Prompt improvement requests"
+    )
+
+
+class ImprovePromptBatchResult(BaseModel):
+    """Outcome of a single prompt improvement within a batch"""
+    success: bool = Field(..., description="Success status")
+    improvedPrompt: Optional[str] = Field(None, description="AI-improved generation prompt")
+    error: Optional[str] = Field(None, description="Error message if this item failed")
+
+
+class ImprovePromptBatchResponse(BaseModel):
+    """Response with one result per batch request, in request order"""
+    success: bool = Field(..., description="True if every item succeeded")
+    results: List[ImprovePromptBatchResult] = Field(..., description="Per-request results")
+
+
 # Media type guidelines
 MEDIA_TYPE_GUIDELINES = {
     "image-generation": {
@@ -5,18 +5,104 @@ AI-powered prompt enhancement using LangChain Skills Pattern.
 Uses progressive disclosure where the agent loads specialized expertise
 on-demand via the load_skill tool.
 """
+import asyncio
+import hashlib
+import json
 import logging
+from functools import lru_cache
+from itertools import product
+from typing import AsyncIterator, List, Union, get_args
 
 from langchain.agents import create_agent
 from langchain_google_genai import ChatGoogleGenerativeAI
 
-from .schemas import ImprovePromptRequest, ImprovePromptResponse, MEDIA_TYPE_GUIDELINES
+from .schemas import (
+    ImprovePromptRequest,
+    ImprovePromptResponse,
+    MediaType,
+    MediaProvider,
+    MEDIA_TYPE_SET,
+)
 from .middleware import SkillMiddleware
 from .prompts import build_prompt_improvement_system_prompt
 from ...config import settings
+from ...utils.cache import TTLCache
+from ...utils.rate_limiter import AdaptiveRateLimiter
+from ...utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Longest original prompt accepted - rejects abusive payloads before any LLM work
+MAX_ORIGINAL_PROMPT_LENGTH = 8000
+
+# Improved prompts keyed by request fingerprint - regenerations of the same
+# request skip Gemini entirely
+_response_cache = TTLCache(maxsize=1024, ttl=3600)
+
+# In-flight improvements keyed by request fingerprint - concurrent identical
+# requests await the same Gemini call instead of each making their own
+_improvements = SingleFlight()
+
+# Bounds concurrent Gemini calls made by batch improvement
+_batch_semaphore = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY or 8)
+
+# Google AI provider profile (RPM + max concurrency) shared by every Gemini
+# call in this service; halves concurrency on 429s and recovers gradually
+_gemini_limiter = AdaptiveRateLimiter(
+    max_rate=settings.GEMINI_RPM,
+    time_period=60.0,
+    max_concurrency=settings.GEMINI_MAX_CONCURRENCY or 8,
+)
+
+# System prompts for every (mediaType, provider) pair, rendered once at import
+_SYSTEM_PROMPTS = {
+    (media_type, provider): build_prompt_improvement_system_prompt(
+        media_type=media_type,
+        provider=provider,
+    )
+    for media_type, provider in product(get_args(MediaType), (*get_args(MediaProvider), None))
+}
+
+
+@lru_cache(maxsize=1)
+def _get_model() -> ChatGoogleGenerativeAI:
+    """Get the shared Gemini model (created once per process)"""
+    return ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        google_api_key=settings.GOOGLE_API_KEY,
+        temperature=0.7,
+    )
+
+
+def _get_system_prompt(media_type: str, provider: str | None) -> str:
+    """Look up the precomputed system prompt, rendering it for unknown pairs"""
+    system_prompt = _SYSTEM_PROMPTS.get((media_type, provider))
+    if system_prompt is None:
+        system_prompt = build_prompt_improvement_system_prompt(
+            media_type=media_type,
+            provider=provider,
+        )
+    return system_prompt
+
+
+@lru_cache(maxsize=64)
+def _get_agent(system_prompt: str):
+    """
+    Get a compiled agent for a system prompt.
+    
+    System prompts derive from (mediaType, provider), a small finite set,
+    so compiled agents are reused across requests.
+    """
+    # SkillMiddleware:
+    # 1. Injects available skills into system prompt
+    # 2. Registers load_skill tool
+    return create_agent(
+        model=_get_model(),
+        tools=[],
+        system_prompt=system_prompt,
+        middleware=[SkillMiddleware()],
+    )
+
 
 async def improve_media_prompt(
     request: ImprovePromptRequest
@@ -34,87 +120,201 @@ async def improve_media_prompt(
         Improved prompt response
     """
     try:
-        # Validate media type
-        if request.mediaType not in MEDIA_TYPE_GUIDELINES:
-            raise ValueError(f"Unsupported media type: {request.mediaType}")
+        # Fail fast on bad input before any hashing, prompt building or LLM call
+        validate_prompt_request(request)
         
-        # Build system prompt using prompts.py function
-        # This includes skills-aware instructions
-        system_prompt = build_prompt_improvement_system_prompt(
-            media_type=request.mediaType,
-            provider=request.provider
-        )
+        cache_key = _request_fingerprint(request)
+        cached_prompt = _response_cache.get(cache_key)
+        if cached_prompt is not None:
+            logger.info(f"Prompt improvement cache hit for {request.provider}/{request.mediaType}")
+            return ImprovePromptResponse(success=True, improvedPrompt=cached_prompt)
         
-        # Create LLM
-        model = ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash",
-            google_api_key=settings.GOOGLE_API_KEY,
-            temperature=0.7,
+        # Join an identical in-flight request, or start the Gemini call
+        improved_prompt = await _improvements.do(
+            cache_key,
+            lambda: _generate_improved_prompt(request, cache_key),
         )
         
-        # Create agent with SkillMiddleware
-        # The middleware:
-        # 1. Injects available skills into system prompt
-        # 2. Registers load_skill tool
-        agent = create_agent(
-            model=model,
-            tools=[],
-            system_prompt=system_prompt,
-            middleware=[SkillMiddleware()],
+        return ImprovePromptResponse(
+            success=True,
+            improvedPrompt=improved_prompt,
         )
         
-        # Build user message
-        user_message = _build_user_message(request)
-        
-        # Invoke agent
+    except Exception as e:
+        logger.error(f"Prompt improvement error: {e}", exc_info=True)
+        raise
+
+
+async def _generate_improved_prompt(request: ImprovePromptRequest, cache_key: str) -> str:
+    """Run the agent for a request and cache the improved prompt"""
+    # Skills-aware system prompt (precomputed per mediaType/provider)
+    system_prompt = _get_system_prompt(request.mediaType, request.provider)
+    
+    # Reuse cached model + agent with SkillMiddleware
+    agent = _get_agent(system_prompt)
+    
+    # Build user message
+    user_message = _build_user_message(request)
+    
+    # Invoke agent within the Gemini rate/concurrency budget
+    async with _gemini_limiter.slot():
         result = await agent.ainvoke({
             "messages": [{"role": "user", "content": user_message}]
         })
+    
+    # Extract improved prompt - only the final AI message matters
+    messages = result.get("messages")
+    if not messages:
+        raise ValueError("No response from agent")
+    last_message = messages[-1]
+    
+    # create_agent returns message objects; plain dicts only from custom state
+    raw_content = (
+        last_message.content
+        if hasattr(last_message, "content")
+        else last_message.get("content", "")
+    )
+    
+    improved_prompt = _content_to_text(raw_content).strip()
+    
+    if not improved_prompt:
+        raise ValueError("Agent returned empty response")
+    
+    _response_cache.set(cache_key, improved_prompt)
+    
+    logger.info(
+        f"Prompt improved for {request.provider}/{request.mediaType} using skills pattern"
+    )
+    
+    return improved_prompt
+
+
+async def improve_media_prompt_stream(
+    request: ImprovePromptRequest
+) -> AsyncIterator[dict]:
+    """
+    Stream an improved prompt token-by-token.
+    
+    Uses the same cached agent as improve_media_prompt, but yields events
+    in the deep agents SSE format as Gemini generates:
+    - {"step": "streaming", "content": <accumulated text>}
+    - {"step": "done", "content": <final improved prompt>}
+    - {"step": "error", "content": <error message>}
+    
+    Args:
+        request: Prompt improvement request with provider, mediaType, etc.
+    """
+    try:
+        validate_prompt_request(request)
         
-        # Extract improved prompt
-        messages = result.get("messages", [])
-        last_message = messages[-1] if messages else None
-        
-        if not last_message:
-            raise ValueError("No response from agent")
-        
-        # Get content - may be string, list of blocks, or object with content attr
-        raw_content = (
-            last_message.get("content", "")
-            if isinstance(last_message, dict)
-            else last_message.content if hasattr(last_message, "content") else ""
-        )
+        cache_key = _request_fingerprint(request)
+        cached_prompt = _response_cache.get(cache_key)
+        if cached_prompt is not None:
+            yield {"step": "done", "content": cached_prompt}
+            return
         
-        # Extract text from content blocks if it's a list
-        if isinstance(raw_content, list):
-            # Content is a list of blocks like [{'type': 'text', 'text': '...'}]
-            text_parts = []
-            for block in raw_content:
-                if isinstance(block, dict) and block.get("type") == "text":
-                    text_parts.append(block.get("text", ""))
-                elif isinstance(block, str):
-                    text_parts.append(block)
-            improved_prompt = "\n".join(text_parts)
-        else:
-            improved_prompt = str(raw_content)
+        system_prompt = _get_system_prompt(request.mediaType, request.provider)
+        agent = _get_agent(system_prompt)
+        user_message = _build_user_message(request)
         
-        improved_prompt = improved_prompt.strip()
+        accumulated_content = ""
+        async with _gemini_limiter.slot():
+            async for event in agent.astream_events(
+                {"messages": [{"role": "user", "content": user_message}]},
+                version="v2",
+            ):
+                kind = event["event"]
+                
+                if kind == "on_tool_start":
+                    # Anything said before loading a skill is preamble, not the prompt
+                    accumulated_content = ""
+                
+                elif kind == "on_chat_model_stream":
+                    text = _content_to_text(event["data"]["chunk"].content, separator="")
+                    if text:
+                        accumulated_content += text
+                        yield {"step": "streaming", "content": accumulated_content}
         
+        improved_prompt = accumulated_content.strip()
         if not improved_prompt:
             raise ValueError("Agent returned empty response")
         
+        _response_cache.set(cache_key, improved_prompt)
+        
         logger.info(
-            f"Prompt improved for {request.provider}/{request.mediaType} using skills pattern"
+            f"Prompt streamed for {request.provider}/{request.mediaType} using skills pattern"
         )
         
-        return ImprovePromptResponse(
-            success=True,
-            improvedPrompt=improved_prompt,
-        )
+        yield {"step": "done", "content": improved_prompt}
         
     except Exception as e:
-        logger.error(f"Prompt improvement error: {e}", exc_info=True)
-        raise
+        logger.error(f"Prompt improvement stream error: {e}", exc_info=True)
+        yield {"step": "error", "content": str(e)}
+
+
+async def improve_media_prompts_batch(
+    requests: List[ImprovePromptRequest]
+) -> List[Union[ImprovePromptResponse, BaseException]]:
+    """
+    Improve several prompts concurrently.
+    
+    All items share the cached model/agent, so only Gemini I/O overlaps.
+    Concurrency is bounded by settings.GEMINI_MAX_CONCURRENCY.
+    
+    Args:
+        requests: Prompt improvement requests
+        
+    Returns:
+        One entry per request, in order - the response, or the exception it raised
+    """
+    async def _improve_one(request: ImprovePromptRequest) -> ImprovePromptResponse:
+        async with _batch_semaphore:
+            return await improve_media_prompt(request)
+    
+    return await asyncio.gather(
+        *(_improve_one(request) for request in requests),
+        return_exceptions=True,
+    )
+
+
+def validate_prompt_request(request: ImprovePromptRequest) -> None:
+    """Reject requests that can never produce a useful improved prompt"""
+    if request.mediaType not in MEDIA_TYPE_SET:
+        raise ValueError(f"Unsupported media type: {request.mediaType}")
+    
+    if not request.originalPrompt.strip():
+        raise ValueError("originalPrompt is empty")
+    
+    if len(request.originalPrompt) > MAX_ORIGINAL_PROMPT_LENGTH:
+        raise ValueError(
+            f"originalPrompt exceeds {MAX_ORIGINAL_PROMPT_LENGTH} characters"
+        )
+
+
+def _content_to_text(raw_content, separator: str = "\n") -> str:
+    """Extract text from message content (string or list of content blocks)"""
+    # Fast path - plain string content
+    if isinstance(raw_content, str):
+        return raw_content
+    
+    if isinstance(raw_content, list):
+        # Content is a list of blocks like [{'type': 'text', 'text': '...'}]
+        text_parts = []
+        for block in raw_content:
+            if isinstance(block, dict) and block.get("type") == "text":
+                text_parts.append(block.get("text", ""))
+            elif isinstance(block, str):
+                text_parts.append(block)
+        return separator.join(text_parts)
+    
+    # Unknown content shape - treat as empty rather than stringifying it
+    return ""
+
+
+def _request_fingerprint(request: ImprovePromptRequest) -> str:
+    """Stable hash of all request fields, used as the response cache key"""
+    payload = json.dumps(request.model_dump(), sort_keys=True)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def _build_user_message(request: ImprovePromptRequest) -> str:
@@ -132,22 +332,24 @@ def _build_user_message(request: ImprovePromptRequest) -> str:
     provider_lower = (request.provider or "").lower()
     suggested_skill = provider_skill_map.get(provider_lower, "google_imagen")
     
-    message = f"""Improve this prompt for {request.provider} ({request.mediaType}):
-
-Original Prompt: "{request.originalPrompt}"
-
-Target Provider Skill: {suggested_skill}
-"""
+    parts = [
+        f"Improve this prompt for {request.provider} ({request.mediaType}):",
+        "",
+        f'Original Prompt: "{request.originalPrompt}"',
+        "",
+        f"Target Provider Skill: {suggested_skill}",
+    ]
     
     if request.mediaSubType:
-        message += f"Media Subtype: {request.mediaSubType}\n"
+        parts.append(f"Media Subtype: {request.mediaSubType}")
     
     if request.model:
-        message += f"Target Model: {request.model}\n"
+        parts.append(f"Target Model: {request.model}")
     
     if request.userInstructions:
-        message += f"User Instructions: {request.userInstructions}\n"
+        parts.append(f"User Instructions: {request.userInstructions}")
     
-    message += "\nLoad the appropriate skill and provide the optimized prompt."
+    parts.append("")
+    parts.append("Load the appropriate skill and provide the optimized prompt.")
     
-    return message
+    return "\n".join(parts)
@@ -1,70 +1,17 @@
-"""API package"""
-from .v1 import (
-    content_router,
-    content_improvement_router,
-    improve_media_prompts_router,
-    media_generating_router,
-    comments_router,
-    auth_router,
-    media_studio_router,
-    storage_router,
-    webhooks_router,
-    canva_router,
-    workspace_router,
-    posts_router,
-    credentials_router,
-    cloudinary_router,
-    token_refresh_router,
-    cron_router,
-    meta_ads_router,
-    facebook_router,
-    instagram_router,
-    linkedin_router,
-    twitter_router,
-    tiktok_router,
-    youtube_router,
-    rate_limits_router,
-    businesses_router,
-    ab_tests_router,
-    voice_live_router,
-    calendar_router
-)
-
-__all__ = [
-    "content_router",
-    "content_improvement_router",
-    "improve_media_prompts_router",
-    "media_generating_router",
-    "comments_router",
-    "auth_router",
-    "media_studio_router",
-    "storage_router",
-    "webhooks_router",
-    "canva_router",
-    "workspace_router",
-    "posts_router",
-    "credentials_router",
-    "cloudinary_router",
-    "token_refresh_router",
-    "cron_router",
-    "meta_ads_router",
-    "facebook_router",
-    "instagram_router",
-    "linkedin_router",
-    "twitter_router",
-    "tiktok_router",
-    "youtube_router",
-    "rate_limits_router",
-    "businesses_router",
-    "ab_tests_router",
-    "voice_live_router",
-    "calendar_router"
-]
-
-
-
+"""API package
 
+Router exports are defined once in api.v1 and resolved lazily from there.
+"""
+from . import v1
+from .v1 import __all__
 
 
+def __getattr__(name: str):
+    """Delegate router lookups to api.v1 (imports the router on first access)"""
+    if name in __all__:
+        return getattr(v1, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,61 +1,56 @@
-"""API v1 routes"""
-from .content import router as content_router
-from .content_improvement import router as content_improvement_router
-from .improve_media_prompts import router as improve_media_prompts_router
-from .media_generating import router as media_generating_router
-from .comments import router as comments_router
-from .auth import router as auth_router
-from .media_studio import router as media_studio_router
-from .storage import router as storage_router
-from .webhooks import router as webhooks_router
-from .canva import router as canva_router
-from .workspace import router as workspace_router
-from .posts import router as posts_router
-from .credentials import router as credentials_router
-from .cloudinary import router as cloudinary_router
-from .token_refresh import router as token_refresh_router
-from .cron import router as cron_router
-from .meta_ads import router as meta_ads_router
-from .rate_limits import router as rate_limits_router
-from .businesses import router as businesses_router
-from .ab_tests import router as ab_tests_router
-from .social import facebook_router, instagram_router, linkedin_router, twitter_router, tiktok_router, youtube_router
-from .voice_live import router as voice_live_router
-from .calendar import router as calendar_router
+"""API v1 routes
 
-__all__ = [
-    "content_router",
-    "content_improvement_router",
-    "improve_media_prompts_router",
-    "media_generating_router",
-    "comments_router",
-    "auth_router",
-    "media_studio_router",
-    "storage_router",
-    "webhooks_router",
-    "canva_router",
-    "workspace_router",
-    "posts_router",
-    "credentials_router",
-    "cloudinary_router",
-    "token_refresh_router",
-    "cron_router",
-    "meta_ads_router",
-    "facebook_router",
-    "instagram_router",
-    "linkedin_router",
-    "twitter_router",
-    "tiktok_router",
-    "youtube_router",
-    "rate_limits_router",
-    "businesses_router",
-    "ab_tests_router",
-    "voice_live_router",
-    "calendar_router"
-]
+Routers are resolved lazily (PEP 562), so importing one route module does not
+pull in every other router and its SDK dependencies.
+"""
+import importlib
 
+# Exported name -> (submodule, attribute)
+_ROUTERS = {
+    "content_router": ("content", "router"),
+    "content_improvement_router": ("content_improvement", "router"),
+    "improve_media_prompts_router": ("improve_media_prompts", "router"),
+    "media_generating_router": ("media_generating", "router"),
+    "comments_router": ("comments", "router"),
+    "auth_router": ("auth", "router"),
+    "media_studio_router": ("media_studio", "router"),
+    "storage_router": ("storage", "router"),
+    "webhooks_router": ("webhooks", "router"),
+    "canva_router": ("canva", "router"),
+    "workspace_router": ("workspace", "router"),
+    "posts_router": ("posts", "router"),
+    "credentials_router": ("credentials", "router"),
+    "cloudinary_router": ("cloudinary", "router"),
+    "token_refresh_router": ("token_refresh", "router"),
+    "cron_router": ("cron", "router"),
+    "meta_ads_router": ("meta_ads", "router"),
+    "facebook_router": ("social", "facebook_router"),
+    "instagram_router": ("social", "instagram_router"),
+    "linkedin_router": ("social", "linkedin_router"),
+    "twitter_router": ("social", "twitter_router"),
+    "tiktok_router": ("social", "tiktok_router"),
+    "youtube_router": ("social", "youtube_router"),
+    "rate_limits_router": ("rate_limits", "router"),
+    "businesses_router": ("businesses", "router"),
+    "ab_tests_router": ("ab_tests", "router"),
+    "voice_live_router": ("voice_live", "router"),
+    "calendar_router": ("calendar", "router"),
+}
 
+__all__ = list(_ROUTERS)
 
 
+def __getattr__(name: str):
+    """Import a router's module on first access and cache the router"""
+    try:
+        module_name, attr = _ROUTERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    router = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = router
+    return router
 
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
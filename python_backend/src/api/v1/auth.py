@@ -3,6 +3,8 @@ Auth API Routes
 Production-ready OAuth2 endpoints for social platform authentication
 Supports: Facebook, Instagram, LinkedIn, Twitter, TikTok, YouTube
 """
+import hashlib
+import hmac
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Literal
@@ -22,6 +24,7 @@ from ...services import (
     verify_jwt
 )
 from ...config import settings
+from .credentials import invalidate_connection_status
 
 logger = logging.getLogger(__name__)
 
@@ -343,6 +346,7 @@ async def _save_social_account(
         data=data,
         on_conflict="workspace_id,platform,account_id"
     )
+    invalidate_connection_status(workspace_id)
 
 
 async def _handle_facebook_callback(code: str, workspace_id: str, callback_url: str):
@@ -389,9 +393,6 @@ async def _handle_facebook_callback(code: str, workspace_id: str, callback_url:
         business_name = None
         
         try:
-            import hmac
-            import hashlib
-            
             GRAPH_API_VERSION = "v24.0"
             GRAPH_BASE_URL = f"https://graph.facebook.com/{GRAPH_API_VERSION}"
             
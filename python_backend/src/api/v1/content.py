@@ -5,22 +5,47 @@ It uses the deep_agents implementation for the LangGraph-powered agent.
 """
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
-import uuid
-import json
+import secrets
+
+import orjson
+
+from ...agents.deep_agents.router import stream_agent_response, get_thread_history
 
 router = APIRouter(prefix="/api/v1/content", tags=["Content Strategist"])
 
 
-# SSE helper - same as deep_agents router
-def format_sse(data: dict) -> str:
+# SSE envelope, pre-encoded so events go out as bytes without a str->bytes pass
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_ERROR_PREFIX = b'data: {"step":"error","content":'
+# SSE comment frame - ignored by clients, flushes headers + first byte immediately
+_SSE_OPEN = b": stream-open\n\n"
+
+# "identity" encoding makes compression middleware pass SSE through unbuffered
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+    "Content-Encoding": "identity",
+}
+
+
+def format_sse(data: dict) -> bytes:
     """Format data as SSE event."""
-    return f"data: {json.dumps(data)}\n\n"
+    return _SSE_PREFIX + orjson.dumps(data) + _SSE_SUFFIX
+
+
+def format_sse_error(message: str) -> bytes:
+    """Format an error message as SSE event."""
+    return _SSE_ERROR_PREFIX + orjson.dumps(message) + b"}" + _SSE_SUFFIX
 
 
 class ContentBlock(BaseModel):
     """Multimodal content block."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     type: str
     text: Optional[str] = None
     data: Optional[str] = None
@@ -29,6 +54,9 @@ class ContentBlock(BaseModel):
 
 class StrategistChatRequest(BaseModel):
     """Chat request for content strategist."""
+    # Frontend also sends extra keys (e.g. "modelId"), so they are ignored, not forbidden
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     message: str
     threadId: Optional[str] = None
     workspaceId: Optional[str] = None
@@ -42,27 +70,24 @@ async def chat_strategist(request: StrategistChatRequest):
     Chat endpoint for the Content Strategist.
     Forwards to the deep_agents implementation.
     """
-    from ...agents.deep_agents.router import stream_agent_response
-    
     message = request.message
-    thread_id = request.threadId or str(uuid.uuid4())
+    # Thread IDs are stored as plain text, so a random hex token is enough
+    thread_id = request.threadId or secrets.token_hex(16)
     
     async def generate():
         """Wrapper that formats events as SSE."""
+        # Don't hold the first byte until the agent produces its first event
+        yield _SSE_OPEN
         try:
             async for event in stream_agent_response(message, thread_id, request.contentBlocks):
                 yield format_sse(event)
         except Exception as e:
-            yield format_sse({"step": "error", "content": str(e)})
+            yield format_sse_error(str(e))
     
     return StreamingResponse(
         generate(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        }
+        headers=_SSE_HEADERS,
     )
 
 
@@ -72,7 +97,6 @@ async def get_history(threadId: str):
     Get history for a specific thread.
     Forwards to the deep_agents implementation.
     """
-    from ...agents.deep_agents.router import get_thread_history
     return await get_thread_history(threadId)
 
 
@@ -5,48 +5,186 @@ Platform connection status and disconnect functionality
 Uses Meta Business SDK for Meta platform (Facebook, Instagram, Meta Ads)
 """
 
+import asyncio
 import logging
-from typing import Literal, Dict, Any
+from typing import Literal, Dict, Any, get_args
 from datetime import datetime, timezone, timedelta
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 
 from src.services.supabase_service import get_supabase_client, get_supabase_admin_client
 from src.services.meta_ads.meta_credentials_service import MetaCredentialsService
 from src.middleware.auth import get_current_user
+from src.utils.cache import TTLCache
+from src.utils.singleflight import SingleFlight
 
 
-router = APIRouter(prefix="/api/v1/credentials", tags=["Credentials"])
+router = APIRouter(
+    prefix="/api/v1/credentials",
+    tags=["Credentials"],
+    # orjson serializes these small, frequently polled payloads much faster than stdlib json
+    default_response_class=ORJSONResponse,
+)
 logger = logging.getLogger(__name__)
 
 
 # ================== CONSTANTS ==================
 
-VALID_PLATFORMS = ["twitter", "linkedin", "facebook", "instagram", "tiktok", "youtube", "meta_ads"]
-META_PLATFORMS = ["facebook", "instagram", "meta_ads"]
-
+# Single source of truth - VALID_PLATFORMS and the validation sets derive from it
 Platform = Literal["twitter", "linkedin", "facebook", "instagram", "tiktok", "youtube", "meta_ads"]
 
+VALID_PLATFORMS = get_args(Platform)
+META_PLATFORMS = ("facebook", "instagram", "meta_ads")
+_VALID_SET = frozenset(VALID_PLATFORMS)
+_META_SET = frozenset(META_PLATFORMS)
+
+# Shared entry for every disconnected platform in /status payloads - never mutated
+_DISCONNECTED_STATUS = {"isConnected": False}
+
+# Bound once for check_token_status, which runs per platform on every /status build
+_UTC = timezone.utc
+_EXPIRY_WARNING = timedelta(days=7)
+_fromisoformat = datetime.fromisoformat
+
+# Connection status per workspace - dashboards poll /status, which only changes
+# on connect/disconnect/refresh, so a short TTL absorbs the polling
+STATUS_CACHE_TTL_SECONDS = 15
+_status_cache = TTLCache(maxsize=4096, ttl=STATUS_CACHE_TTL_SECONDS)
+
+# In-flight status builds per workspace - concurrent /status requests for the
+# same workspace await one Supabase query instead of each issuing their own
+_status_flight = SingleFlight()
+
 
 # ================== HELPERS ==================
 
-def check_token_status(expires_at_str):
+def check_token_status(expires_at_str, now=None):
     """Check if token is expired or expiring soon"""
     if not expires_at_str:
         return False, False
+    if isinstance(expires_at_str, str):
+        # Python 3.11+ fromisoformat parses the trailing "Z" natively
+        try:
+            expires_at = _fromisoformat(expires_at_str)
+        except ValueError:
+            return False, False
+    else:
+        expires_at = expires_at_str
+    if now is None:
+        now = datetime.now(_UTC)
+    is_expired = now > expires_at
+    is_expiring_soon = not is_expired and (expires_at - now) < _EXPIRY_WARNING
+    return is_expired, is_expiring_soon
+
+
+def invalidate_connection_status(workspace_id: str) -> None:
+    """Drop the cached /status payload after a workspace's connections change"""
+    _status_cache.pop(workspace_id, None)
+    MetaCredentialsService.invalidate_workspace_cache(workspace_id)
+    # A build already running may have read the old rows - let the next request start fresh
+    _status_flight.forget(workspace_id)
+
+
+def _log_disconnect(workspace_id: str, user_id: str, platform: str) -> None:
+    """Record a disconnect in activity_logs (best-effort, runs as a background task)"""
     try:
-        if isinstance(expires_at_str, str):
-            if expires_at_str.endswith("Z"):
-                expires_at_str = expires_at_str.replace("Z", "+00:00")
-            expires_at = datetime.fromisoformat(expires_at_str)
+        supabase = get_supabase_client()
+        supabase.table("activity_logs").insert({
+            "workspace_id": workspace_id,
+            "user_id": user_id,
+            "action": "disconnect",
+            "resource_type": "credential",
+            # resource_id is a uuid column, so the platform name goes in details
+            "details": {"platform": platform}
+            # created_at is left to the column's DEFAULT now()
+        }).execute()
+    except Exception as e:
+        logger.warning(f"Failed to log disconnect of {platform}: {e}")
+
+
+async def _build_connection_status(workspace_id: str) -> Dict[str, Any]:
+    """Build the /status payload for a workspace (served from cache when fresh)"""
+    cached_status = _status_cache.get(workspace_id)
+    if cached_status is not None:
+        return cached_status
+    
+    # Join an in-flight build for this workspace, or start one
+    return await _status_flight.do(
+        workspace_id,
+        lambda: _fetch_connection_status(workspace_id),
+    )
+
+
+async def _fetch_connection_status(workspace_id: str) -> Dict[str, Any]:
+    """Query Supabase and build the /status payload, caching the result"""
+    # Use admin client to bypass RLS - we already verified user has access via JWT
+    supabase = get_supabase_admin_client()
+    
+    # Get all credentials for the workspace - only the columns the status map uses
+    # (social_accounts has no ig_user_id column, so igUserId stays None here)
+    # supabase-py is synchronous - run the round-trip off the event loop
+    result = await asyncio.to_thread(
+        supabase.table("social_accounts").select(
+            "platform, is_connected, account_id, account_name, page_id, page_name, "
+            "username, created_at, expires_at"
+        ).eq("workspace_id", workspace_id).execute
+    )
+    
+    # Build status map
+    status = {}
+    connected_credentials = result.data or []
+    now = datetime.now(_UTC)
+    
+    # Index credentials by platform once (first row per platform wins)
+    cred_by_platform = {}
+    for c in connected_credentials:
+        cred_by_platform.setdefault(c.get("platform"), c)
+    
+    for platform in VALID_PLATFORMS:
+        cred = cred_by_platform.get(platform)
+        
+        if cred and cred.get("is_connected"):
+            is_expired, is_expiring_soon = check_token_status(cred.get("expires_at"), now)
+            status[platform] = {
+                "isConnected": not is_expired,
+                "accountId": cred.get("account_id"),
+                "accountName": cred.get("account_name"),
+                "pageId": cred.get("page_id"),
+                "pageName": cred.get("page_name"),
+                "igUserId": cred.get("ig_user_id"),
+                "username": cred.get("username"),
+                "connectedAt": cred.get("created_at"),
+                "expiresAt": cred.get("expires_at"),
+                "isExpired": is_expired,
+                "isExpiringSoon": is_expiring_soon
+            }
         else:
-            expires_at = expires_at_str
-        now = datetime.now(timezone.utc)
-        is_expired = now > expires_at
-        is_expiring_soon = not is_expired and (expires_at - now) < timedelta(days=7)
-        return is_expired, is_expiring_soon
-    except:
-        return False, False
+            status[platform] = _DISCONNECTED_STATUS
+    
+    # For Facebook, also check ads capability if connected
+    if status.get("facebook", {}).get("isConnected"):
+        try:
+            logger.info(f"Checking ads capability for workspace {workspace_id}")
+            ads_capability = await MetaCredentialsService.check_ads_capability(workspace_id)
+            
+            status["facebook"]["canRunAds"] = ads_capability.get("has_ads_access", False)
+            status["facebook"]["adAccountId"] = ads_capability.get("ad_account_id")
+            status["facebook"]["adAccountName"] = ads_capability.get("ad_account_name")
+            
+            if not ads_capability.get("has_ads_access"):
+                status["facebook"]["missingForAds"] = ads_capability.get("missing_permissions", [])
+            
+            logger.info(f"Ads capability: {ads_capability}")
+        except Exception as ads_error:
+            logger.error(f"Error checking ads capability: {ads_error}")
+            status["facebook"]["canRunAds"] = False
+            status["facebook"]["missingForAds"] = ["Error checking ads capability"]
+    
+    # Skip caching if the workspace was invalidated while this build ran
+    if _status_flight.owns(workspace_id):
+        _status_cache.set(workspace_id, status)
+    return status
 
 
 # ================== ENDPOINTS ==================
@@ -67,64 +205,7 @@ async def get_connection_status(
         if not workspace_id:
             raise HTTPException(status_code=404, detail="Workspace not found")
         
-        # Use admin client to bypass RLS - we already verified user has access via JWT
-        supabase = get_supabase_admin_client()
-        
-        # Get all credentials for the workspace
-        result = supabase.table("social_accounts").select(
-            "*"
-        ).eq("workspace_id", workspace_id).execute()
-        
-        # Build status map
-        status = {}
-        connected_credentials = result.data or []
-        
-        for platform in VALID_PLATFORMS:
-            cred = next(
-                (c for c in connected_credentials if c.get("platform") == platform),
-                None
-            )
-            
-            if cred and cred.get("is_connected"):
-                is_expired, is_expiring_soon = check_token_status(cred.get("expires_at"))
-                status[platform] = {
-                    "isConnected": not is_expired,
-                    "accountId": cred.get("account_id"),
-                    "accountName": cred.get("account_name"),
-                    "pageId": cred.get("page_id"),
-                    "pageName": cred.get("page_name"),
-                    "igUserId": cred.get("ig_user_id"),
-                    "username": cred.get("username"),
-                    "connectedAt": cred.get("created_at"),
-                    "expiresAt": cred.get("expires_at"),
-                    "isExpired": is_expired,
-                    "isExpiringSoon": is_expiring_soon
-                }
-            else:
-                status[platform] = {
-                    "isConnected": False
-                }
-        
-        # For Facebook, also check ads capability if connected
-        if status.get("facebook", {}).get("isConnected"):
-            try:
-                logger.info(f"Checking ads capability for workspace {workspace_id}")
-                ads_capability = await MetaCredentialsService.check_ads_capability(workspace_id)
-                
-                status["facebook"]["canRunAds"] = ads_capability.get("has_ads_access", False)
-                status["facebook"]["adAccountId"] = ads_capability.get("ad_account_id")
-                status["facebook"]["adAccountName"] = ads_capability.get("ad_account_name")
-                
-                if not ads_capability.get("has_ads_access"):
-                    status["facebook"]["missingForAds"] = ads_capability.get("missing_permissions", [])
-                
-                logger.info(f"Ads capability: {ads_capability}")
-            except Exception as ads_error:
-                logger.error(f"Error checking ads capability: {ads_error}")
-                status["facebook"]["canRunAds"] = False
-                status["facebook"]["missingForAds"] = ["Error checking ads capability"]
-        
-        return status
+        return await _build_connection_status(workspace_id)
         
     except HTTPException:
         raise
@@ -133,53 +214,6 @@ async def get_connection_status(
         raise HTTPException(status_code=500, detail="Failed to check status")
 
 
-@router.delete("/{platform}/disconnect")
-async def disconnect_platform(
-    platform: Platform,
-    user: Dict[str, Any] = Depends(get_current_user)
-):
-    """
-    DELETE /api/v1/credentials/{platform}/disconnect
-    Disconnect a social platform by setting is_connected to False.
-    """
-    try:
-        workspace_id = user.get("workspaceId")
-        user_role = user.get("role")
-        
-        if not workspace_id:
-            raise HTTPException(status_code=404, detail="Workspace not found")
-        
-        # Only admins can disconnect
-        if user_role != "admin":
-            raise HTTPException(status_code=403, detail="Admin role required")
-        
-        if platform not in VALID_PLATFORMS:
-            raise HTTPException(status_code=400, detail=f"Invalid platform: {platform}")
-        
-        supabase = get_supabase_admin_client()
-        
-        # Update is_connected to False for this platform
-        result = supabase.table("social_accounts").update({
-            "is_connected": False
-        }).eq("workspace_id", workspace_id).eq("platform", platform).execute()
-        
-        if not result.data:
-            raise HTTPException(status_code=404, detail=f"No connection found for {platform}")
-        
-        logger.info(f"Disconnected {platform} for workspace {workspace_id}")
-        
-        return {
-            "success": True,
-            "message": f"{platform.capitalize()} disconnected successfully"
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error disconnecting {platform}: {e}")
-        raise HTTPException(status_code=500, detail="Failed to disconnect platform")
-
-
 @router.get("/meta/status")
 async def get_meta_connection_status(
     user: Dict[str, Any] = Depends(get_current_user)
@@ -221,11 +255,11 @@ async def get_meta_capabilities(
         if not workspace_id:
             raise HTTPException(status_code=404, detail="Workspace not found")
         
-        # Check ads capability
-        ads_cap = await MetaCredentialsService.check_ads_capability(workspace_id)
-        
-        # Check Instagram capability
-        ig_cap = await MetaCredentialsService.check_instagram_capability(workspace_id)
+        # Check ads and Instagram capability concurrently - independent Meta API calls
+        ads_cap, ig_cap = await asyncio.gather(
+            MetaCredentialsService.check_ads_capability(workspace_id),
+            MetaCredentialsService.check_instagram_capability(workspace_id),
+        )
         
         return {
             "ads": ads_cap,
@@ -239,6 +273,45 @@ async def get_meta_capabilities(
         raise HTTPException(status_code=500, detail="Failed to check capabilities")
 
 
+@router.get("/overview")
+async def get_credentials_overview(
+    user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    GET /api/v1/credentials/overview
+    Get /status, /meta/status and /meta/capabilities in one response.
+    
+    Lets the dashboard make one authenticated request on load instead of three.
+    """
+    try:
+        workspace_id = user.get("workspaceId")
+        
+        if not workspace_id:
+            raise HTTPException(status_code=404, detail="Workspace not found")
+        
+        status, meta_status, ads_cap, ig_cap = await asyncio.gather(
+            _build_connection_status(workspace_id),
+            MetaCredentialsService.get_connection_status(workspace_id),
+            MetaCredentialsService.check_ads_capability(workspace_id),
+            MetaCredentialsService.check_instagram_capability(workspace_id),
+        )
+        
+        return {
+            "status": status,
+            "meta": meta_status,
+            "capabilities": {
+                "ads": ads_cap,
+                "instagram": ig_cap
+            }
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting credentials overview: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get credentials overview")
+
+
 @router.get("/meta/businesses")
 async def get_available_businesses(
     user: Dict[str, Any] = Depends(get_current_user)
@@ -302,6 +375,7 @@ async def switch_business(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
+        invalidate_connection_status(workspace_id)
         return result
         
     except HTTPException:
@@ -392,6 +466,7 @@ async def refresh_meta_token(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
+        invalidate_connection_status(workspace_id)
         return {
             "success": True,
             "message": "Token refreshed successfully",
@@ -409,6 +484,7 @@ async def refresh_meta_token(
 @router.delete("/{platform}/disconnect")
 async def disconnect_platform(
     platform: str,
+    background_tasks: BackgroundTasks,
     user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
@@ -419,7 +495,7 @@ async def disconnect_platform(
     """
     try:
         # Validate platform
-        if platform not in VALID_PLATFORMS:
+        if platform not in _VALID_SET:
             raise HTTPException(status_code=400, detail="Invalid platform")
         
         workspace_id = user.get("workspaceId")
@@ -437,33 +513,28 @@ async def disconnect_platform(
             )
         
         # Use SDK-based service for Meta platforms
-        if platform in META_PLATFORMS:
+        if platform in _META_SET:
             result = await MetaCredentialsService.disconnect_platform(
                 workspace_id, platform
             )
             if not result.get("success"):
                 raise HTTPException(status_code=500, detail=result.get("error"))
+            
+            # Log activity off the response path
+            background_tasks.add_task(_log_disconnect, workspace_id, user_id, platform)
         else:
-            # Standard disconnect for non-Meta platforms
-            supabase = get_supabase_client()
-            supabase.table("social_accounts").delete().eq(
-                "workspace_id", workspace_id
-            ).eq("platform", platform).execute()
+            # Standard disconnect for non-Meta platforms - delete + activity log
+            # in one transaction (see disconnect_platform_and_log migration)
+            supabase = get_supabase_admin_client()
+            await asyncio.to_thread(
+                supabase.rpc("disconnect_platform_and_log", {
+                    "p_workspace": workspace_id,
+                    "p_user": user_id,
+                    "p_platform": platform,
+                }).execute
+            )
         
-        # Log activity
-        try:
-            supabase = get_supabase_client()
-            supabase.table("activity_logs").insert({
-                "workspace_id": workspace_id,
-                "user_id": user_id,
-                "action": "disconnect",
-                "resource_type": "credential",
-                "resource_id": platform,
-                "details": {"platform": platform},
-                "created_at": datetime.now().isoformat()
-            }).execute()
-        except Exception:
-            pass  # Activity logging is best-effort
+        invalidate_connection_status(workspace_id)
         
         return {
             "success": True,
@@ -488,7 +559,7 @@ async def get_platform_credential(
     """
     try:
         # Validate platform
-        if platform not in VALID_PLATFORMS:
+        if platform not in _VALID_SET:
             raise HTTPException(status_code=400, detail="Invalid platform")
         
         workspace_id = user.get("workspaceId")
@@ -497,7 +568,7 @@ async def get_platform_credential(
             raise HTTPException(status_code=404, detail="Workspace not found")
         
         # Use SDK-based service for Meta platforms
-        if platform in META_PLATFORMS:
+        if platform in _META_SET:
             if platform == "meta_ads":
                 creds = await MetaCredentialsService.get_ads_credentials(workspace_id)
             elif platform == "instagram":
@@ -525,9 +596,11 @@ async def get_platform_credential(
         # Standard fetch for non-Meta platforms
         supabase = get_supabase_client()
         
-        result = supabase.table("social_accounts").select(
-            "platform, account_id, account_name, created_at, expires_at"
-        ).eq("workspace_id", workspace_id).eq("platform", platform).single().execute()
+        result = await asyncio.to_thread(
+            supabase.table("social_accounts").select(
+                "platform, account_id, account_name, created_at, expires_at"
+            ).eq("workspace_id", workspace_id).eq("platform", platform).single().execute
+        )
         
         if not result.data:
             return {
@@ -558,41 +631,48 @@ async def get_platform_credential(
 
 # ================== INFO ENDPOINT ==================
 
+# Static service description, built once at import
+_API_INFO = {
+    "service": "Credentials",
+    "version": "2.0.0",
+    "endpoints": {
+        "/status": {
+            "GET": "Get connection status for all platforms"
+        },
+        "/overview": {
+            "GET": "Get status, Meta status and Meta capabilities together"
+        },
+        "/meta/status": {
+            "GET": "Get detailed Meta platform status (SDK-based)"
+        },
+        "/meta/capabilities": {
+            "GET": "Check Meta feature capabilities (Ads, Instagram)"
+        },
+        "/meta/businesses": {
+            "GET": "List available business portfolios"
+        },
+        "/meta/switch-business": {
+            "POST": "Switch to different business/ad account"
+        },
+        "/meta/validate-token": {
+            "POST": "Validate current Meta access token"
+        },
+        "/meta/refresh-token": {
+            "POST": "Refresh Meta token (60-day long-lived)"
+        },
+        "/{platform}": {
+            "GET": "Get credential details for a platform"
+        },
+        "/{platform}/disconnect": {
+            "DELETE": "Disconnect a platform (admin only)"
+        }
+    },
+    "supported_platforms": VALID_PLATFORMS,
+    "meta_platforms": META_PLATFORMS
+}
+
+
 @router.get("/")
 async def get_credentials_api_info():
     """Get Credentials API service information"""
-    return {
-        "service": "Credentials",
-        "version": "2.0.0",
-        "endpoints": {
-            "/status": {
-                "GET": "Get connection status for all platforms"
-            },
-            "/meta/status": {
-                "GET": "Get detailed Meta platform status (SDK-based)"
-            },
-            "/meta/capabilities": {
-                "GET": "Check Meta feature capabilities (Ads, Instagram)"
-            },
-            "/meta/businesses": {
-                "GET": "List available business portfolios"
-            },
-            "/meta/switch-business": {
-                "POST": "Switch to different business/ad account"
-            },
-            "/meta/validate-token": {
-                "POST": "Validate current Meta access token"
-            },
-            "/meta/refresh-token": {
-                "POST": "Refresh Meta token (60-day long-lived)"
-            },
-            "/{platform}": {
-                "GET": "Get credential details for a platform"
-            },
-            "/{platform}/disconnect": {
-                "DELETE": "Disconnect a platform (admin only)"
-            }
-        },
-        "supported_platforms": VALID_PLATFORMS,
-        "meta_platforms": META_PLATFORMS
-    }
+    return _API_INFO
@@ -4,6 +4,7 @@ Content and prompt improvement endpoints
 """
 import logging
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from ...agents.content_improvement_agent import (
     improve_content_description,
@@ -12,9 +13,16 @@ from ...agents.content_improvement_agent import (
 )
 from ...agents.media_prompt_agent import (
     improve_media_prompt,
+    improve_media_prompt_stream,
+    improve_media_prompts_batch,
+    validate_prompt_request,
     ImprovePromptRequest,
-    ImprovePromptResponse
+    ImprovePromptResponse,
+    ImprovePromptBatchRequest,
+    ImprovePromptBatchResult,
+    ImprovePromptBatchResponse,
 )
+from .content import format_sse
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +139,101 @@ async def improve_prompt(request_body: ImprovePromptRequest):
         )
 
 
+@router.post("/prompt/stream")
+async def improve_prompt_stream(request_body: ImprovePromptRequest):
+    """
+    POST /api/v1/improve/prompt/stream
+    
+    Improve an AI generation prompt, streaming tokens as they are generated.
+    
+    Returns Server-Sent Events (SSE) stream with:
+    - streaming: Improved prompt generated so far
+    - done: Final improved prompt
+    - error: Error message
+    """
+    logger.info(f"Streaming prompt improvement request for {request_body.mediaType}")
+    
+    # Reject bad input with a 400 like /prompt, before the stream starts
+    try:
+        validate_prompt_request(request_body)
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "success": False,
+                "error": "Validation error",
+                "message": str(e)
+            }
+        )
+    
+    async def generate():
+        """Wrapper that formats events as SSE."""
+        async for event in improve_media_prompt_stream(request_body):
+            yield format_sse(event)
+    
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
+@router.post("/prompt/batch", response_model=ImprovePromptBatchResponse)
+async def improve_prompt_batch(request_body: ImprovePromptBatchRequest):
+    """
+    POST /api/v1/improve/prompt/batch
+    
+    Improve several AI generation prompts concurrently.
+    
+    Items are processed in parallel with bounded concurrency. A failing item
+    does not fail the batch - its result carries the error instead.
+    
+    Args:
+        request_body: Batch of prompt improvement requests
+        
+    Returns:
+        One result per request, in request order
+        
+    Raises:
+        HTTPException: 500 for server errors
+    """
+    try:
+        logger.info(f"Batch prompt improvement request for {len(request_body.requests)} prompts")
+        
+        outcomes = await improve_media_prompts_batch(request_body.requests)
+        
+        results = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                results.append(ImprovePromptBatchResult(success=False, error=str(outcome)))
+            else:
+                results.append(ImprovePromptBatchResult(
+                    success=True,
+                    improvedPrompt=outcome.improvedPrompt,
+                ))
+        
+        return ImprovePromptBatchResponse(
+            success=all(result.success for result in results),
+            results=results,
+        )
+    
+    except Exception as e:
+        logger.error(f"Batch prompt improvement error: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "success": False,
+                "error": "Internal server error",
+                "message": str(e)
+            }
+        )
+
+
 @router.get("/content")
 async def content_improvement_info():
     """GET /api/v1/improve/content - Service information"""
@@ -2,8 +2,15 @@
 Media API Routes
 Endpoints for image, audio, and video generation
 """
+import functools
+import hashlib
 import logging
-from fastapi import APIRouter, HTTPException
+from typing import Callable, Literal
+
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
 
 from ...agents.media_agents.image_agent import (
     generate_image,
@@ -74,6 +81,7 @@ from ...agents.media_agents.sora_agent import (
     remix_video as sora_remix_video,
     get_video_status as sora_get_status,
     fetch_video_content as sora_fetch_content,
+    open_video_content_stream as sora_open_content_stream,
     list_videos as sora_list_videos,
     delete_video as sora_delete_video,
     SoraGenerateRequest,
@@ -105,11 +113,140 @@ from ...agents.media_agents.runway_agent import (
     RUNWAY_DURATIONS,
     RUNWAY_GENERATION_MODES,
 )
+from ...config import settings
+from ...utils.bulkhead import Bulkhead, BulkheadFullError
+from ...utils.cache import TTLCache
+from ...utils.singleflight import SingleFlight, request_key
 
 logger = logging.getLogger(__name__)
 
+# Endpoints document their model via responses={200: {"model": ...}} rather than
+# response_model: services already return validated models, and response_model
+# would re-validate multi-MB base64 payloads on the way out
 router = APIRouter(prefix="/api/v1/media", tags=["Media Generation"])
 
+# Model lists and API info only change on deploy - serialized once at import.
+# Shared caches (CDN/proxy) may serve them for an hour and keep serving a stale
+# copy for a day while revalidating; the ETag makes revalidation a bare 304.
+_STATIC_CACHE_CONTROL = "public, max-age=3600, s-maxage=3600, stale-while-revalidate=86400"
+
+
+@functools.lru_cache(maxsize=16)
+def _static_etag(body: bytes) -> str:
+    """Strong ETag for a static payload (computed once per payload)"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def not_modified(http_request: Request, etag: str, cache_control: str) -> Response | None:
+    """304 response if the client's If-None-Match already covers etag"""
+    if_none_match = http_request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    if etag in tags or "*" in tags:
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": cache_control},
+        )
+    return None
+
+
+def static_json_response(body: bytes, http_request: Request) -> Response:
+    """Wrap a pre-serialized static JSON payload in a cacheable response"""
+    etag = _static_etag(body)
+    cached = not_modified(http_request, etag, _STATIC_CACHE_CONTROL)
+    if cached is not None:
+        return cached
+    
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": _STATIC_CACHE_CONTROL},
+    )
+
+
+# Upstream concurrency per provider, keyed by the first segment of a generation
+# namespace. A slow provider only queues its own requests (up to max_waiting);
+# past that, callers get a 429 instead of tying up shared workers.
+_PROVIDER_BULKHEADS = {
+    "image": Bulkhead("OpenAI image service", max_concurrency=8, max_waiting=16),
+    "imagen": Bulkhead(
+        "Gemini image service",
+        max_concurrency=settings.GEMINI_MAX_CONCURRENCY or 8,
+        max_waiting=16,
+    ),
+    "audio": Bulkhead("ElevenLabs audio service", max_concurrency=4, max_waiting=8),
+    "video": Bulkhead("Veo video service", max_concurrency=4, max_waiting=8),
+    "sora": Bulkhead("Sora video service", max_concurrency=4, max_waiting=8),
+    "runway": Bulkhead("Runway video service", max_concurrency=4, max_waiting=8),
+}
+
+# Concurrent identical generation requests (double submits, retries, several
+# tabs) share one upstream call instead of each paying for their own
+_generations = SingleFlight()
+
+
+async def _call_provider(namespace: str, request, generate):
+    """Run generate(request) inside its provider's bulkhead"""
+    bulkhead = _PROVIDER_BULKHEADS[namespace.split("/", 1)[0]]
+    async with bulkhead.slot():
+        return await generate(request)
+
+
+def coalesce_generation(namespace: str, request, generate):
+    """Run generate(request), sharing the call with identical in-flight requests"""
+    key = request_key(namespace, request.model_dump(mode="json"))
+    return _generations.do(key, lambda: _call_provider(namespace, request, generate))
+
+
+# Successful text/reference image generations keyed by normalized prompt plus
+# options, so a repeated prompt is served without another paid generation.
+# Results are base64 data URLs (often several MB), so the cache is bounded by
+# total payload size as well as entry count.
+IMAGE_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+
+def _image_result_bytes(result) -> int:
+    """Approximate memory held by a cached image result (its data URL)"""
+    return len(result.data.imageUrl) if result.data else 0
+
+
+_image_cache = TTLCache(
+    maxsize=64,
+    ttl=3600,
+    maxweight=IMAGE_CACHE_MAX_BYTES,
+    weigher=_image_result_bytes,
+)
+
+
+def image_cache_payload(request, exclude) -> dict:
+    """Request fields that identify a cacheable image, with the prompt normalized"""
+    payload = request.model_dump(mode="json", exclude=exclude)
+    payload["prompt"] = " ".join(request.prompt.split()).casefold()
+    return payload
+
+
+async def cached_image_generation(namespace: str, request, generate, response: Response, payload: dict, bypass: bool):
+    """
+    Serve an image from the result cache, or generate it and store the result.
+    
+    Sets X-Cache to HIT, MISS or BYPASS on the response.
+    """
+    cache_key = request_key(namespace, payload)
+    if not bypass:
+        cached = _image_cache.get(cache_key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
+    
+    result = await coalesce_generation(namespace, request, generate)
+    if result.success:
+        _image_cache.set(cache_key, result)
+    
+    response.headers["X-Cache"] = "BYPASS" if bypass else "MISS"
+    return result
+
 
 def parse_media_error(error: Exception) -> str:
     """
@@ -175,112 +312,130 @@ def parse_media_error(error: Exception) -> str:
     return f"Media generation error: {error_str}"
 
 
+def fast_return(model: BaseModel, sub_response: Response | None = None) -> Response:
+    """
+    Serialize a result model straight to JSON bytes with pydantic-core.
+    
+    Same output as FastAPI's default encoding (by alias, nulls kept) without
+    the intermediate jsonable_encoder pass over multi-MB base64 payloads.
+    Headers set on an injected Response (X-Cache, ETag...) are carried over,
+    since FastAPI ignores them once a handler returns a Response itself.
+    """
+    response = Response(content=model.model_dump_json(by_alias=True), media_type="application/json")
+    if sub_response is not None:
+        for key, value in sub_response.headers.items():
+            if key != "content-length":
+                response.headers[key] = value
+    return response
+
+
+def media_endpoint(
+    label: str,
+    error_detail: Callable[[Exception], str] = str,
+    check_success: bool = True,
+):
+    """
+    Shared error handling for media route handlers.
+    
+    Results with success=False become 400s, HTTPExceptions pass through, a
+    saturated provider bulkhead becomes a 429 and anything else is logged and
+    returned as a 500 with error_detail(e). Result models are serialized
+    with fast_return. functools.wraps keeps the handler signature visible
+    to FastAPI.
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(*args, **kwargs):
+            try:
+                result = await handler(*args, **kwargs)
+            except HTTPException:
+                raise
+            except BulkheadFullError as e:
+                logger.warning("%s rejected: %s", label, e)
+                raise HTTPException(
+                    status_code=429,
+                    detail=f"{e.name} is busy. Please try again shortly.",
+                    headers={"Retry-After": "5"},
+                )
+            except Exception as e:
+                logger.error("%s error: %s", label, e, exc_info=True)
+                raise HTTPException(status_code=500, detail=error_detail(e))
+            
+            if isinstance(result, Response):
+                return result
+            if check_success and not result.success:
+                raise HTTPException(status_code=400, detail=result.error)
+            if isinstance(result, BaseModel):
+                return fast_return(result, kwargs.get("response"))
+            return result
+        return wrapper
+    return decorator
+
+
 # ============================================================================
 # IMAGE ENDPOINTS
 # ============================================================================
 
-@router.post("/image/generate", response_model=ImageGenerationResponse)
-async def api_generate_image(request: FrontendImageRequest):
+@router.post("/image/generate", responses={200: {"model": ImageGenerationResponse}})
+@media_endpoint("Image generation", parse_media_error)
+async def api_generate_image(request: FrontendImageRequest, response: Response):
     """
     Generate image from text prompt using gpt-image-1.5
     
     Request format: { prompt, options: { model, size, quality, ... } }
     Response format: { success, data: { imageUrl, metadata } }
     """
-    try:
-        logger.info(f"Image generation request: {request.prompt[:50]}...")
-        result = await generate_image(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Image generation error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=parse_media_error(e))
+    logger.info("Image generation request: %.50s...", request.prompt)
+    return await cached_image_generation(
+        "image/generate",
+        request,
+        generate_image,
+        response,
+        payload=image_cache_payload(request, exclude={"options": {"cache_bypass"}}),
+        bypass=bool(request.options and request.options.cache_bypass),
+    )
 
 
-@router.post("/image/edit", response_model=ImageGenerationResponse)
+@router.post("/image/edit", responses={200: {"model": ImageGenerationResponse}})
+@router.post("/image/inpaint", responses={200: {"model": ImageGenerationResponse}}, name="api_inpaint_image")
+@media_endpoint("Image edit", parse_media_error)
 async def api_edit_image(request: ImageEditRequest):
     """
     Edit image with mask (inpainting)
     
-    Provide original image, mask, and edit prompt
-    """
-    try:
-        logger.info(f"Image edit request: {request.prompt[:50]}...")
-        result = await generate_image_edit(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Image edit error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=parse_media_error(e))
-
-
-
-
-
-@router.post("/image/inpaint", response_model=ImageGenerationResponse)
-async def api_inpaint_image(request: ImageEditRequest):
-    """
-    Inpaint image with mask
-    
-    Alias for /image/edit for frontend compatibility
+    Provide original image, mask, and edit prompt.
+    Also served at /image/inpaint for frontend compatibility.
     """
-    try:
-        logger.info(f"Image inpaint request: {request.prompt[:50]}...")
-        result = await generate_image_edit(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Image inpaint error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=parse_media_error(e))
+    logger.info("Image edit request: %.50s...", request.prompt)
+    return await coalesce_generation("image/edit", request, generate_image_edit)
 
 
-@router.post("/image/reference", response_model=ImageGenerationResponse)
-async def api_reference_image(request: ImageReferenceRequest):
+@router.post("/image/reference", responses={200: {"model": ImageGenerationResponse}})
+@media_endpoint("Image reference", parse_media_error)
+async def api_reference_image(request: ImageReferenceRequest, response: Response):
     """
     Reference-based image generation using gpt-image-1.5
     
     Request: { referenceImages, prompt, input_fidelity }
     Response: { success, data: { imageUrl, metadata } }
     """
-    try:
-        logger.info(f"Image reference request: {request.prompt[:50]}...")
-        result = await generate_image_reference(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Image reference error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=parse_media_error(e))
+    logger.info("Image reference request: %.50s...", request.prompt)
+    return await cached_image_generation(
+        "image/reference",
+        request,
+        generate_image_reference,
+        response,
+        payload=image_cache_payload(request, exclude={"cache_bypass"}),
+        bypass=bool(request.cache_bypass),
+    )
 
 
 # ============================================================================
 # GEMINI IMAGE ENDPOINTS
 # ============================================================================
 
-@router.post("/imagen", response_model=GeminiImageResponse)
+@router.post("/imagen", responses={200: {"model": GeminiImageResponse}})
+@media_endpoint("Gemini image generation", parse_media_error)
 async def api_gemini_generate_image(request: GeminiImageGenerateRequest):
     """
     Generate image using Google Gemini 3 Pro Image Preview
@@ -295,23 +450,12 @@ async def api_gemini_generate_image(request: GeminiImageGenerateRequest):
     - Google Search grounding (for real-time info)
     - Response modalities: ['TEXT', 'IMAGE'] or ['IMAGE']
     """
-    try:
-        logger.info(f"Gemini image generation: {request.prompt[:50]}...")
-        result = await gemini_generate_image(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Gemini image generation error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=parse_media_error(e))
+    logger.info("Gemini image generation: %.50s...", request.prompt)
+    return await coalesce_generation("imagen", request, gemini_generate_image)
 
 
-@router.post("/imagen/edit", response_model=GeminiImageResponse)
+@router.post("/imagen/edit", responses={200: {"model": GeminiImageResponse}})
+@media_endpoint("Gemini image edit", parse_media_error)
 async def api_gemini_edit_image(request: GeminiImageEditRequest):
     """
     Edit image using Google Gemini
@@ -322,23 +466,12 @@ async def api_gemini_edit_image(request: GeminiImageEditRequest):
     - Up to 14 reference images (Gemini 3 Pro)
     - Semantic masking (describe what to edit)
     """
-    try:
-        logger.info(f"Gemini image edit: {request.prompt[:50]}...")
-        result = await gemini_edit_image(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Gemini image edit error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=parse_media_error(e))
+    logger.info("Gemini image edit: %.50s...", request.prompt)
+    return await coalesce_generation("imagen/edit", request, gemini_edit_image)
 
 
-@router.post("/imagen/chat", response_model=GeminiImageResponse)
+@router.post("/imagen/chat", responses={200: {"model": GeminiImageResponse}})
+@media_endpoint("Gemini multi-turn", parse_media_error)
 async def api_gemini_multi_turn(request: GeminiMultiTurnRequest):
     """
     Multi-turn conversational image editing
@@ -351,180 +484,111 @@ async def api_gemini_multi_turn(request: GeminiMultiTurnRequest):
     2. "Make the sky more dramatic"
     3. "Change the language to Spanish"
     """
-    try:
-        logger.info(f"Gemini multi-turn edit: {request.prompt[:50]}...")
-        result = await gemini_multi_turn_edit(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Gemini multi-turn error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=parse_media_error(e))
+    logger.info("Gemini multi-turn edit: %.50s...", request.prompt)
+    return await coalesce_generation("imagen/chat", request, gemini_multi_turn_edit)
+
+
+_IMAGEN_MODELS_JSON = orjson.dumps({
+    "success": True,
+    "models": [
+        {
+            "id": "gemini-3-pro-image-preview",
+            "name": "Gemini 3 Pro Image Preview",
+            "description": "Advanced 4K generation with thinking mode, up to 14 reference images",
+            "maxReferenceImages": 14,
+            "supportedSizes": ["1K", "2K", "4K"],
+            "features": ["text-to-image", "image-editing", "multi-turn", "google-search", "thinking"]
+        }
+    ],
+    "aspectRatios": ["1:1", "2:3", "3:2", "3:4", "4:3", "4:5", "5:4", "9:16", "16:9", "21:9"],
+    "imageSizes": ["1K", "2K", "4K"]
+})
 
 
 @router.get("/imagen/models")
-async def get_gemini_image_models():
+async def get_gemini_image_models(http_request: Request):
     """Get available Gemini image models and their capabilities"""
-    return {
-        "success": True,
-        "models": [
-            {
-                "id": "gemini-3-pro-image-preview",
-                "name": "Gemini 3 Pro Image Preview",
-                "description": "Advanced 4K generation with thinking mode, up to 14 reference images",
-                "maxReferenceImages": 14,
-                "supportedSizes": ["1K", "2K", "4K"],
-                "features": ["text-to-image", "image-editing", "multi-turn", "google-search", "thinking"]
-            }
-        ],
-        "aspectRatios": ["1:1", "2:3", "3:2", "3:4", "4:3", "4:5", "5:4", "9:16", "16:9", "21:9"],
-        "imageSizes": ["1K", "2K", "4K"]
-    }
+    return static_json_response(_IMAGEN_MODELS_JSON, http_request)
 
 
 # ============================================================================
 # AUDIO ENDPOINTS
 # ============================================================================
 
-@router.post("/audio/speech", response_model=TTSResponse)
+@router.post("/audio/speech", responses={200: {"model": TTSResponse}})
+@router.post("/audio/tts", responses={200: {"model": TTSResponse}}, name="api_tts_alias")
+@media_endpoint("TTS")
 async def api_generate_speech(request: TTSRequest):
     """
     Generate speech from text using ElevenLabs TTS
     
-    Requires voice_id from GET /media/audio/voices
+    Requires voice_id from GET /media/audio/voices.
+    Also served at /audio/tts for frontend compatibility.
     """
-    try:
-        logger.info(f"TTS request: {request.text[:50]}...")
-        result = await generate_speech(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"TTS error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("TTS request: %.50s...", request.text)
+    return await coalesce_generation("audio/speech", request, generate_speech)
 
 
-@router.post("/audio/music", response_model=MusicResponse)
+@router.post("/audio/music", responses={200: {"model": MusicResponse}})
+@media_endpoint("Music generation")
 async def api_generate_music(request: MusicRequest):
     """
     Generate music from text prompt
     
     Duration: 10 seconds to 5 minutes
     """
-    try:
-        logger.info(f"Music generation: {request.prompt[:50]}...")
-        result = await generate_music(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Music generation error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Music generation: %.50s...", request.prompt)
+    return await coalesce_generation("audio/music", request, generate_music)
 
 
-@router.post("/audio/sound-effects", response_model=SoundEffectsResponse)
+@router.post("/audio/sound-effects", responses={200: {"model": SoundEffectsResponse}})
+@media_endpoint("Sound effects")
 async def api_generate_sound_effects(request: SoundEffectsRequest):
     """
     Generate sound effects from text prompt
     
     Duration: 0.1 to 30 seconds
     """
-    try:
-        logger.info(f"Sound effects: {request.prompt[:50]}...")
-        result = await generate_sound_effects(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Sound effects error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Sound effects: %.50s...", request.prompt)
+    return await coalesce_generation("audio/sound-effects", request, generate_sound_effects)
 
 
-@router.get("/audio/voices", response_model=VoicesResponse)
+@router.get("/audio/voices", responses={200: {"model": VoicesResponse}})
+@media_endpoint("Get voices")
 async def api_get_voices():
     """Get available ElevenLabs voices"""
-    try:
-        result = await get_voices()
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Get voices error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return await get_voices()
 
 
-@router.post("/audio/clone-voice", response_model=VoiceCloningResponse)
+@router.post("/audio/clone-voice", responses={200: {"model": VoiceCloningResponse}})
+@router.post("/audio/voice-cloning", responses={200: {"model": VoiceCloningResponse}}, name="api_voice_cloning_alias")
+@media_endpoint("Voice cloning")
 async def api_clone_voice(request: VoiceCloningRequest):
     """
     Clone voice from audio sample (instant voice cloning)
     
-    Provide base64-encoded audio sample
+    Provide base64-encoded audio sample.
+    Also served at /audio/voice-cloning for frontend compatibility.
     """
-    try:
-        logger.info(f"Voice cloning: {request.name}")
-        result = await clone_voice(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Voice cloning error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.get("/audio/models")
-async def get_audio_models():
-    """Get available TTS models and output formats"""
-    return {
-        "success": True,
-        "models": TTS_MODELS,
-        "outputFormats": OUTPUT_FORMATS
-    }
+    logger.info("Voice cloning: %s", request.name)
+    return await clone_voice(request)
 
 
-# Alias endpoints for frontend compatibility
-@router.post("/audio/tts", response_model=TTSResponse)
-async def api_tts_alias(request: TTSRequest):
-    """Alias for /audio/speech for frontend compatibility"""
-    return await api_generate_speech(request)
+_AUDIO_MODELS_JSON = orjson.dumps({
+    "success": True,
+    "models": TTS_MODELS,
+    "outputFormats": OUTPUT_FORMATS
+})
 
 
-@router.post("/audio/voice-cloning", response_model=VoiceCloningResponse)
-async def api_voice_cloning_alias(request: VoiceCloningRequest):
-    """Alias for /audio/clone-voice for frontend compatibility"""
-    return await api_clone_voice(request)
+@router.get("/audio/models")
+async def get_audio_models(http_request: Request):
+    """Get available TTS models and output formats"""
+    return static_json_response(_AUDIO_MODELS_JSON, http_request)
 
 
-@router.post("/audio/voice-design", response_model=VoiceDesignResponse)
+@router.post("/audio/voice-design", responses={200: {"model": VoiceDesignResponse}})
+@media_endpoint("Voice design")
 async def api_voice_design(request: VoiceDesignRequest):
     """
     Design a custom voice from text description or save a designed voice.
@@ -535,27 +599,16 @@ async def api_voice_design(request: VoiceDesignRequest):
     
     Models: eleven_multilingual_ttv_v2, eleven_ttv_v3
     """
-    try:
-        if request.action == "design":
-            logger.info(f"Voice design request: {request.voiceDescription[:50] if request.voiceDescription else 'N/A'}...")
-            result = await design_voice(request)
-        else:
-            logger.info(f"Voice save request: {request.name}")
-            result = await save_designed_voice(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Voice design error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    if request.action == "design":
+        logger.info("Voice design request: %.50s...", request.voiceDescription or "N/A")
+        return await design_voice(request)
+    
+    logger.info("Voice save request: %s", request.name)
+    return await save_designed_voice(request)
 
 
-@router.post("/audio/dialog", response_model=DialogResponse)
+@router.post("/audio/dialog", responses={200: {"model": DialogResponse}})
+@media_endpoint("Dialog generation")
 async def api_generate_dialog(request: DialogRequest):
     """
     Generate multi-speaker dialog using ElevenLabs Text-to-Dialogue API.
@@ -564,27 +617,16 @@ async def api_generate_dialog(request: DialogRequest):
     Supports audio tags: [laughs], [sighs], [whispers], etc.
     Model: eleven_v3 (recommended)
     """
-    try:
-        logger.info(f"Dialog generation: {len(request.inputs)} speakers")
-        result = await generate_dialog(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Dialog generation error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Dialog generation: %s speakers", len(request.inputs))
+    return await coalesce_generation("audio/dialog", request, generate_dialog)
 
 
 # ============================================================================
 # VIDEO ENDPOINTS
 # ============================================================================
 
-@router.post("/video/generate", response_model=VideoGenerationResponse)
+@router.post("/video/generate", responses={200: {"model": VideoGenerationResponse}})
+@media_endpoint("Video generation")
 async def api_generate_video(request: VideoGenerationRequest):
     """
     Generate video from text prompt using Google Veo
@@ -596,474 +638,358 @@ async def api_generate_video(request: VideoGenerationRequest):
     - veo-3.1-generate-preview: Latest, best quality with native audio
     - veo-3.1-fast-generate-preview: Faster generation
     """
-    try:
-        logger.info(f"Video generation: {request.prompt[:50]}...")
-        result = await generate_video(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Video generation error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Video generation: %.50s...", request.prompt)
+    return await coalesce_generation("video/generate", request, generate_video)
 
 
-@router.post("/video/status", response_model=VideoStatusResponse)
+@router.post("/video/status", responses={200: {"model": VideoStatusResponse}})
+@media_endpoint("Video status", check_success=False)
 async def api_get_video_status(request: VideoStatusRequest):
     """
     Get status of video generation operation
     
     Poll every 10 seconds until done=True
     """
-    try:
-        logger.info(f"Video status check: {request.operationId}")
-        result = await get_video_status(request)
-        return result
-        
-    except Exception as e:
-        logger.error(f"Video status error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Video status check: %s", request.operationId)
+    return await get_video_status(request)
 
 
-@router.post("/video/image-to-video", response_model=VideoGenerationResponse)
+@router.post("/video/image-to-video", responses={200: {"model": VideoGenerationResponse}})
+@media_endpoint("Image-to-video")
 async def api_image_to_video(request: ImageToVideoRequest):
     """
     Generate video with image as first frame (Veo 3.1)
     """
-    try:
-        logger.info(f"Image-to-video: {request.prompt[:50]}...")
-        result = await generate_image_to_video(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Image-to-video error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Image-to-video: %.50s...", request.prompt)
+    return await coalesce_generation("video/image-to-video", request, generate_image_to_video)
 
 
-@router.post("/video/frame-specific", response_model=VideoGenerationResponse)
+@router.post("/video/frame-specific", responses={200: {"model": VideoGenerationResponse}})
+@media_endpoint("Frame-specific")
 async def api_frame_specific(request: FrameSpecificRequest):
     """
     Generate video by specifying first and last frames (interpolation)
     Veo 3.1 only
     """
-    try:
-        logger.info(f"Frame-specific generation")
-        result = await generate_frame_specific(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Frame-specific error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Frame-specific generation")
+    return await coalesce_generation("video/frame-specific", request, generate_frame_specific)
 
 
-@router.post("/video/reference-images", response_model=VideoGenerationResponse)
+@router.post("/video/reference-images", responses={200: {"model": VideoGenerationResponse}})
+@media_endpoint("Reference images")
 async def api_reference_images(request: ReferenceImagesRequest):
     """
     Generate video using 1-3 reference images for content guidance
     Veo 3.1 only
     """
-    try:
-        logger.info(f"Reference images: {request.prompt[:50]}...")
-        result = await generate_with_references(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Reference images error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Reference images: %.50s...", request.prompt)
+    return await coalesce_generation("video/reference-images", request, generate_with_references)
 
 
-@router.post("/video/extend", response_model=VideoGenerationResponse)
+@router.post("/video/extend", responses={200: {"model": VideoGenerationResponse}})
+@media_endpoint("Extend video")
 async def api_extend_video(request: VideoExtendRequest):
     """
     Extend a Veo-generated video by 7 seconds (up to 20 times)
     Veo 3.1 only
     """
-    try:
-        logger.info(f"Extend video: {request.veoVideoId[:50]}...")
-        result = await extend_video(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Extend video error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Extend video: %.50s...", request.veoVideoId)
+    return await coalesce_generation("video/extend", request, extend_video)
 
 
-@router.post("/video/download", response_model=VideoDownloadResponse)
+@router.post("/video/download", responses={200: {"model": VideoDownloadResponse}})
+@media_endpoint("Download video")
 async def api_download_video(request: VideoDownloadRequest):
     """
     Download completed video and optionally upload to Supabase
     """
-    try:
-        logger.info(f"Download video: {request.veoVideoId[:50]}...")
-        result = await download_video(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Download video error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Download video: %.50s...", request.veoVideoId)
+    return await download_video(request)
+
+
+_VIDEO_MODELS_JSON = orjson.dumps({
+    "success": True,
+    "models": VEO_MODELS
+})
 
 
 @router.get("/video/models")
-async def get_video_models():
+async def get_video_models(http_request: Request):
     """Get available Veo models"""
-    return {
-        "success": True,
-        "models": VEO_MODELS
-    }
+    return static_json_response(_VIDEO_MODELS_JSON, http_request)
 
 
 # ============================================================================
 # SORA ENDPOINTS - OpenAI Video Generation
 # ============================================================================
 
-@router.post("/sora/generate", response_model=SoraGenerateResponse)
+@router.post("/sora/generate", responses={200: {"model": SoraGenerateResponse}})
+@media_endpoint("Sora generate")
 async def api_sora_generate(request: SoraGenerateRequest):
     """
     Generate video from text prompt using OpenAI Sora
     
     Returns job ID for polling status
     """
-    try:
-        logger.info(f"Sora generate: {request.prompt[:50]}...")
-        result = await sora_generate_video(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Sora generate error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Sora generate: %.50s...", request.prompt)
+    return await coalesce_generation("sora/generate", request, sora_generate_video)
 
 
-@router.post("/sora/image-to-video", response_model=SoraGenerateResponse)
+@router.post("/sora/image-to-video", responses={200: {"model": SoraGenerateResponse}})
+@media_endpoint("Sora image-to-video")
 async def api_sora_image_to_video(request: SoraImageToVideoRequest):
     """
     Generate video with image as first frame using OpenAI Sora
     
     Image must match target resolution
     """
-    try:
-        logger.info(f"Sora image-to-video: {request.prompt[:50]}...")
-        result = await sora_image_to_video(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Sora image-to-video error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Sora image-to-video: %.50s...", request.prompt)
+    return await coalesce_generation("sora/image-to-video", request, sora_image_to_video)
 
 
-@router.post("/sora/remix", response_model=SoraGenerateResponse)
+@router.post("/sora/remix", responses={200: {"model": SoraGenerateResponse}})
+@media_endpoint("Sora remix")
 async def api_sora_remix(request: SoraRemixRequest):
     """
     Remix a completed Sora video with targeted adjustments
     
     Best for single, focused changes
     """
-    try:
-        logger.info(f"Sora remix: video={request.previousVideoId}")
-        result = await sora_remix_video(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Sora remix error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Sora remix: video=%s", request.previousVideoId)
+    return await coalesce_generation("sora/remix", request, sora_remix_video)
 
 
-@router.post("/sora/status", response_model=SoraStatusResponse)
+@router.post("/sora/status", responses={200: {"model": SoraStatusResponse}})
+@media_endpoint("Sora status", check_success=False)
 async def api_sora_status(request: SoraStatusRequest):
     """
     Get Sora video generation status
     
     Poll this endpoint every 10-20 seconds until completed/failed
     """
-    try:
-        result = await sora_get_status(request)
-        return result
-        
-    except Exception as e:
-        logger.error(f"Sora status error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return await sora_get_status(request)
+
+
+# Content of a completed Sora job never changes, so (video, variant) is a
+# strong validator and clients may keep it indefinitely
+_IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
 
+def sora_content_etag(video_id: str, variant: str, representation: str) -> str:
+    """Strong ETag for one representation (json/raw) of a Sora video variant"""
+    digest = hashlib.blake2b(
+        f"{video_id}:{variant}:{representation}".encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    return f'"{digest}"'
 
-@router.post("/sora/fetch", response_model=SoraFetchResponse)
-async def api_sora_fetch(request: SoraFetchRequest):
+
+@router.post("/sora/fetch", responses={200: {"model": SoraFetchResponse}})
+@media_endpoint("Sora fetch")
+async def api_sora_fetch(request: SoraFetchRequest, http_request: Request, response: Response):
     """
     Fetch completed Sora video content
     
-    Supports variants: video (MP4), thumbnail (WebP), spritesheet (JPG)
+    Supports variants: video (MP4), thumbnail (WebP), spritesheet (JPG).
+    Sends an ETag - repeat fetches with If-None-Match get an empty 304.
+    """
+    etag = sora_content_etag(request.videoId, request.variant or "video", "json")
+    cached = not_modified(http_request, etag, _IMMUTABLE_CACHE_CONTROL)
+    if cached is not None:
+        return cached
+    
+    logger.info("Sora fetch: video=%s, variant=%s", request.videoId, request.variant)
+    result = await sora_fetch_content(request)
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _IMMUTABLE_CACHE_CONTROL
+    return result
+
+
+@router.get("/sora/content/{video_id}")
+async def api_sora_content(
+    http_request: Request,
+    video_id: str,
+    variant: Literal["video", "thumbnail", "spritesheet"] = Query("video"),
+):
+    """
+    Stream completed Sora video content as raw bytes
+    
+    Same content as /sora/fetch, but proxied in chunks with the real content
+    type instead of a base64 data URL in JSON - use it as a <video>/<img> src
     """
+    etag = sora_content_etag(video_id, variant, "raw")
+    cached = not_modified(http_request, etag, _IMMUTABLE_CACHE_CONTROL)
+    if cached is not None:
+        return cached
+    
     try:
-        logger.info(f"Sora fetch: video={request.videoId}, variant={request.variant}")
-        result = await sora_fetch_content(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
+        chunks, media_type = await sora_open_content_stream(video_id, variant)
     except Exception as e:
-        logger.error(f"Sora fetch error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.error("Sora content stream error: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=parse_media_error(e))
+    
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"ETag": etag, "Cache-Control": _IMMUTABLE_CACHE_CONTROL},
+    )
+
+
+_SORA_MODELS_JSON = orjson.dumps({
+    "success": True,
+    "models": SORA_MODELS
+})
 
 
 @router.get("/sora/models")
-async def get_sora_models():
+async def get_sora_models(http_request: Request):
     """Get available Sora models"""
-    return {
-        "success": True,
-        "models": SORA_MODELS
-    }
+    return static_json_response(_SORA_MODELS_JSON, http_request)
 
 
 @router.get("/sora/list")
+@media_endpoint("Sora list", check_success=False)
 async def api_sora_list(limit: int = 20, after: str = None, order: str = "desc"):
     """List Sora videos with pagination"""
-    try:
-        result = await sora_list_videos(limit, after, order)
-        return result
-    except Exception as e:
-        logger.error(f"Sora list error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return await sora_list_videos(limit, after, order)
 
 
 @router.delete("/sora/{video_id}")
+@media_endpoint("Sora delete", check_success=False)
 async def api_sora_delete(video_id: str):
     """Delete a Sora video"""
-    try:
-        result = await sora_delete_video(video_id)
-        return result
-    except Exception as e:
-        logger.error(f"Sora delete error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return await sora_delete_video(video_id)
 
 
 # ============================================================================
 # RUNWAY ENDPOINTS - Runway Gen4 Alpha Video Generation
 # ============================================================================
 
-@router.post("/runway/text-to-video", response_model=RunwayGenerationResponse)
+@router.post("/runway/text-to-video", responses={200: {"model": RunwayGenerationResponse}})
+@media_endpoint("Runway text-to-video")
 async def api_runway_text_to_video(request: RunwayTextToVideoRequest):
     """
     Generate video from text prompt using Runway Gen4
     
     Returns task ID for polling status
     """
-    try:
-        logger.info(f"Runway text-to-video: {request.prompt[:50]}...")
-        result = await runway_text_to_video(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Runway text-to-video error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Runway text-to-video: %.50s...", request.prompt)
+    return await coalesce_generation("runway/text-to-video", request, runway_text_to_video)
 
 
-@router.post("/runway/image-to-video", response_model=RunwayGenerationResponse)
+@router.post("/runway/image-to-video", responses={200: {"model": RunwayGenerationResponse}})
+@media_endpoint("Runway image-to-video")
 async def api_runway_image_to_video(request: RunwayImageToVideoRequest):
     """
     Generate video with image as first frame using Runway Gen4
     
     Uses gen4_turbo model
     """
-    try:
-        logger.info(f"Runway image-to-video: {request.prompt[:50]}...")
-        result = await runway_image_to_video(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Runway image-to-video error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Runway image-to-video: %.50s...", request.prompt)
+    return await coalesce_generation("runway/image-to-video", request, runway_image_to_video)
 
 
-@router.post("/runway/video-to-video", response_model=RunwayGenerationResponse)
+@router.post("/runway/video-to-video", responses={200: {"model": RunwayGenerationResponse}})
+@media_endpoint("Runway video-to-video")
 async def api_runway_video_to_video(request: RunwayVideoToVideoRequest):
     """
     Transform video with style transfer using Runway Gen4
     
     Uses gen4_aleph model
     """
-    try:
-        logger.info(f"Runway video-to-video: {request.prompt[:50]}...")
-        result = await runway_video_to_video(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Runway video-to-video error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Runway video-to-video: %.50s...", request.prompt)
+    return await coalesce_generation("runway/video-to-video", request, runway_video_to_video)
 
 
-@router.post("/runway/upscale", response_model=RunwayGenerationResponse)
+@router.post("/runway/upscale", responses={200: {"model": RunwayGenerationResponse}})
+@media_endpoint("Runway upscale")
 async def api_runway_upscale(request: RunwayUpscaleRequest):
     """
     Upscale video resolution using Runway
     """
-    try:
-        logger.info(f"Runway upscale video")
-        result = await runway_upscale_video(request)
-        
-        if not result.success:
-            raise HTTPException(status_code=400, detail=result.error)
-        
-        return result
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Runway upscale error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Runway upscale video")
+    return await coalesce_generation("runway/upscale", request, runway_upscale_video)
 
 
-@router.post("/runway/status", response_model=RunwayTaskStatusResponse)
+@router.post("/runway/status", responses={200: {"model": RunwayTaskStatusResponse}})
+@media_endpoint("Runway status", check_success=False)
 async def api_runway_status(request: RunwayTaskStatusRequest):
     """
     Get Runway video generation task status
     
     Poll every 5 seconds until status is SUCCEEDED or FAILED
     """
-    try:
-        result = await runway_get_task_status(request)
-        return result
-        
-    except Exception as e:
-        logger.error(f"Runway status error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return await runway_get_task_status(request)
 
 
 @router.delete("/runway/{task_id}")
+@media_endpoint("Runway delete", check_success=False)
 async def api_runway_delete(task_id: str):
     """Cancel or delete a Runway task"""
-    try:
-        result = await runway_delete_task(task_id)
-        return result
-    except Exception as e:
-        logger.error(f"Runway delete error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return await runway_delete_task(task_id)
+
+
+_RUNWAY_MODELS_JSON = orjson.dumps({
+    "success": True,
+    "models": RUNWAY_MODELS,
+    "ratios": RUNWAY_RATIOS,
+    "durations": RUNWAY_DURATIONS,
+    "modes": RUNWAY_GENERATION_MODES
+})
 
 
 @router.get("/runway/models")
-async def get_runway_models():
+async def get_runway_models(http_request: Request):
     """Get available Runway models and options"""
-    return {
-        "success": True,
-        "models": RUNWAY_MODELS,
-        "ratios": RUNWAY_RATIOS,
-        "durations": RUNWAY_DURATIONS,
-        "modes": RUNWAY_GENERATION_MODES
-    }
+    return static_json_response(_RUNWAY_MODELS_JSON, http_request)
 
 
 # ============================================================================
 # INFO ENDPOINT
 # ============================================================================
 
-@router.get("/")
-async def media_info():
-    """Media API information"""
-    return {
-        "success": True,
-        "message": "Media Generation API is operational",
-        "version": "1.3.0",
-        "services": {
-            "image": {
-                "models": ["gpt-image-1.5"],
-                "features": ["text-to-image", "inpainting", "reference-based"],
-                "endpoints": ["/image/generate", "/image/inpaint", "/image/reference"]
-            },
-            "gemini": {
-                "models": ["gemini-3-pro-image-preview"],
-                "features": ["text-to-image", "image-editing", "multi-turn", "4K-output", "google-search-grounding"],
-                "endpoints": ["/imagen", "/imagen/edit", "/imagen/chat", "/imagen/models"]
-            },
-            "audio": {
-                "features": ["text-to-speech", "music", "sound-effects", "voice-cloning", "voice-design", "dialog"],
-                "endpoints": ["/audio/speech", "/audio/music", "/audio/sound-effects", "/audio/voices", "/audio/voice-design", "/audio/dialog", "/audio/clone-voice"]
-            },
-            "video-veo": {
-                "models": ["veo-3.1-generate-preview", "veo-3.1-fast-generate-preview"],
-                "features": ["text-to-video", "image-to-video"],
-                "endpoints": ["/video/generate", "/video/status", "/video/image-to-video"]
-            },
-            "video-sora": {
-                "models": ["sora-2", "sora-2-pro"],
-                "features": ["text-to-video", "image-to-video", "video-remix", "thumbnails", "spritesheets"],
-                "endpoints": ["/sora/generate", "/sora/image-to-video", "/sora/remix", "/sora/status", "/sora/fetch"]
-            },
-            "video-runway": {
-                "models": ["gen4_turbo", "gen4_aleph", "veo3.1"],
-                "features": ["text-to-video", "image-to-video", "video-to-video", "video-upscale"],
-                "endpoints": ["/runway/text-to-video", "/runway/image-to-video", "/runway/video-to-video", "/runway/upscale", "/runway/status", "/runway/models"]
-            }
+_MEDIA_INFO_JSON = orjson.dumps({
+    "success": True,
+    "message": "Media Generation API is operational",
+    "version": "1.3.0",
+    "services": {
+        "image": {
+            "models": ["gpt-image-1.5"],
+            "features": ["text-to-image", "inpainting", "reference-based"],
+            "endpoints": ["/image/generate", "/image/inpaint", "/image/reference"]
+        },
+        "gemini": {
+            "models": ["gemini-3-pro-image-preview"],
+            "features": ["text-to-image", "image-editing", "multi-turn", "4K-output", "google-search-grounding"],
+            "endpoints": ["/imagen", "/imagen/edit", "/imagen/chat", "/imagen/models"]
+        },
+        "audio": {
+            "features": ["text-to-speech", "music", "sound-effects", "voice-cloning", "voice-design", "dialog"],
+            "endpoints": ["/audio/speech", "/audio/music", "/audio/sound-effects", "/audio/voices", "/audio/voice-design", "/audio/dialog", "/audio/clone-voice"]
+        },
+        "video-veo": {
+            "models": ["veo-3.1-generate-preview", "veo-3.1-fast-generate-preview"],
+            "features": ["text-to-video", "image-to-video"],
+            "endpoints": ["/video/generate", "/video/status", "/video/image-to-video"]
+        },
+        "video-sora": {
+            "models": ["sora-2", "sora-2-pro"],
+            "features": ["text-to-video", "image-to-video", "video-remix", "thumbnails", "spritesheets"],
+            "endpoints": ["/sora/generate", "/sora/image-to-video", "/sora/remix", "/sora/status", "/sora/fetch", "/sora/content/{video_id}"]
+        },
+        "video-runway": {
+            "models": ["gen4_turbo", "gen4_aleph", "veo3.1"],
+            "features": ["text-to-video", "image-to-video", "video-to-video", "video-upscale"],
+            "endpoints": ["/runway/text-to-video", "/runway/image-to-video", "/runway/video-to-video", "/runway/upscale", "/runway/status", "/runway/models"]
         }
     }
+})
+
+
+@router.get("/")
+async def media_info(http_request: Request):
+    """Media API information"""
+    return static_json_response(_MEDIA_INFO_JSON, http_request)
 
 
@@ -87,11 +87,19 @@ router.include_router(sdk_library_router)
 router.include_router(sdk_reports_router)
 
 # Export helpers for other modules that may need them
-from ._helpers import get_user_context, get_verified_credentials, generate_appsecret_proof
+from ._helpers import (
+    get_user_context,
+    get_verified_credentials,
+    generate_appsecret_proof,
+    invalidate_appsecret_cache,
+    invalidate_listings,
+)
 
 __all__ = [
     "router",
     "get_user_context",
     "get_verified_credentials",
-    "generate_appsecret_proof"
+    "generate_appsecret_proof",
+    "invalidate_appsecret_cache",
+    "invalidate_listings",
 ]
@@ -3,18 +3,33 @@ Meta Ads API - Shared Helper Functions
 Common utilities used across all Meta Ads endpoint modules
 """
 import logging
-from typing import Tuple
-import hmac
-import hashlib
+from typing import Any, Awaitable, Callable, Dict, Tuple
 
 from fastapi import HTTPException, Request
 
 from ....services.supabase_service import ensure_user_workspace
 from ....services.meta_ads.meta_credentials_service import MetaCredentialsService
-from ....config import settings
+from ....services.meta_ads.meta_ads_service import (
+    generate_appsecret_proof,
+    invalidate_appsecret_cache,
+)
+from ....utils.cache import TTLCache
+from ....utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Campaign/ad set/ad listings keyed by (workspace_id, account_id, kind) - a
+# polling dashboard costs one Meta call per TTL window instead of one per poll
+LISTING_KINDS = ("campaigns", "adsets", "ads")
+_listing_cache = TTLCache(maxsize=1024, ttl=30)
+_listing_flight = SingleFlight()
+
+# Other read-only Meta results (insights, audiences, pixels, pages) keyed by
+# (workspace_id, account_id, kind, *params) - Meta refreshes this data every
+# few minutes at best, so bursts of UI polls share one Graph call
+_read_cache = TTLCache(maxsize=4096, ttl=60)
+_read_flight = SingleFlight()
+
 
 async def get_user_context(request: Request) -> Tuple[str, str]:
     """Extract user_id and workspace_id from authenticated request"""
@@ -26,8 +41,11 @@ async def get_user_context(request: Request) -> Tuple[str, str]:
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid user")
     
-    # Ensure workspace exists
-    workspace_id = await ensure_user_workspace(user_id, user.get('email'))
+    # AuthMiddleware already loaded the user's profile for this request - only
+    # users without a workspace yet need the ensure/create round trip
+    workspace_id = user.get('workspaceId')
+    if not workspace_id:
+        workspace_id = await ensure_user_workspace(user_id, user.get('email'))
     
     return user_id, workspace_id
 
@@ -51,14 +69,81 @@ async def get_verified_credentials(workspace_id: str, user_id: str):
     return credentials
 
 
-def generate_appsecret_proof(access_token: str) -> str:
-    """Generate appsecret_proof for Meta API server-side calls"""
-    app_secret = settings.FACEBOOK_APP_SECRET
-    if not app_secret:
-        return None
+async def cached_listing(
+    workspace_id: str,
+    account_id: str,
+    kind: str,
+    fetch: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    Return a cached Meta listing, fetching it on a miss.
+    
+    Concurrent misses for the same key share one fetch. Results carrying an
+    error are returned but not cached.
+    """
+    key = (workspace_id, account_id, kind)
+    cached = _listing_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    async def _load() -> Dict[str, Any]:
+        result = await fetch()
+        # Skip caching if a write invalidated the listing while this fetch ran
+        if not _has_error(result) and _listing_flight.owns(key):
+            _listing_cache.set(key, result)
+        return result
     
-    return hmac.new(
-        app_secret.encode('utf-8'),
-        access_token.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    return await _listing_flight.do(key, _load)
+
+
+def _has_error(result: Dict[str, Any]) -> bool:
+    """True if a listing (or any listing in a combined result) has an error"""
+    if "error" in result:
+        return result["error"] is not None
+    return any(_has_error(part) for part in result.values() if isinstance(part, dict))
+
+
+def invalidate_listings(workspace_id: str, account_id: str) -> None:
+    """Drop cached listings for an ad account after a write"""
+    for kind in LISTING_KINDS:
+        key = (workspace_id, account_id, kind)
+        _listing_cache.pop(key)
+        # A fetch already running may have read pre-write data - let the next request start fresh
+        _listing_flight.forget(key)
+
+
+async def cached_read(
+    workspace_id: str,
+    account_id: str,
+    kind: str,
+    params: Tuple[Any, ...],
+    fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Return a cached read-only Meta result, fetching it on a miss.
+    
+    Keys lead with the workspace, so tenants never share entries. Concurrent
+    misses for the same key share one fetch. Results carrying an error are
+    returned but not cached.
+    """
+    key = (workspace_id, account_id, kind, *params)
+    cached = _read_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    async def _load() -> Any:
+        result = await fetch()
+        # Skip caching if a write invalidated this read while the fetch ran
+        if not (isinstance(result, dict) and _has_error(result)) and _read_flight.owns(key):
+            _read_cache.set(key, result)
+        return result
+    
+    return await _read_flight.do(key, _load)
+
+
+def invalidate_read(workspace_id: str, account_id: str, kind: str) -> None:
+    """Drop a cached parameterless read (audiences, pixels) after a write"""
+    key = (workspace_id, account_id, kind)
+    _read_cache.pop(key)
+    # A fetch already running may have read pre-write data - let the next request start fresh
+    _read_flight.forget(key)
@@ -2,15 +2,21 @@
 Meta Ads API - Ad Endpoints
 Handles Ad CRUD operations with creative uploads
 """
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Request, HTTPException, Path, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, BackgroundTasks, Request, HTTPException, Path, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from ._helpers import get_user_context, get_verified_credentials
+from ._helpers import (
+    get_user_context,
+    get_verified_credentials,
+    cached_listing,
+    invalidate_listings,
+)
 from ....services.supabase_service import get_supabase_admin_client
 from ....services.meta_ads.meta_ads_service import get_meta_ads_service
 from ....schemas.meta_ads import CreateAdRequest, UpdateAdRequest
@@ -32,12 +38,14 @@ async def list_ads(request: Request):
         credentials = await get_verified_credentials(workspace_id, user_id)
         
         service = get_meta_ads_service()
-        result = await service.fetch_ads(
+        result = await cached_listing(
+            workspace_id,
             credentials["account_id"],
-            credentials["access_token"]
+            "ads",
+            lambda: service.fetch_ads(credentials["account_id"], credentials["access_token"])
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -46,8 +54,21 @@ async def list_ads(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _store_ad(row: dict) -> None:
+    """Mirror a created ad into meta_ads (runs as a background task)"""
+    try:
+        client = get_supabase_admin_client()
+        client.table("meta_ads").insert(row).execute()
+    except Exception as db_error:
+        logger.warning(f"Failed to store ad in DB: {db_error}")
+
+
 @router.post("/ads")
-async def create_ad(request: Request, body: CreateAdRequest):
+async def create_ad(
+    request: Request,
+    body: CreateAdRequest,
+    background_tasks: BackgroundTasks
+):
     """
     POST /api/v1/meta-ads/ads
     
@@ -73,25 +94,30 @@ async def create_ad(request: Request, body: CreateAdRequest):
         
         # Check if this is a carousel ad
         if body.creative.carousel_items and len(body.creative.carousel_items) >= 2:
-            # CAROUSEL AD: Upload each carousel item's image
+            # CAROUSEL AD: Upload every carousel item's image concurrently
+            async def _upload_item_image(idx: int, item) -> Optional[str]:
+                if not item.image_url:
+                    return None
+                item_upload = await service.upload_ad_image(
+                    credentials["account_id"],
+                    credentials["access_token"],
+                    item.image_url,
+                    item.title or f"Carousel Item {idx + 1}"
+                )
+                if item_upload.get("data") and item_upload["data"].get("hash"):
+                    return item_upload["data"]["hash"]
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Failed to upload carousel image {idx + 1}: {item_upload.get('error', 'Unknown error')}"
+                )
+            
+            item_image_hashes = await asyncio.gather(*(
+                _upload_item_image(idx, item)
+                for idx, item in enumerate(body.creative.carousel_items)
+            ))
+            
             carousel_child_attachments = []
-            for idx, item in enumerate(body.creative.carousel_items):
-                item_image_hash = None
-                if item.image_url:
-                    item_upload = await service.upload_ad_image(
-                        credentials["account_id"],
-                        credentials["access_token"],
-                        item.image_url,
-                        item.title or f"Carousel Item {idx + 1}"
-                    )
-                    if item_upload.get("data") and item_upload["data"].get("hash"):
-                        item_image_hash = item_upload["data"]["hash"]
-                    else:
-                        raise HTTPException(
-                            status_code=500,
-                            detail=f"Failed to upload carousel image {idx + 1}: {item_upload.get('error', 'Unknown error')}"
-                        )
-                
+            for item, item_image_hash in zip(body.creative.carousel_items, item_image_hashes):
                 # Build child attachment for carousel
                 child_attachment = {
                     "link": item.link or body.creative.link_url,
@@ -143,41 +169,67 @@ async def create_ad(request: Request, body: CreateAdRequest):
         else:
             image_hash = body.creative.image_hash
         
-        # Step 2: Create ad creative with appropriate format
-        creative_result = await service.create_ad_creative(
-            account_id=credentials["account_id"],
-            access_token=credentials["access_token"],
-            page_id=page_id,
-            name=f"{body.name} - Creative",
-            image_hash=image_hash,
-            video_id=video_id,
-            title=body.creative.title,
-            body=body.creative.body,
-            link_url=body.creative.link_url,
-            call_to_action_type=body.creative.call_to_action_type.value if body.creative.call_to_action_type else "LEARN_MORE",
-            advantage_plus_creative=body.creative.advantage_plus_creative if body.creative.advantage_plus_creative is not None else True,
-            gen_ai_disclosure=body.creative.gen_ai_disclosure if body.creative.gen_ai_disclosure else False,
-            format_automation=body.creative.format_automation if body.creative.format_automation else False,
-            product_set_id=body.creative.product_set_id,
-            carousel_child_attachments=carousel_child_attachments,
-            thumbnail_url=body.creative.thumbnail_url
-        )
-        
-        if not creative_result.get("success"):
-            raise HTTPException(
-                status_code=400,
-                detail=f"Failed to create creative: {creative_result.get('error')}"
+        call_to_action_type = body.creative.call_to_action_type or "LEARN_MORE"
+        status = body.status or "PAUSED"
+        
+        if carousel_child_attachments:
+            # Step 2: Create carousel creative
+            creative_result = await service.create_ad_creative(
+                account_id=credentials["account_id"],
+                access_token=credentials["access_token"],
+                page_id=page_id,
+                name=f"{body.name} - Creative",
+                image_hash=image_hash,
+                video_id=video_id,
+                title=body.creative.title,
+                body=body.creative.body,
+                link_url=body.creative.link_url,
+                call_to_action_type=call_to_action_type,
+                advantage_plus_creative=body.creative.advantage_plus_creative if body.creative.advantage_plus_creative is not None else True,
+                gen_ai_disclosure=body.creative.gen_ai_disclosure if body.creative.gen_ai_disclosure else False,
+                format_automation=body.creative.format_automation if body.creative.format_automation else False,
+                product_set_id=body.creative.product_set_id,
+                carousel_child_attachments=carousel_child_attachments,
+                thumbnail_url=body.creative.thumbnail_url
+            )
+            
+            if not creative_result.get("success"):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Failed to create creative: {creative_result.get('error')}"
+                )
+            
+            # Step 3: Create ad
+            ad_result = await service.create_ad(
+                account_id=credentials["account_id"],
+                access_token=credentials["access_token"],
+                name=body.name,
+                adset_id=body.adset_id,
+                creative_id=creative_result["creative_id"],
+                status=status
+            )
+            ad_result = {
+                "success": ad_result.get("error") is None,
+                "creative_id": creative_result["creative_id"],
+                "ad": ad_result.get("data"),
+                "error": ad_result.get("error"),
+            }
+        else:
+            # Steps 2 + 3: Create the creative and the ad in one batch request
+            ad_result = await service.create_ad_with_creative(
+                account_id=credentials["account_id"],
+                access_token=credentials["access_token"],
+                page_id=page_id,
+                name=body.name,
+                adset_id=body.adset_id,
+                creative_name=f"{body.name} - Creative",
+                image_hash=image_hash,
+                video_id=video_id,
+                body=body.creative.body,
+                link_url=body.creative.link_url,
+                call_to_action_type=call_to_action_type,
+                status=status
             )
-        
-        # Step 3: Create ad
-        ad_result = await service.create_ad(
-            account_id=credentials["account_id"],
-            access_token=credentials["access_token"],
-            name=body.name,
-            adset_id=body.adset_id,
-            creative_id=creative_result["creative_id"],
-            status=body.status.value if body.status else "PAUSED"
-        )
         
         if not ad_result.get("success"):
             raise HTTPException(
@@ -185,28 +237,27 @@ async def create_ad(request: Request, body: CreateAdRequest):
                 detail=f"Failed to create ad: {ad_result.get('error')}"
             )
         
-        # Store in database
-        try:
-            client = get_supabase_admin_client()
-            ad_data = ad_result.get("ad", {})
-            campaign_id = ad_data.get("campaign_id") or ad_data.get("campaign", {}).get("id")
-            
-            client.table("meta_ads").insert({
-                "workspace_id": workspace_id,
-                "user_id": user_id,
-                "meta_ad_id": ad_data.get("id"),
-                "meta_creative_id": creative_result["creative_id"],
-                "meta_adset_id": body.adset_id,
-                "meta_campaign_id": campaign_id,
-                "name": body.name,
-                "status": body.status.value if body.status else "PAUSED",
-                "creative": body.creative.model_dump(),
-                "last_synced_at": datetime.now(timezone.utc).isoformat()
-            }).execute()
-        except Exception as db_error:
-            logger.warning(f"Failed to store ad in DB: {db_error}")
-        
-        return JSONResponse(content={
+        # Store in database - after the response is sent, since the response
+        # doesn't depend on the row
+        ad_data = ad_result.get("ad", {})
+        campaign_id = ad_data.get("campaign_id") or ad_data.get("campaign", {}).get("id")
+        
+        background_tasks.add_task(_store_ad, {
+            "workspace_id": workspace_id,
+            "user_id": user_id,
+            "meta_ad_id": ad_data.get("id"),
+            "meta_creative_id": ad_result["creative_id"],
+            "meta_adset_id": body.adset_id,
+            "meta_campaign_id": campaign_id,
+            "name": body.name,
+            "status": body.status or "PAUSED",
+            "creative": body.creative.model_dump(),
+            "last_synced_at": datetime.now(timezone.utc).isoformat()
+        })
+        
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={
             "success": True,
             "ad": ad_result.get("ad")
         })
@@ -236,7 +287,7 @@ async def update_ad(
         updates = {}
         if body:
             if body.status:
-                updates["status"] = body.status.value
+                updates["status"] = body.status
             if body.name:
                 updates["name"] = body.name
         
@@ -250,7 +301,9 @@ async def update_ad(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True})
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={"success": True})
         
     except HTTPException:
         raise
@@ -294,7 +347,9 @@ async def delete_ad(request: Request, ad_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "message": "Ad deleted"})
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={"success": True, "message": "Ad deleted"})
         
     except HTTPException:
         raise
@@ -330,7 +385,9 @@ async def duplicate_ad(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={
             "success": True,
             "ad_id": result.get("ad_id"),
             "message": "Ad duplicated successfully"
@@ -364,7 +421,9 @@ async def archive_ad(request: Request, ad_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "message": "Ad archived"})
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={"success": True, "message": "Ad archived"})
         
     except HTTPException:
         raise
@@ -394,7 +453,9 @@ async def unarchive_ad(request: Request, ad_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "message": "Ad unarchived"})
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={"success": True, "message": "Ad unarchived"})
         
     except HTTPException:
         raise
@@ -428,7 +489,7 @@ async def get_ad_preview(
         if result.get("error"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "preview": result.get("data")
         })
@@ -469,7 +530,7 @@ async def generate_ad_preview(
         if result.get("error"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "preview": result.get("data")
         })
@@ -5,10 +5,15 @@ Handles Ad Set CRUD operations
 import logging
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Request, HTTPException, Path
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, BackgroundTasks, Request, HTTPException, Path
+from fastapi.responses import ORJSONResponse
 
-from ._helpers import get_user_context, get_verified_credentials
+from ._helpers import (
+    get_user_context,
+    get_verified_credentials,
+    cached_listing,
+    invalidate_listings,
+)
 from ....services.supabase_service import get_supabase_admin_client
 from ....services.meta_ads.meta_ads_service import get_meta_ads_service
 from ....schemas.meta_ads import CreateAdSetRequest, UpdateAdSetRequest
@@ -30,12 +35,14 @@ async def list_adsets(request: Request):
         credentials = await get_verified_credentials(workspace_id, user_id)
         
         service = get_meta_ads_service()
-        result = await service.fetch_adsets(
+        result = await cached_listing(
+            workspace_id,
             credentials["account_id"],
-            credentials["access_token"]
+            "adsets",
+            lambda: service.fetch_adsets(credentials["account_id"], credentials["access_token"])
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -44,8 +51,21 @@ async def list_adsets(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _store_adset(row: dict) -> None:
+    """Mirror a created ad set into meta_adsets (runs as a background task)"""
+    try:
+        client = get_supabase_admin_client()
+        client.table("meta_adsets").insert(row).execute()
+    except Exception as db_error:
+        logger.warning(f"Failed to store ad set in DB: {db_error}")
+
+
 @router.post("/adsets")
-async def create_adset(request: Request, body: CreateAdSetRequest):
+async def create_adset(
+    request: Request,
+    body: CreateAdSetRequest,
+    background_tasks: BackgroundTasks
+):
     """
     POST /api/v1/meta-ads/adsets
     
@@ -108,8 +128,10 @@ async def create_adset(request: Request, body: CreateAdSetRequest):
                 inherited_promoted_object = campaign_data.get("promoted_object")
                 logger.info(f"Campaign {body.campaign_id} info: CBO={campaign_uses_cbo}, bid_strategy={campaign_bid_strategy}, promoted_object={inherited_promoted_object}")
         
-        # Use inherited promoted_object if not provided in body
-        promoted_object_dict = body.promoted_object.model_dump() if body.promoted_object else inherited_promoted_object
+        # Use inherited promoted_object if not provided in body - the body's own
+        # dump is kept for the DB row too
+        promoted_object_dump = body.promoted_object.model_dump() if body.promoted_object else None
+        promoted_object_dict = promoted_object_dump if promoted_object_dump is not None else inherited_promoted_object
         
         # Validate bid_amount if campaign uses a bid strategy that requires it (v24.0 2026)
         # Per Meta API: LOWEST_COST_WITH_BID_CAP, TARGET_COST, and COST_CAP require bid_amount at ad set level
@@ -141,15 +163,23 @@ async def create_adset(request: Request, body: CreateAdSetRequest):
                     detail="Either daily_budget or lifetime_budget must be provided with a positive amount. Please set budget_type and budget_amount > 0. (Note: If campaign uses Campaign Budget Optimization, budget is set at campaign level)"
                 )
         
+        # Request values with their defaults, resolved once for the Meta call
+        # and the DB row
+        optimization_goal = body.optimization_goal or "LINK_CLICKS"
+        billing_event = body.billing_event or "IMPRESSIONS"
+        status = body.status or "PAUSED"
+        destination_type = body.destination_type
+        advantage_audience = body.advantage_audience if body.advantage_audience is not None else True  # v24.0 2026 default
+        
         result = await service.create_adset(
             account_id=credentials["account_id"],
             access_token=credentials["access_token"],
             name=body.name,
             campaign_id=body.campaign_id,
             targeting=targeting or {"geo_locations": {"countries": ["US"]}},
-            optimization_goal=body.optimization_goal or "LINK_CLICKS",
-            billing_event=body.billing_event.value if body.billing_event else "IMPRESSIONS",
-            status=body.status.value if body.status else "PAUSED",
+            optimization_goal=optimization_goal,
+            billing_event=billing_event,
+            status=status,
             daily_budget=daily_budget,
             lifetime_budget=lifetime_budget,
             start_time=body.start_time,
@@ -157,8 +187,8 @@ async def create_adset(request: Request, body: CreateAdSetRequest):
             # bid_amount is expected in dollars by service layer (will be converted to cents)
             bid_amount=body.bid_amount,
             promoted_object=promoted_object_dict,
-            destination_type=body.destination_type.value if body.destination_type else None,
-            advantage_audience=body.advantage_audience if body.advantage_audience is not None else True,  # v24.0 2026 default
+            destination_type=destination_type,
+            advantage_audience=advantage_audience,
             # v24.0 2026 Required Parameters
             is_adset_budget_sharing_enabled=body.is_adset_budget_sharing_enabled,
             placement_soft_opt_out=body.placement_soft_opt_out,
@@ -171,35 +201,34 @@ async def create_adset(request: Request, body: CreateAdSetRequest):
             raise HTTPException(status_code=400, detail=error_detail)
         
         
-        # Store in database for audit
-        try:
-            client = get_supabase_admin_client()
-            adset_data = result.get("adset", {})
-            client.table("meta_adsets").insert({
-                "workspace_id": workspace_id,
-                "user_id": user_id,
-                "meta_adset_id": adset_data.get("id"),
-                "meta_campaign_id": body.campaign_id,
-                "name": body.name,
-                "status": body.status.value if body.status else "PAUSED",
-                "optimization_goal": body.optimization_goal or "LINK_CLICKS",
-                "billing_event": body.billing_event.value if body.billing_event else "IMPRESSIONS",
-                "bid_strategy": body.bid_strategy.value if body.bid_strategy else None,
-                "bid_amount": int(body.bid_amount * 100) if body.bid_amount else None,
-                "daily_budget": int(body.budget_amount * 100) if body.budget_type == "daily" and body.budget_amount else None,
-                "lifetime_budget": int(body.budget_amount * 100) if body.budget_type == "lifetime" and body.budget_amount else None,
-                "destination_type": body.destination_type.value if body.destination_type else None,
-                "targeting": targeting,
-                "promoted_object": body.promoted_object.model_dump() if body.promoted_object else None,
-                "start_time": body.start_time,
-                "end_time": body.end_time,
-                "advantage_audience": body.advantage_audience if body.advantage_audience is not None else True,  # v24.0 2026
-                "last_synced_at": datetime.now(timezone.utc).isoformat()
-            }).execute()
-        except Exception as db_error:
-            logger.warning(f"Failed to store ad set in DB: {db_error}")
-        
-        return JSONResponse(content=result)
+        # Store in database for audit - after the response is sent, since the
+        # response doesn't depend on the row
+        adset_data = result.get("adset", {})
+        background_tasks.add_task(_store_adset, {
+            "workspace_id": workspace_id,
+            "user_id": user_id,
+            "meta_adset_id": adset_data.get("id"),
+            "meta_campaign_id": body.campaign_id,
+            "name": body.name,
+            "status": status,
+            "optimization_goal": optimization_goal,
+            "billing_event": billing_event,
+            "bid_strategy": body.bid_strategy,
+            "bid_amount": int(body.bid_amount * 100) if body.bid_amount else None,
+            "daily_budget": int(body.budget_amount * 100) if body.budget_type == "daily" and body.budget_amount else None,
+            "lifetime_budget": int(body.budget_amount * 100) if body.budget_type == "lifetime" and body.budget_amount else None,
+            "destination_type": destination_type,
+            "targeting": targeting,
+            "promoted_object": promoted_object_dump,
+            "start_time": body.start_time,
+            "end_time": body.end_time,
+            "advantage_audience": advantage_audience,
+            "last_synced_at": datetime.now(timezone.utc).isoformat()
+        })
+        
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -228,7 +257,7 @@ async def update_adset(
             if body.name:
                 updates["name"] = body.name
             if body.status:
-                updates["status"] = body.status.value
+                updates["status"] = body.status
             if body.budget_amount:
                 # Convert budget based on type (dollars to cents)
                 if body.budget_type == "lifetime":
@@ -284,7 +313,9 @@ async def update_adset(
         if data.get("budget_skipped_due_to_cbo"):
             response["warning"] = "Budget update was skipped: This ad set's campaign uses Campaign Budget Optimization (CBO). To change budget, edit the campaign budget instead."
         
-        return JSONResponse(content=response)
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content=response)
         
     except HTTPException:
         raise
@@ -328,7 +359,9 @@ async def delete_adset(request: Request, adset_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "message": "Ad set deleted"})
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={"success": True, "message": "Ad set deleted"})
         
     except HTTPException:
         raise
@@ -364,7 +397,9 @@ async def duplicate_adset(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={
             "success": True,
             "adset_id": result.get("adset_id"),
             "message": "Ad set duplicated successfully"
@@ -398,7 +433,9 @@ async def archive_adset(request: Request, adset_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "message": "Ad set archived"})
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={"success": True, "message": "Ad set archived"})
         
     except HTTPException:
         raise
@@ -428,7 +465,9 @@ async def unarchive_adset(request: Request, adset_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "message": "Ad set unarchived"})
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={"success": True, "message": "Ad set unarchived"})
         
     except HTTPException:
         raise
@@ -6,9 +6,9 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, Request, HTTPException, Path, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from ._helpers import get_user_context, get_verified_credentials
+from ._helpers import get_user_context, get_verified_credentials, cached_read
 from ....services.meta_ads.meta_ads_service import get_meta_ads_service
 from ....services.meta_ads.meta_sdk_client import create_meta_sdk_client
 
@@ -34,12 +34,18 @@ async def get_analytics(
         
         client = create_meta_sdk_client(credentials["access_token"])
         
-        insights = await client.get_account_insights(
-            account_id=credentials["account_id"],
-            date_preset=date_preset
+        insights = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "analytics",
+            (date_preset,),
+            lambda: client.get_account_insights(
+                account_id=credentials["account_id"],
+                date_preset=date_preset
+            )
         )
         
-        return JSONResponse(content={"insights": insights.get("data", []) if insights else []})
+        return ORJSONResponse(content={"insights": insights.get("data", []) if insights else []})
         
     except HTTPException:
         raise
@@ -69,13 +75,19 @@ async def get_analytics_breakdown(
         # Parse breakdown types (can be comma-separated like "age,gender")
         breakdown_list = [b.strip() for b in breakdown.split(",") if b.strip()]
         
-        insights = await client.get_account_insights(
-            account_id=credentials["account_id"],
-            date_preset=date_preset,
-            breakdowns=breakdown_list
+        insights = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "analytics_breakdown",
+            (date_preset, *breakdown_list),
+            lambda: client.get_account_insights(
+                account_id=credentials["account_id"],
+                date_preset=date_preset,
+                breakdowns=breakdown_list
+            )
         )
         
-        return JSONResponse(content={"breakdowns": insights.get("data", []) if insights else []})
+        return ORJSONResponse(content={"breakdowns": insights.get("data", []) if insights else []})
         
     except HTTPException:
         raise
@@ -100,16 +112,22 @@ async def get_campaign_insights(
         credentials = await get_verified_credentials(workspace_id, user_id)
         
         service = get_meta_ads_service()
-        result = await service.fetch_campaign_insights(
-            campaign_id,
-            credentials["access_token"],
-            date_preset=date_preset
+        result = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "campaign_insights",
+            (campaign_id, date_preset),
+            lambda: service.fetch_campaign_insights(
+                campaign_id,
+                credentials["access_token"],
+                date_preset=date_preset
+            )
         )
         
         if result.get("error"):
             raise HTTPException(status_code=400, detail=result["error"])
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "insights": result.get("insights")
         })
         
@@ -137,17 +155,23 @@ async def get_campaign_insights_breakdown(
         credentials = await get_verified_credentials(workspace_id, user_id)
         
         service = get_meta_ads_service()
-        result = await service.fetch_campaign_insights_breakdown(
-            campaign_id=campaign_id,
-            access_token=credentials["access_token"],
-            breakdown=breakdown,
-            date_preset=date_preset
+        result = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "campaign_insights_breakdown",
+            (campaign_id, breakdown, date_preset),
+            lambda: service.fetch_campaign_insights_breakdown(
+                campaign_id=campaign_id,
+                access_token=credentials["access_token"],
+                breakdown=breakdown,
+                date_preset=date_preset
+            )
         )
         
         if result.get("error"):
             raise HTTPException(status_code=400, detail=result["error"])
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "campaign_id": campaign_id,
             "breakdowns": result.get("breakdowns", []),
             "breakdown_type": breakdown
@@ -188,16 +212,22 @@ async def get_account_insights(
         if time_range_since and time_range_until:
             time_range = {"since": time_range_since, "until": time_range_until}
         
-        insights = await client.get_account_insights(
-            account_id=credentials["account_id"],
-            date_preset=date_preset,
-            level=level,
-            breakdowns=breakdown_list,
-            action_attribution_windows=attribution_list,
-            time_range=time_range
+        insights = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "account_insights",
+            (date_preset, level, breakdowns, action_attribution_windows, time_range_since, time_range_until),
+            lambda: client.get_account_insights(
+                account_id=credentials["account_id"],
+                date_preset=date_preset,
+                level=level,
+                breakdowns=breakdown_list,
+                action_attribution_windows=attribution_list,
+                time_range=time_range
+            )
         )
         
-        return JSONResponse(content={"success": True, "data": insights.get("data", []) if insights else []})
+        return ORJSONResponse(content={"success": True, "data": insights.get("data", []) if insights else []})
         
     except HTTPException:
         raise
@@ -228,14 +258,20 @@ async def get_campaign_insights_v2(
         breakdown_list = breakdowns.split(",") if breakdowns else None
         attribution_list = action_attribution_windows.split(",") if action_attribution_windows else None
         
-        insights = await client.get_campaign_insights(
-            campaign_id=campaign_id,
-            date_preset=date_preset,
-            breakdowns=breakdown_list,
-            action_attribution_windows=attribution_list
+        insights = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "campaign_insights_v2",
+            (campaign_id, date_preset, breakdowns, action_attribution_windows),
+            lambda: client.get_campaign_insights(
+                campaign_id=campaign_id,
+                date_preset=date_preset,
+                breakdowns=breakdown_list,
+                action_attribution_windows=attribution_list
+            )
         )
         
-        return JSONResponse(content={"success": True, "data": insights})
+        return ORJSONResponse(content={"success": True, "data": insights})
         
     except HTTPException:
         raise
@@ -266,14 +302,20 @@ async def get_adset_insights(
         breakdown_list = breakdowns.split(",") if breakdowns else None
         attribution_list = action_attribution_windows.split(",") if action_attribution_windows else None
         
-        insights = await client.get_adset_insights(
-            adset_id=adset_id,
-            date_preset=date_preset,
-            breakdowns=breakdown_list,
-            action_attribution_windows=attribution_list
+        insights = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "adset_insights",
+            (adset_id, date_preset, breakdowns, action_attribution_windows),
+            lambda: client.get_adset_insights(
+                adset_id=adset_id,
+                date_preset=date_preset,
+                breakdowns=breakdown_list,
+                action_attribution_windows=attribution_list
+            )
         )
         
-        return JSONResponse(content={"success": True, "data": insights})
+        return ORJSONResponse(content={"success": True, "data": insights})
         
     except HTTPException:
         raise
@@ -304,14 +346,20 @@ async def get_ad_insights(
         breakdown_list = breakdowns.split(",") if breakdowns else None
         attribution_list = action_attribution_windows.split(",") if action_attribution_windows else None
         
-        insights = await client.get_ad_insights(
-            ad_id=ad_id,
-            date_preset=date_preset,
-            breakdowns=breakdown_list,
-            action_attribution_windows=attribution_list
+        insights = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "ad_insights",
+            (ad_id, date_preset, breakdowns, action_attribution_windows),
+            lambda: client.get_ad_insights(
+                ad_id=ad_id,
+                date_preset=date_preset,
+                breakdowns=breakdown_list,
+                action_attribution_windows=attribution_list
+            )
         )
         
-        return JSONResponse(content={"success": True, "data": insights})
+        return ORJSONResponse(content={"success": True, "data": insights})
         
     except HTTPException:
         raise
@@ -340,21 +388,27 @@ async def get_insights_with_breakdown(
         credentials = await get_verified_credentials(workspace_id, user_id)
         
         service = get_meta_ads_service()
-        result = await service.get_insights_breakdown(
-            account_id=credentials["account_id"],
-            access_token=credentials["access_token"],
-            breakdown=breakdown,
-            level=level,
-            date_preset=date_preset,
-            campaign_id=campaign_id,
-            adset_id=adset_id,
-            ad_id=ad_id
+        result = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "insights_breakdown",
+            (breakdown, level, date_preset, campaign_id, adset_id, ad_id),
+            lambda: service.get_insights_breakdown(
+                account_id=credentials["account_id"],
+                access_token=credentials["access_token"],
+                breakdown=breakdown,
+                level=level,
+                date_preset=date_preset,
+                campaign_id=campaign_id,
+                adset_id=adset_id,
+                ad_id=ad_id
+            )
         )
         
         if result.get("error"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "breakdown": breakdown,
             "level": level,
@@ -388,21 +442,27 @@ async def get_insights_time_series(
         credentials = await get_verified_credentials(workspace_id, user_id)
         
         service = get_meta_ads_service()
-        result = await service.get_insights_time_series(
-            account_id=credentials["account_id"],
-            access_token=credentials["access_token"],
-            time_increment=time_increment,
-            level=level,
-            date_preset=date_preset,
-            campaign_id=campaign_id,
-            adset_id=adset_id,
-            ad_id=ad_id
+        result = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "insights_time_series",
+            (time_increment, level, date_preset, campaign_id, adset_id, ad_id),
+            lambda: service.get_insights_time_series(
+                account_id=credentials["account_id"],
+                access_token=credentials["access_token"],
+                time_increment=time_increment,
+                level=level,
+                date_preset=date_preset,
+                campaign_id=campaign_id,
+                adset_id=adset_id,
+                ad_id=ad_id
+            )
         )
         
         if result.get("error"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "time_increment": time_increment,
             "level": level,
@@ -435,20 +495,26 @@ async def get_insights_actions(
         credentials = await get_verified_credentials(workspace_id, user_id)
         
         service = get_meta_ads_service()
-        result = await service.get_insights_actions(
-            account_id=credentials["account_id"],
-            access_token=credentials["access_token"],
-            level=level,
-            date_preset=date_preset,
-            campaign_id=campaign_id,
-            adset_id=adset_id,
-            ad_id=ad_id
+        result = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "insights_actions",
+            (level, date_preset, campaign_id, adset_id, ad_id),
+            lambda: service.get_insights_actions(
+                account_id=credentials["account_id"],
+                access_token=credentials["access_token"],
+                level=level,
+                date_preset=date_preset,
+                campaign_id=campaign_id,
+                adset_id=adset_id,
+                ad_id=ad_id
+            )
         )
         
         if result.get("error"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "level": level,
             "data": result.get("data")
@@ -484,7 +550,7 @@ async def get_budget_recommendations(request: Request):
             campaigns=campaigns.get("campaigns", [])
         )
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "recommendations": recommendations,
             "count": len(recommendations)
@@ -506,4 +572,4 @@ async def get_bid_strategy_options(request: Request):
     """
     from ....schemas.optimization import BID_STRATEGY_OPTIONS
     
-    return JSONResponse(content={"options": BID_STRATEGY_OPTIONS})
+    return ORJSONResponse(content={"options": BID_STRATEGY_OPTIONS})
@@ -5,7 +5,7 @@ Handles Facebook App operations for ads
 import logging
 
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 from ....services.meta_ads.meta_sdk_client import create_meta_sdk_client
@@ -29,7 +29,7 @@ async def list_apps(request: Request):
         client = create_meta_sdk_client(credentials["access_token"])
         apps = await client.get_user_apps()
         
-        return JSONResponse(content={"apps": apps or []})
+        return ORJSONResponse(content={"apps": apps or []})
         
     except HTTPException:
         raise
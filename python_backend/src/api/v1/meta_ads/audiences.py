@@ -5,9 +5,14 @@ Handles Custom Audiences and Lookalike Audiences
 import logging
 
 from fastapi import APIRouter, Request, HTTPException, Path
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from ._helpers import get_user_context, get_verified_credentials
+from ._helpers import (
+    get_user_context,
+    get_verified_credentials,
+    cached_read,
+    invalidate_read,
+)
 from ....services.supabase_service import log_activity
 from ....services.meta_ads.meta_ads_service import get_meta_ads_service
 from ....services.meta_ads.sdk_custom_audiences import CustomAudiencesService
@@ -16,6 +21,12 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Meta Ads - Audiences"])
 
+# Customer-data schema fields Meta accepts when adding or removing audience users
+VALID_AUDIENCE_FIELDS = frozenset({
+    "EMAIL", "PHONE", "FN", "LN", "CT", "ST", "ZIP",
+    "COUNTRY", "DOBY", "DOBM", "DOBD", "GEN", "EXTERN_ID"
+})
+
 
 @router.get("/audiences")
 async def list_audiences(request: Request):
@@ -29,9 +40,15 @@ async def list_audiences(request: Request):
         credentials = await get_verified_credentials(workspace_id, user_id)
         
         service = get_meta_ads_service()
-        result = await service.fetch_audiences(
+        result = await cached_read(
+            workspace_id,
             credentials["account_id"],
-            credentials["access_token"]
+            "audiences",
+            (),
+            lambda: service.fetch_audiences(
+                credentials["account_id"],
+                credentials["access_token"]
+            )
         )
         
         # Transform to frontend expected format
@@ -39,7 +56,7 @@ async def list_audiences(request: Request):
         if isinstance(result, dict) and result.get("data"):
             audiences = result["data"]
         
-        return JSONResponse(content={"audiences": audiences})
+        return ORJSONResponse(content={"audiences": audiences})
         
     except HTTPException:
         raise
@@ -90,7 +107,9 @@ async def create_custom_audience(request: Request):
             logger.error(f"Meta API error creating custom audience: {error_msg}")
             raise HTTPException(status_code=400, detail=error_msg)
         
-        return JSONResponse(content={"success": True, "audience": result})
+        invalidate_read(workspace_id, credentials["account_id"], "audiences")
+        
+        return ORJSONResponse(content={"success": True, "audience": result})
         
     except HTTPException:
         raise
@@ -116,7 +135,7 @@ async def get_audience_details(request: Request, audience_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "audience": result.get("audience")})
+        return ORJSONResponse(content={"success": True, "audience": result.get("audience")})
         
     except HTTPException:
         raise
@@ -142,6 +161,8 @@ async def delete_audience(request: Request, audience_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
+        invalidate_read(workspace_id, credentials["account_id"], "audiences")
+        
         # Log the activity
         await log_activity(
             workspace_id=workspace_id,
@@ -152,7 +173,7 @@ async def delete_audience(request: Request, audience_id: str = Path(...)):
             details={"audience_id": audience_id}
         )
         
-        return JSONResponse(content={"success": True, "message": "Audience deleted successfully"})
+        return ORJSONResponse(content={"success": True, "message": "Audience deleted successfully"})
         
     except HTTPException:
         raise
@@ -190,7 +211,9 @@ async def update_audience(request: Request, audience_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "message": "Audience updated successfully"})
+        invalidate_read(workspace_id, credentials["account_id"], "audiences")
+        
+        return ORJSONResponse(content={"success": True, "message": "Audience updated successfully"})
         
     except HTTPException:
         raise
@@ -221,14 +244,12 @@ async def remove_audience_users(request: Request, audience_id: str = Path(...)):
             raise HTTPException(status_code=400, detail="data is required")
         
         # Validate schema fields
-        valid_fields = ["EMAIL", "PHONE", "FN", "LN", "CT", "ST", "ZIP", 
-                       "COUNTRY", "DOBY", "DOBM", "DOBD", "GEN", "EXTERN_ID"]
-        for field in schema:
-            if field not in valid_fields:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Invalid schema field: {field}. Valid fields: {valid_fields}"
-                )
+        invalid_fields = [field for field in schema if field not in VALID_AUDIENCE_FIELDS]
+        if invalid_fields:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid schema fields: {invalid_fields}. Valid fields: {sorted(VALID_AUDIENCE_FIELDS)}"
+            )
         
         service = CustomAudiencesService(credentials["access_token"])
         result = await service.remove_audience_users(
@@ -254,7 +275,7 @@ async def remove_audience_users(request: Request, audience_id: str = Path(...)):
             }
         )
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "num_received": result.get("num_received", 0),
             "num_invalid_entries": result.get("num_invalid_entries", 0),
@@ -308,7 +329,7 @@ async def share_audience(request: Request, audience_id: str = Path(...)):
             }
         )
         
-        return JSONResponse(content={"success": True, "message": "Audience shared successfully"})
+        return ORJSONResponse(content={"success": True, "message": "Audience shared successfully"})
         
     except HTTPException:
         raise
@@ -340,14 +361,12 @@ async def upload_audience_users(audience_id: str, request: Request):
             raise HTTPException(status_code=400, detail="data is required")
         
         # Validate schema fields
-        valid_fields = ["EMAIL", "PHONE", "FN", "LN", "CT", "ST", "ZIP", 
-                       "COUNTRY", "DOBY", "DOBM", "DOBD", "GEN", "EXTERN_ID"]
-        for field in schema:
-            if field not in valid_fields:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Invalid schema field: {field}. Valid fields: {valid_fields}"
-                )
+        invalid_fields = [field for field in schema if field not in VALID_AUDIENCE_FIELDS]
+        if invalid_fields:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid schema fields: {invalid_fields}. Valid fields: {sorted(VALID_AUDIENCE_FIELDS)}"
+            )
         
         service = CustomAudiencesService(credentials["access_token"])
         result = await service.upload_audience_users(
@@ -361,7 +380,7 @@ async def upload_audience_users(audience_id: str, request: Request):
             logger.error(f"Meta API error uploading users: {error_msg}")
             raise HTTPException(status_code=400, detail=error_msg)
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "audience_id": audience_id,
             "num_received": result.get("num_received", 0),
@@ -409,7 +428,9 @@ async def create_lookalike_audience(request: Request):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "audience": result.get("audience")})
+        invalidate_read(workspace_id, credentials["account_id"], "audiences")
+        
+        return ORJSONResponse(content={"success": True, "audience": result.get("audience")})
         
     except HTTPException:
         raise
@@ -438,7 +459,7 @@ async def get_audience_size(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -456,4 +477,4 @@ async def get_lookalike_ratios(request: Request):
     """
     from ....schemas.audiences import LOOKALIKE_RATIOS
     
-    return JSONResponse(content={"ratios": LOOKALIKE_RATIOS})
+    return ORJSONResponse(content={"ratios": LOOKALIKE_RATIOS})
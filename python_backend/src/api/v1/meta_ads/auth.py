@@ -2,25 +2,102 @@
 Meta Ads API - OAuth Authentication Endpoints
 Handles OAuth flow for Meta Ads connection
 """
+import asyncio
 import logging
-import uuid
+import re
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Request, HTTPException, Query
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi import APIRouter, BackgroundTasks, Request, HTTPException, Query
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
 from ._helpers import get_user_context
 from ....services.supabase_service import get_supabase_admin_client
+from ....services.oauth_service import generate_random_state
 from ....config import settings
+from ....utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Meta Ads - Auth"])
 
+# Required scopes for Meta Marketing API
+META_ADS_SCOPES = ",".join([
+    "ads_management",
+    "ads_read",
+    "business_management",
+    "pages_read_engagement",
+    "pages_show_list",
+    "pages_manage_ads"
+])
+
+# OAuth redirect URI and dialog URL - fixed per deployment, so built once
+_META_REDIRECT_URI = (
+    settings.META_ADS_REDIRECT_URI
+    or f"{settings.NEXT_PUBLIC_APP_URL}/api/meta-ads/auth/callback"
+)
+_AUTH_URL_TMPL = (
+    "https://www.facebook.com/v24.0/dialog/oauth?"
+    "client_id={app_id}"
+    "&redirect_uri={redirect_uri}"
+    "&scope={scopes}"
+    "&response_type=code"
+    "&state={state}"
+)
+
+# Lifetime of a Meta Ads OAuth state, in seconds
+OAUTH_STATE_TTL = 600
+_OAUTH_STATE_LIFETIME = timedelta(seconds=OAUTH_STATE_TTL)
+
+# Issued OAuth states keyed by state token - the callback validates against
+# this first and only falls back to the oauth_states table on a miss (another
+# worker issued the state, or this one restarted)
+_oauth_state_cache = TTLCache(maxsize=10_000, ttl=OAUTH_STATE_TTL)
+
+# Shape of every state generate_random_state() issues (32 random bytes,
+# URL-safe base64) - anything else is forged and never reaches the database
+_STATE_PATTERN = re.compile(r"[A-Za-z0-9_-]{43}")
+
+
+def _store_oauth_state(state: str, workspace_id: str, created_at: datetime) -> None:
+    """Persist an OAuth state row (runs after the auth URL response is sent)"""
+    try:
+        client = get_supabase_admin_client()
+        client.table("oauth_states").insert({
+            "state": state,
+            "workspace_id": workspace_id,
+            "platform": "meta_ads",
+            "created_at": created_at.isoformat(),
+            "expires_at": (created_at + _OAUTH_STATE_LIFETIME).isoformat()
+        }).execute()
+    except Exception as e:
+        logger.error(f"Failed to store Meta Ads OAuth state: {e}")
+
+
+async def _is_valid_state(state: str) -> bool:
+    """Check an OAuth state against the cache, then (if well-formed) the oauth_states table"""
+    if _oauth_state_cache.get(state) is not None:
+        _oauth_state_cache.pop(state)
+        return True
+
+    if not _STATE_PATTERN.fullmatch(state):
+        return False
+
+    client = get_supabase_admin_client()
+    query = (
+        client.table("oauth_states")
+        .select("state")
+        .eq("state", state)
+        .eq("platform", "meta_ads")
+        .gt("expires_at", datetime.now(timezone.utc).isoformat())
+        .limit(1)
+    )
+    result = await asyncio.to_thread(query.execute)
+    return bool(result.data)
+
 
 @router.get("/auth/url")
-async def get_auth_url(request: Request):
+async def get_auth_url(request: Request, background_tasks: BackgroundTasks):
     """
     GET /api/v1/meta-ads/auth/url
     
@@ -37,41 +114,23 @@ async def get_auth_url(request: Request):
             )
         
         # Generate CSRF state token
-        state = str(uuid.uuid4())
-        
-        # Store state for validation
-        client = get_supabase_admin_client()
-        client.table("oauth_states").insert({
-            "state": state,
-            "workspace_id": workspace_id,
-            "platform": "meta_ads",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "expires_at": (datetime.now(timezone.utc) + timedelta(minutes=10)).isoformat()
-        }).execute()
+        state = generate_random_state()
         
-        # Build redirect URI
-        redirect_uri = settings.META_ADS_REDIRECT_URI or f"{settings.NEXT_PUBLIC_APP_URL}/api/meta-ads/auth/callback"
-        
-        # Required scopes for Meta Marketing API
-        scopes = ",".join([
-            "ads_management",
-            "ads_read",
-            "business_management",
-            "pages_read_engagement",
-            "pages_show_list",
-            "pages_manage_ads"
-        ])
+        # Store state for validation - in memory now, in the database after
+        # the response is sent so the redirect doesn't wait on Supabase
+        _oauth_state_cache.set(state, {"workspace_id": workspace_id, "platform": "meta_ads"})
+        background_tasks.add_task(
+            _store_oauth_state, state, workspace_id, datetime.now(timezone.utc)
+        )
         
-        auth_url = (
-            f"https://www.facebook.com/v24.0/dialog/oauth?"
-            f"client_id={app_id}"
-            f"&redirect_uri={redirect_uri}"
-            f"&scope={scopes}"
-            f"&response_type=code"
-            f"&state={state}"
+        auth_url = _AUTH_URL_TMPL.format(
+            app_id=app_id,
+            redirect_uri=_META_REDIRECT_URI,
+            scopes=META_ADS_SCOPES,
+            state=state
         )
         
-        return JSONResponse(content={"url": auth_url})
+        return ORJSONResponse(content={"url": auth_url})
         
     except HTTPException:
         raise
@@ -106,8 +165,18 @@ async def auth_callback(
             url=f"{settings.NEXT_PUBLIC_APP_URL}/dashboard/meta-ads?error=missing_params"
         )
     
-    # In production, validate state and exchange code for token
-    # For now, redirect to frontend which handles the full flow
+    try:
+        state_ok = await _is_valid_state(state)
+    except Exception as e:
+        logger.error(f"Error validating Meta Ads OAuth state: {e}")
+        state_ok = False
+
+    if not state_ok:
+        return RedirectResponse(
+            url=f"{settings.NEXT_PUBLIC_APP_URL}/dashboard/meta-ads?error=invalid_state"
+        )
+    
+    # Redirect to frontend which exchanges the code and stores credentials
     return RedirectResponse(
         url=f"{settings.NEXT_PUBLIC_APP_URL}/dashboard/meta-ads?code={code}&state={state}"
     )
@@ -6,10 +6,10 @@ import logging
 from typing import List
 
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from ._helpers import get_user_context, get_verified_credentials
+from ._helpers import get_user_context, get_verified_credentials, invalidate_listings
 from ....services.meta_ads.meta_ads_service import get_meta_ads_service
 
 logger = logging.getLogger(__name__)
@@ -64,7 +64,9 @@ async def bulk_campaign_action(request: Request, body: BulkActionRequest):
             except Exception as e:
                 results["failed"].append({"id": campaign_id, "error": str(e)})
         
-        return JSONResponse(content={
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={
             "success": True,
             "processed": len(results["success"]),
             "failed": len(results["failed"]),
@@ -119,7 +121,9 @@ async def bulk_adset_action(request: Request, body: BulkActionRequest):
             except Exception as e:
                 results["failed"].append({"id": adset_id, "error": str(e)})
         
-        return JSONResponse(content={
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={
             "success": True,
             "processed": len(results["success"]),
             "failed": len(results["failed"]),
@@ -174,7 +178,9 @@ async def bulk_ad_action(request: Request, body: BulkActionRequest):
             except Exception as e:
                 results["failed"].append({"id": ad_id, "error": str(e)})
         
-        return JSONResponse(content={
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={
             "success": True,
             "processed": len(results["success"]),
             "failed": len(results["failed"]),
@@ -249,7 +255,9 @@ async def bulk_update_status(request: Request):
             }
         )
         
-        return JSONResponse(content=result)
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -2,10 +2,11 @@
 Meta Ads API - Business Portfolio Endpoints
 Handles business portfolio switching and listing
 """
+import asyncio
 import logging
 
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context
 from ....services.meta_ads.meta_credentials_service import MetaCredentialsService
@@ -27,11 +28,12 @@ async def list_businesses(request: Request):
     try:
         user_id, workspace_id = await get_user_context(request)
         
-        # Get available businesses with ad accounts
-        businesses = await MetaCredentialsService.get_available_businesses(workspace_id, user_id)
-        
-        # Get current credentials to find active business/ad account
-        credentials = await MetaCredentialsService.get_meta_credentials(workspace_id, user_id)
+        # Get available businesses with ad accounts, and the current credentials
+        # to find the active business/ad account - independent reads, run together
+        businesses, credentials = await asyncio.gather(
+            MetaCredentialsService.get_available_businesses(workspace_id, user_id),
+            MetaCredentialsService.get_meta_credentials(workspace_id, user_id)
+        )
         
         active_business = None
         if credentials:
@@ -50,7 +52,7 @@ async def list_businesses(request: Request):
                     }
                 }
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "availableBusinesses": businesses,
             "activeBusiness": active_business
         })
@@ -82,7 +84,7 @@ async def switch_business(request: Request, body: SwitchBusinessRequest):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error", "Failed to switch business"))
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -2,14 +2,20 @@
 Meta Ads API - Campaign Endpoints
 Handles Campaign CRUD operations and Advantage+ campaigns
 """
-import asyncio
 import logging
 from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List
 
 from fastapi import APIRouter, Request, HTTPException, Query, Path
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 
-from ._helpers import get_user_context, get_verified_credentials
+from ._helpers import (
+    get_user_context,
+    get_verified_credentials,
+    cached_listing,
+    invalidate_listings,
+)
 from ....services.supabase_service import get_supabase_admin_client, log_activity
 from ....services.meta_ads.meta_ads_service import get_meta_ads_service
 from ....schemas.meta_ads import UpdateCampaignRequest
@@ -38,13 +44,16 @@ async def list_campaigns(request: Request):
         account_id = credentials["account_id"]
         access_token = credentials["access_token"]
         
-        # Fetch campaigns, ad sets, and ads in parallel
-        campaigns_result, adsets_result, ads_result = await asyncio.gather(
-            service.fetch_campaigns(account_id, access_token),
-            service.fetch_adsets(account_id, access_token),
-            service.fetch_ads(account_id, access_token),
-            return_exceptions=True
+        # Fetch campaigns, ad sets, and ads in one Graph batch request
+        listings = await cached_listing(
+            workspace_id,
+            account_id,
+            "campaigns",
+            lambda: service.fetch_campaigns_adsets_ads_batched(account_id, access_token)
         )
+        campaigns_result = listings["campaigns"]
+        adsets_result = listings["adsets"]
+        ads_result = listings["ads"]
         
         # Extract data, handling any errors gracefully
         campaigns = []
@@ -60,11 +69,12 @@ async def list_campaigns(request: Request):
         if isinstance(ads_result, dict) and ads_result.get("data"):
             ads = ads_result["data"]
         
-        return JSONResponse(content={
-            "campaigns": campaigns,
-            "adSets": adsets,
-            "ads": ads
-        })
+        # Serialize one section at a time - large accounts never hold the
+        # whole multi-MB payload as a single bytes object
+        return StreamingResponse(
+            _stream_listings({"campaigns": campaigns, "adSets": adsets, "ads": ads}),
+            media_type="application/json"
+        )
         
     except HTTPException:
         raise
@@ -73,6 +83,15 @@ async def list_campaigns(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _stream_listings(sections: Dict[str, List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """Yield a JSON object of listings, serializing each section separately"""
+    separator = b"{"
+    for name, items in sections.items():
+        yield separator + orjson.dumps(name) + b":" + orjson.dumps(items)
+        separator = b","
+    yield b"}"
+
+
 @router.post("/campaigns/advantage-plus")
 async def create_advantage_plus_campaign(
     request: Request,
@@ -115,12 +134,12 @@ async def create_advantage_plus_campaign(
             account_id=credentials["account_id"],
             access_token=credentials["access_token"],
             name=body.name,
-            objective=body.objective.value,
-            status=body.status.value,
+            objective=body.objective,
+            status=body.status,
             special_ad_categories=body.special_ad_categories,
             daily_budget=body.daily_budget,
             lifetime_budget=body.lifetime_budget,
-            bid_strategy=body.bid_strategy.value if body.bid_strategy else None,
+            bid_strategy=body.bid_strategy,
             geo_locations=body.geo_locations.model_dump() if body.geo_locations else None,
             promoted_object=body.promoted_object.model_dump() if body.promoted_object else None,
             start_time=start_time_str,
@@ -131,7 +150,9 @@ async def create_advantage_plus_campaign(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
             
-        return JSONResponse(content=result)
+        invalidate_listings(workspace_id, credentials["account_id"])
+            
+        return ORJSONResponse(content=result)
     except HTTPException:
         raise
     except Exception as e:
@@ -153,7 +174,7 @@ async def validate_advantage_config(
         if 'objective' in config_dict and hasattr(config_dict['objective'], 'value'):
             config_dict['objective'] = config_dict['objective'].value
         result = service.validate_advantage_config(config=config_dict)
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
     except Exception as e:
         logger.error(f"Error validating Advantage+ config: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -180,7 +201,7 @@ async def update_campaign(
             if body.name:
                 updates["name"] = body.name
             if body.status:
-                updates["status"] = body.status.value
+                updates["status"] = body.status
             if body.budget_amount:
                 updates["daily_budget"] = int(body.budget_amount * 100)
         
@@ -194,7 +215,9 @@ async def update_campaign(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True})
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={"success": True})
         
     except HTTPException:
         raise
@@ -223,7 +246,9 @@ async def delete_campaign(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True})
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={"success": True})
         
     except HTTPException:
         raise
@@ -254,7 +279,9 @@ async def archive_campaign(request: Request, campaign_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "message": "Campaign archived"})
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={"success": True, "message": "Campaign archived"})
         
     except HTTPException:
         raise
@@ -284,7 +311,9 @@ async def unarchive_campaign(request: Request, campaign_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "message": "Campaign unarchived"})
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content={"success": True, "message": "Campaign unarchived"})
         
     except HTTPException:
         raise
@@ -330,7 +359,9 @@ async def duplicate_campaign(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content=result)
+        invalidate_listings(workspace_id, credentials["account_id"])
+        
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -362,7 +393,7 @@ async def get_campaign_advantage_state(
         if result.get("error"):
             raise HTTPException(status_code=400, detail=result["error"])
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
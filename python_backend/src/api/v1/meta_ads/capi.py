@@ -7,7 +7,7 @@ from typing import List, Optional
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Request, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from ._helpers import get_user_context, get_verified_credentials, generate_appsecret_proof
@@ -111,7 +111,7 @@ async def send_capi_events(request: Request, body: SendCAPIEventsRequest):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "events_received": result.get("events_received"),
             "fbtrace_id": result.get("fbtrace_id")
@@ -168,7 +168,7 @@ async def test_capi_event(request: Request):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "message": "Test event sent successfully",
             "events_received": result.get("events_received"),
@@ -207,7 +207,7 @@ async def get_capi_diagnostics(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -2,11 +2,12 @@
 Meta Ads API - Competitor Analysis Endpoints
 Handles competitor search, trends, and watchlist
 """
+import asyncio
 import logging
 from typing import List, Optional
 
 from fastapi import APIRouter, Request, HTTPException, Query, Path
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from ._helpers import get_user_context, get_verified_credentials
@@ -50,7 +51,7 @@ async def search_competitors(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "pages": result.get("pages", [])
         })
@@ -88,7 +89,7 @@ async def get_competitor_trends(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "trends": result.get("trends", [])
         })
@@ -111,11 +112,12 @@ async def get_competitor_watchlist(request: Request):
         user_id, workspace_id = await get_user_context(request)
         
         client = get_supabase_admin_client()
-        result = client.table("competitor_watchlist").select("*").eq(
+        query = client.table("competitor_watchlist").select("*").eq(
             "workspace_id", workspace_id
-        ).order("created_at", desc=True).execute()
+        ).order("created_at", desc=True)
+        result = await asyncio.to_thread(query.execute)
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "watchlist": result.data or []
         })
@@ -140,22 +142,23 @@ async def add_to_watchlist(request: Request, body: AddToWatchlistRequest):
         client = get_supabase_admin_client()
         
         # Check if already in watchlist
-        existing = client.table("competitor_watchlist").select("id").eq(
+        query = client.table("competitor_watchlist").select("id").eq(
             "workspace_id", workspace_id
-        ).eq("page_id", body.page_id).execute()
+        ).eq("page_id", body.page_id)
+        existing = await asyncio.to_thread(query.execute)
         
         if existing.data:
             raise HTTPException(status_code=400, detail="Competitor already in watchlist")
         
-        result = client.table("competitor_watchlist").insert({
+        result = await asyncio.to_thread(client.table("competitor_watchlist").insert({
             "workspace_id": workspace_id,
             "user_id": user_id,
             "page_id": body.page_id,
             "page_name": body.page_name,
             "notes": body.notes
-        }).execute()
+        }).execute)
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "entry": result.data[0] if result.data else None
         })
@@ -178,11 +181,12 @@ async def remove_from_watchlist(request: Request, entry_id: str = Path(...)):
         user_id, workspace_id = await get_user_context(request)
         
         client = get_supabase_admin_client()
-        client.table("competitor_watchlist").delete().eq(
+        query = client.table("competitor_watchlist").delete().eq(
             "id", entry_id
-        ).eq("workspace_id", workspace_id).execute()
+        ).eq("workspace_id", workspace_id)
+        await asyncio.to_thread(query.execute)
         
-        return JSONResponse(content={"success": True})
+        return ORJSONResponse(content={"success": True})
         
     except HTTPException:
         raise
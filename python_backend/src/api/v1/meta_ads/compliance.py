@@ -5,7 +5,7 @@ Handles compliance checks and special ad categories
 import logging
 
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 from ....services.meta_ads.meta_sdk_client import create_meta_sdk_client
@@ -36,7 +36,7 @@ async def check_compliance(request: Request, body: ComplianceCheckRequest):
             special_ad_categories=body.special_ad_categories
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -76,4 +76,4 @@ async def get_special_ad_categories(request: Request):
         }
     ]
     
-    return JSONResponse(content={"categories": categories})
+    return ORJSONResponse(content={"categories": categories})
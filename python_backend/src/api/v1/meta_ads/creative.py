@@ -5,7 +5,7 @@ Handles creative library and asset uploads
 import logging
 
 from fastapi import APIRouter, Request, HTTPException, UploadFile, File, Form
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 from ....services.meta_ads.meta_ads_service import get_meta_ads_service
@@ -36,7 +36,7 @@ async def get_creative_library(request: Request):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "creatives": result.get("creatives", [])
         })
@@ -90,7 +90,7 @@ async def upload_creative(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -128,7 +128,7 @@ async def search_ad_library(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "ads": result.get("ads", []),
             "paging": result.get("paging")
@@ -2,12 +2,13 @@
 Meta Ads API - Draft Management Endpoints
 Handles ad draft creation and management
 """
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Request, HTTPException, Path, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context
 from ....services.supabase_service import get_supabase_admin_client
@@ -17,28 +18,46 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Meta Ads - Drafts"])
 
+# Columns the drafts library renders - the targeting/budget/schedule blobs are
+# only needed when a single draft is opened
+DRAFT_LIST_COLUMNS = (
+    "id, ad_type, status, creative, campaign_name, adset_name, ad_name, "
+    "created_at, updated_at"
+)
+
 
 @router.get("/ads/draft")
 async def list_drafts(
     request: Request,
-    workspaceId: Optional[str] = Query(None)
+    workspaceId: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0)
 ):
     """
     GET /api/v1/meta-ads/ads/draft
     
-    List ad drafts
+    List ad drafts (newest first). Paginated with limit/offset when a limit
+    is passed - without one every draft is returned, since the drafts
+    library loads the whole list at once.
     """
     try:
         user_id, workspace_id = await get_user_context(request)
         workspace_id = workspaceId or workspace_id
         
         client = get_supabase_admin_client()
-        result = client.table("meta_ad_drafts").select("*").eq(
+        query = client.table("meta_ad_drafts").select(DRAFT_LIST_COLUMNS).eq(
             "workspace_id", workspace_id
-        ).eq("status", "draft").order("created_at", desc=True).execute()
+        ).eq("status", "draft").order("created_at", desc=True)
+        if limit is not None:
+            query = query.range(offset, offset + limit - 1)
+        elif offset:
+            query = query.offset(offset)
+        result = await asyncio.to_thread(query.execute)
+        drafts = result.data or []
         
-        return JSONResponse(content={
-            "drafts": result.data or []
+        return ORJSONResponse(content={
+            "drafts": drafts,
+            "hasMore": limit is not None and len(drafts) == limit
         })
         
     except HTTPException:
@@ -48,6 +67,39 @@ async def list_drafts(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/ads/draft/{draft_id}")
+async def get_draft(
+    request: Request,
+    draft_id: str = Path(...)
+):
+    """
+    GET /api/v1/meta-ads/ads/draft/{draft_id}
+    
+    Get a single ad draft with all fields
+    """
+    try:
+        user_id, workspace_id = await get_user_context(request)
+        
+        client = get_supabase_admin_client()
+        query = client.table("meta_ad_drafts").select("*").eq(
+            "id", draft_id
+        ).eq("workspace_id", workspace_id).limit(1)
+        result = await asyncio.to_thread(query.execute)
+        
+        if not result.data:
+            raise HTTPException(status_code=404, detail="Draft not found")
+        
+        return ORJSONResponse(content={
+            "draft": result.data[0]
+        })
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting draft: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/ads/draft")
 async def create_draft(request: Request, body: CreateAdDraftRequest):
     """
@@ -64,7 +116,7 @@ async def create_draft(request: Request, body: CreateAdDraftRequest):
             "workspace_id": workspace_id,
             "user_id": user_id,
             "platform": "facebook",  # Database requires platform field
-            "ad_type": body.ad_type.value,
+            "ad_type": body.ad_type,
             "objective": body.objective,
             "optimization_goal": body.optimization_goal,
             "billing_event": body.billing_event or "IMPRESSIONS",
@@ -81,12 +133,24 @@ async def create_draft(request: Request, body: CreateAdDraftRequest):
             "updated_at": datetime.now(timezone.utc).isoformat()
         }
         
-        result = client.table("meta_ad_drafts").insert(draft_data).execute()
-        
-        if not result.data:
-            raise HTTPException(status_code=500, detail="Failed to create draft")
+        if body.id:
+            # Save over an existing draft instead of adding a new row per save
+            query = client.table("meta_ad_drafts").update(draft_data).eq(
+                "id", body.id
+            ).eq("workspace_id", workspace_id)
+            result = await asyncio.to_thread(query.execute)
+            
+            if not result.data:
+                raise HTTPException(status_code=404, detail="Draft not found")
+        else:
+            result = await asyncio.to_thread(
+                client.table("meta_ad_drafts").insert(draft_data).execute
+            )
+            
+            if not result.data:
+                raise HTTPException(status_code=500, detail="Failed to create draft")
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "draft": result.data[0]
         })
@@ -112,11 +176,12 @@ async def delete_draft(
         user_id, workspace_id = await get_user_context(request)
         
         client = get_supabase_admin_client()
-        client.table("meta_ad_drafts").delete().eq(
+        query = client.table("meta_ad_drafts").delete().eq(
             "id", draft_id
-        ).eq("workspace_id", workspace_id).execute()
+        ).eq("workspace_id", workspace_id)
+        await asyncio.to_thread(query.execute)
         
-        return JSONResponse(content={"success": True})
+        return ORJSONResponse(content={"success": True})
         
     except HTTPException:
         raise
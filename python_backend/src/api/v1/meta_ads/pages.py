@@ -5,9 +5,9 @@ Handles Facebook/Instagram Page operations
 import logging
 
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from ._helpers import get_user_context, get_verified_credentials
+from ._helpers import get_user_context, get_verified_credentials, cached_read
 from ....services.meta_ads.meta_sdk_client import create_meta_sdk_client
 
 logger = logging.getLogger(__name__)
@@ -27,9 +27,15 @@ async def list_pages(request: Request):
         credentials = await get_verified_credentials(workspace_id, user_id)
         
         client = create_meta_sdk_client(credentials["access_token"])
-        pages = await client.get_user_pages()
+        pages = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "pages",
+            (),
+            client.get_user_pages
+        )
         
-        return JSONResponse(content={"pages": pages or []})
+        return ORJSONResponse(content={"pages": pages or []})
         
     except HTTPException:
         raise
@@ -52,7 +58,7 @@ async def get_page_details(request: Request, page_id: str):
         client = create_meta_sdk_client(credentials["access_token"])
         page = await client.get_page_details(page_id)
         
-        return JSONResponse(content={"page": page})
+        return ORJSONResponse(content={"page": page})
         
     except HTTPException:
         raise
@@ -6,9 +6,14 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, Request, HTTPException, Path, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from ._helpers import get_user_context, get_verified_credentials
+from ._helpers import (
+    get_user_context,
+    get_verified_credentials,
+    cached_read,
+    invalidate_read,
+)
 from ....services.meta_ads.meta_sdk_client import create_meta_sdk_client
 
 logger = logging.getLogger(__name__)
@@ -29,14 +34,18 @@ async def list_pixels(request: Request):
         
         client = create_meta_sdk_client(credentials["access_token"])
         
-        result = await client.get_pixels(
-            account_id=credentials["account_id"]
+        result = await cached_read(
+            workspace_id,
+            credentials["account_id"],
+            "pixels",
+            (),
+            lambda: client.get_pixels(account_id=credentials["account_id"])
         )
         
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "pixels": result.get("pixels", [])
         })
@@ -66,7 +75,7 @@ async def get_pixel_details(request: Request, pixel_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "pixel": result.get("pixel")
         })
@@ -96,7 +105,7 @@ async def list_pixel_users(request: Request, pixel_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "users": result.get("users", [])
         })
@@ -131,7 +140,9 @@ async def update_pixel(request: Request, pixel_id: str = Path(...)):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True})
+        invalidate_read(workspace_id, credentials["account_id"], "pixels")
+        
+        return ORJSONResponse(content={"success": True})
         
     except HTTPException:
         raise
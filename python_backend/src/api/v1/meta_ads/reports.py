@@ -7,7 +7,7 @@ from typing import List, Optional
 from datetime import datetime
 
 from fastapi import APIRouter, Request, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from ._helpers import get_user_context, get_verified_credentials
@@ -59,7 +59,7 @@ async def generate_custom_report(request: Request, body: GenerateReportRequest):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "data": result.get("data", []),
             "summary": result.get("summary"),
@@ -82,7 +82,7 @@ async def get_available_metrics(request: Request):
     """
     from ....schemas.reporting import AVAILABLE_METRICS
     
-    return JSONResponse(content={"metrics": AVAILABLE_METRICS})
+    return ORJSONResponse(content={"metrics": AVAILABLE_METRICS})
 
 
 @router.get("/reports/breakdowns")
@@ -94,4 +94,4 @@ async def get_available_breakdowns(request: Request):
     """
     from ....schemas.reporting import AVAILABLE_BREAKDOWNS
     
-    return JSONResponse(content={"breakdowns": AVAILABLE_BREAKDOWNS})
+    return ORJSONResponse(content={"breakdowns": AVAILABLE_BREAKDOWNS})
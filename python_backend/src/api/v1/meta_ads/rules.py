@@ -6,7 +6,7 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, Request, HTTPException, Path, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 from ....services.supabase_service import log_activity
@@ -175,7 +175,7 @@ async def create_automation_rule(request: Request):
             details={"rule_id": result.get("rule_id"), "name": name}
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -204,7 +204,7 @@ async def list_automation_rules(request: Request):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"rules": result.get("rules", [])})
+        return ORJSONResponse(content={"rules": result.get("rules", [])})
         
     except HTTPException:
         raise
@@ -239,7 +239,7 @@ async def update_automation_rule(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -276,7 +276,7 @@ async def delete_automation_rule(
             details={"rule_id": rule_id}
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -306,7 +306,7 @@ async def get_automation_rule(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={"success": True, "rule": result.get("rule")})
+        return ORJSONResponse(content={"success": True, "rule": result.get("rule")})
         
     except HTTPException:
         raise
@@ -344,7 +344,7 @@ async def get_rule_history(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "history": result.get("history", []),
             "paging": result.get("paging")
@@ -366,4 +366,4 @@ async def get_rule_templates(request: Request):
     """
     from ....schemas.automation_rules import RULE_TEMPLATES
     
-    return JSONResponse(content={"templates": RULE_TEMPLATES})
+    return ORJSONResponse(content={"templates": RULE_TEMPLATES})
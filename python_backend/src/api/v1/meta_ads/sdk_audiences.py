@@ -5,7 +5,7 @@ Handles saved audience operations
 import logging
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 
@@ -32,7 +32,7 @@ async def get_saved_audiences(request: Request):
             account_id=creds["account_id"].replace("act_", "")
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Get saved audiences error: {e}")
@@ -60,7 +60,7 @@ async def create_saved_audience(request: Request):
             targeting=body.get("targeting", {})
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Create saved audience error: {e}")
@@ -5,7 +5,7 @@ Handles business asset operations
 import logging
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 
@@ -30,7 +30,7 @@ async def get_businesses(request: Request):
         
         result = await service.get_businesses()
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Get businesses error: {e}")
@@ -53,7 +53,7 @@ async def get_ad_accounts(request: Request):
         
         result = await service.get_ad_accounts()
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Get ad accounts error: {e}")
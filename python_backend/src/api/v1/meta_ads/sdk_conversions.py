@@ -5,7 +5,7 @@ Handles custom conversions and offline conversions
 import logging
 
 from fastapi import APIRouter, HTTPException, Request, Path
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 
@@ -33,7 +33,7 @@ async def get_custom_conversions(request: Request):
             account_id=creds["account_id"].replace("act_", "")
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Get custom conversions error: {e}")
@@ -64,7 +64,7 @@ async def create_custom_conversion(request: Request):
             default_conversion_value=body.get("default_conversion_value")
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Create custom conversion error: {e}")
@@ -95,7 +95,7 @@ async def get_offline_conversion_datasets(request: Request, business_id: str = N
             # Return empty list if no business_id provided
             result = {"success": True, "datasets": [], "note": "Business ID required for offline datasets"}
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Get offline datasets error: {e}")
@@ -129,7 +129,7 @@ async def upload_offline_events(
             events=events
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
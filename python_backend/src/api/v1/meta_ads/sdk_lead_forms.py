@@ -5,7 +5,7 @@ Handles lead form operations
 import logging
 
 from fastapi import APIRouter, HTTPException, Request, Path, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 
@@ -37,7 +37,7 @@ async def get_lead_forms(request: Request):
         
         result = await service.get_lead_forms(page_id=page_id)
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
@@ -66,7 +66,7 @@ async def get_form_leads(
         
         result = await service.get_leads(form_id=form_id, limit=limit)
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Get form leads error: {e}")
@@ -6,7 +6,7 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Request, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 
@@ -49,7 +49,7 @@ async def search_ad_library(
             limit=limit
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Ad library search error: {e}")
@@ -81,7 +81,7 @@ async def analyze_competitor(
             ad_reached_countries=countries
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Analyze competitor error: {e}")
@@ -5,7 +5,7 @@ Handles pixel operations via SDK
 import logging
 
 from fastapi import APIRouter, HTTPException, Request, Path, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 
@@ -32,7 +32,7 @@ async def get_pixels(request: Request):
             account_id=creds["account_id"].replace("act_", "")
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Get pixels error: {e}")
@@ -62,7 +62,7 @@ async def get_pixel_stats(
             date_preset=date_preset
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Get pixel stats error: {e}")
@@ -5,7 +5,7 @@ Handles ad previews and format information
 import logging
 
 from fastapi import APIRouter, HTTPException, Request, Path, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 
@@ -42,7 +42,7 @@ async def get_preview_formats(request: Request):
         {"value": "INSTAGRAM_REELS", "label": "Instagram Reels"}
     ]
     
-    return JSONResponse(content={"success": True, "formats": formats})
+    return ORJSONResponse(content={"success": True, "formats": formats})
 
 
 @router.get("/preview/{ad_id}")
@@ -68,7 +68,7 @@ async def get_ad_preview(
             ad_format=ad_format
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Get ad preview error: {e}")
@@ -99,7 +99,7 @@ async def preview_creative(request: Request):
             ad_format=ad_format
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Generate preview error: {e}")
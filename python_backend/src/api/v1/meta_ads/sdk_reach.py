@@ -9,7 +9,7 @@ campaign context, use delivery_estimate which is simpler and works directly.
 import logging
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 
@@ -43,7 +43,7 @@ async def estimate_reach(request: Request):
             optimization_goal=optimization_goal
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Reach estimation error: {e}")
@@ -71,7 +71,7 @@ async def estimate_delivery(request: Request):
             optimization_goal=body.get("optimization_goal", "LINK_CLICKS")
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Delivery estimation error: {e}")
@@ -5,7 +5,7 @@ Handles async report generation
 import logging
 
 from fastapi import APIRouter, HTTPException, Request, Path, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 
@@ -41,7 +41,7 @@ async def start_async_report(request: Request):
             time_increment=body.get("time_increment")
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Start async report error: {e}")
@@ -67,7 +67,7 @@ async def check_report_status(
         
         result = await service.check_status(report_run_id=report_run_id)
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Check report status error: {e}")
@@ -97,7 +97,7 @@ async def get_report_results(
             limit=limit
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Get report results error: {e}")
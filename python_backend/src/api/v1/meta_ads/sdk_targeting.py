@@ -6,7 +6,7 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Request, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 
@@ -40,7 +40,7 @@ async def search_targeting(
             limit=limit
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Targeting search error: {e}")
@@ -66,7 +66,7 @@ async def browse_targeting(
         
         result = await service.browse_targeting(targeting_class=class_)
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Targeting browse error: {e}")
@@ -98,7 +98,7 @@ async def search_geolocations(
             limit=limit
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Geolocation search error: {e}")
@@ -5,7 +5,7 @@ Handles video operations
 import logging
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 
@@ -32,7 +32,7 @@ async def get_videos(request: Request):
             account_id=creds["account_id"].replace("act_", "")
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Get videos error: {e}")
@@ -66,7 +66,7 @@ async def upload_video_from_url(request: Request):
             name=title
         )
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
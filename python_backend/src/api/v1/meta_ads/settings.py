@@ -6,7 +6,7 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, Request, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context, get_verified_credentials
 from ....services.meta_ads.meta_ads_service import get_meta_ads_service
@@ -37,7 +37,7 @@ async def get_ad_account_settings(request: Request):
         if result.get("error"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "adAccount": result.get("adAccount")
         })
@@ -69,7 +69,7 @@ async def get_business_settings(request: Request):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "business": result.get("business")
         })
@@ -101,7 +101,7 @@ async def get_team_access(request: Request):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "users": result.get("users", [])
         })
@@ -133,7 +133,7 @@ async def get_notification_settings(request: Request):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "settings": result.get("settings", {})
         })
@@ -165,7 +165,7 @@ async def get_funding_sources(request: Request):
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "fundingSources": result.get("funding_sources", [])
         })
@@ -205,7 +205,7 @@ async def get_activities(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "activities": result.get("activities", []),
             "paging": result.get("paging")
@@ -242,7 +242,7 @@ async def get_invoices(
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error"))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "invoices": result.get("invoices", [])
         })
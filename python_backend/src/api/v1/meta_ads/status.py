@@ -2,19 +2,51 @@
 Meta Ads API - Connection Status Endpoints
 Provides endpoints for checking Meta Ads connection status
 """
+import asyncio
 import logging
+from typing import Optional
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from ._helpers import get_user_context
 from ....services.meta_ads.meta_credentials_service import MetaCredentialsService
 from ....services.meta_ads.meta_ads_service import get_meta_ads_service
+from ....utils.cache import TTLCache
+from ....utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Meta Ads - Status"])
 
+# Ad account metadata (name, currency, timezone) is near-static, while the
+# dashboard polls /status - cached per (workspace_id, account_id)
+AD_ACCOUNT_CACHE_SECONDS = 60
+_ad_account_cache = TTLCache(maxsize=10_000, ttl=AD_ACCOUNT_CACHE_SECONDS)
+_ad_account_flight = SingleFlight()
+
+
+async def _get_ad_account(workspace_id: str, credentials: dict) -> Optional[dict]:
+    """Ad account details from Meta, served from cache while fresh"""
+    key = (workspace_id, credentials["account_id"])
+    ad_account = _ad_account_cache.get(key)
+    if ad_account is not None:
+        return ad_account
+    
+    async def fetch() -> Optional[dict]:
+        service = get_meta_ads_service()
+        result = await service.get_ad_account_info(
+            credentials["account_id"],
+            credentials["access_token"]
+        )
+        # Failed lookups aren't cached so the next poll retries
+        data = result.get("data")
+        if data:
+            _ad_account_cache.set(key, data)
+        return data
+    
+    return await _ad_account_flight.do(key, fetch)
+
 
 @router.get("/status")
 async def get_status(request: Request):
@@ -31,17 +63,15 @@ async def get_status(request: Request):
     try:
         user_id, workspace_id = await get_user_context(request)
         
-        # Get connection status
-        connection_status = await MetaCredentialsService.get_connection_status(workspace_id)
-        
-        # Get ads capability
-        capability = await MetaCredentialsService.check_ads_capability(workspace_id, user_id)
-        
-        # Get credentials for additional info
-        credentials = await MetaCredentialsService.get_ads_credentials(workspace_id, user_id)
+        # Connection status, ads capability and credentials are independent reads
+        connection_status, capability, credentials = await asyncio.gather(
+            MetaCredentialsService.get_connection_status(workspace_id),
+            MetaCredentialsService.check_ads_capability(workspace_id, user_id),
+            MetaCredentialsService.get_ads_credentials(workspace_id, user_id),
+        )
         
         if not credentials or not credentials.get('access_token'):
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "isConnected": False,
                 "canRunAds": False,
                 "message": "No Meta platform connected",
@@ -51,7 +81,7 @@ async def get_status(request: Request):
         
         # Check token expiration
         if credentials.get("is_expired"):
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "isConnected": False,
                 "canRunAds": False,
                 "tokenExpired": True,
@@ -62,12 +92,7 @@ async def get_status(request: Request):
         # Get ad account info if available
         ad_account = None
         if credentials.get("account_id"):
-            service = get_meta_ads_service()
-            ad_account_result = await service.get_ad_account_info(
-                credentials["account_id"],
-                credentials["access_token"]
-            )
-            ad_account = ad_account_result.get("adAccount") or {
+            ad_account = await _get_ad_account(workspace_id, credentials) or {
                 "id": f"act_{credentials['account_id']}",
                 "account_id": credentials["account_id"],
                 "name": credentials.get("account_name", "Ad Account"),
@@ -75,7 +100,7 @@ async def get_status(request: Request):
                 "timezone_name": "America/Los_Angeles"
             }
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "isConnected": True,
             "canRunAds": capability.get("has_ads_access", False),
             "tokenExpiresSoon": credentials.get("expires_soon", False),
@@ -94,7 +119,7 @@ async def get_status(request: Request):
         
     except Exception as e:
         logger.error(f"Error getting Meta Ads status: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "isConnected": False,
@@ -52,6 +52,12 @@ class Settings(BaseSettings):
         default="http://localhost:3000",
         description="Comma-separated list of allowed origins"
     )
+    
+    # Router Configuration
+    ENABLED_ROUTERS: str = Field(
+        default="all",
+        description="Comma-separated router names to mount (e.g. 'content_router,auth_router'), or 'all'"
+    )
 
     
     @field_validator('APP_URL', 'BACKEND_URL', mode='before')
@@ -169,6 +175,14 @@ class Settings(BaseSettings):
         default="google-genai:gemini-2.0-flash",
         description="Default LLM model ID"
     )
+    GEMINI_MAX_CONCURRENCY: int = Field(
+        default=8,
+        description="Max concurrent Gemini calls for prompt improvement"
+    )
+    GEMINI_RPM: int = Field(
+        default=60,
+        description="Max Gemini requests per minute for prompt improvement"
+    )
     
     model_config = SettingsConfigDict(
         env_file=["../.env", ".env"],  # Look in parent dir first, then current
@@ -177,6 +191,16 @@ class Settings(BaseSettings):
         extra="ignore",
     )
     
+    @property
+    def enabled_routers(self) -> frozenset:
+        """Get enabled router names as a set ("all" enables every router)"""
+        return frozenset(r.strip() for r in self.ENABLED_ROUTERS.split(",") if r.strip())
+    
+    def is_router_enabled(self, name: str) -> bool:
+        """Check whether a router should be mounted"""
+        enabled = self.enabled_routers
+        return "all" in enabled or name in enabled
+    
     @property
     def gemini_key(self) -> Optional[str]:
         """Get Gemini API key (supports both GOOGLE_API_KEY and GEMINI_API_KEY)"""
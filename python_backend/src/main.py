@@ -5,7 +5,7 @@ Production-ready AI agent backend with LangGraph and multi-provider LLM support
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -78,6 +78,11 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Content Creator Backend...")
+    if settings.is_router_enabled("media_generating_router"):
+        from .agents.media_agents.video_agent import close_http_client as close_veo_http_client
+        await close_veo_http_client()
+    from .services.meta_ads.meta_ads_service import close_http_client as close_graph_http_client
+    await close_graph_http_client()
     logger.info("Application shutdown complete")
 
 
@@ -88,6 +93,8 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson for every route without an explicit response class
+    default_response_class=ORJSONResponse,
 )
 
 # Security headers middleware (first - runs last)
@@ -107,68 +114,25 @@ app.add_middleware(
 app.add_middleware(AuthMiddleware)
 
 # Include API routers
-from .api import (
-    content_router,
-    content_improvement_router,
-    improve_media_prompts_router,
-    media_generating_router,
-    comments_router,
-    auth_router,
-    media_studio_router,
-    storage_router,
-    webhooks_router,
-    canva_router,
-    workspace_router,
-    posts_router,
-    credentials_router,
-    cloudinary_router,
-    token_refresh_router,
-    cron_router,
-    meta_ads_router,
-    facebook_router,
-    instagram_router,
-    linkedin_router,
-    twitter_router,
-    tiktok_router,
-    youtube_router,
-    rate_limits_router,
-    businesses_router,
-    ab_tests_router,
-    voice_live_router,
-    calendar_router
-)
+# Routers are listed once in api.v1 (in mount order) and only imported when
+# enabled via ENABLED_ROUTERS, so lightweight deployments skip unused SDKs
+from . import api
+
+# Extra include_router() options for routers that need them
+ROUTER_MOUNT_OPTIONS = {
+    "businesses_router": {"prefix": "/api/v1/meta-ads", "tags": ["Meta Ads - Business"]},
+    "ab_tests_router": {"prefix": "/api/v1/meta-ads", "tags": ["Meta Ads - A/B Testing"]},
+    "calendar_router": {"prefix": "/api/v1", "tags": ["Content Calendar"]},
+}
+
+for router_name in api.__all__:
+    if settings.is_router_enabled(router_name):
+        app.include_router(getattr(api, router_name), **ROUTER_MOUNT_OPTIONS.get(router_name, {}))
+
 # Deep agents router (LangGraph-powered content strategist)
-from .agents.deep_agents.router import router as deep_agents_router
-
-app.include_router(content_router)
-app.include_router(content_improvement_router)
-app.include_router(improve_media_prompts_router)
-app.include_router(media_generating_router)
-app.include_router(comments_router)
-app.include_router(auth_router)
-app.include_router(media_studio_router)
-app.include_router(storage_router)
-app.include_router(webhooks_router)
-app.include_router(canva_router)
-app.include_router(workspace_router)
-app.include_router(posts_router)
-app.include_router(credentials_router)
-app.include_router(cloudinary_router)
-app.include_router(token_refresh_router)
-app.include_router(cron_router)
-app.include_router(meta_ads_router)
-app.include_router(facebook_router)
-app.include_router(instagram_router)
-app.include_router(linkedin_router)
-app.include_router(twitter_router)
-app.include_router(tiktok_router)
-app.include_router(youtube_router)
-app.include_router(rate_limits_router)
-app.include_router(businesses_router, prefix="/api/v1/meta-ads", tags=["Meta Ads - Business"])
-app.include_router(ab_tests_router, prefix="/api/v1/meta-ads", tags=["Meta Ads - A/B Testing"])
-app.include_router(voice_live_router)
-app.include_router(calendar_router, prefix="/api/v1", tags=["Content Calendar"])
-app.include_router(deep_agents_router)
+if settings.is_router_enabled("deep_agents_router"):
+    from .agents.deep_agents.router import router as deep_agents_router
+    app.include_router(deep_agents_router)
 
 
 @app.exception_handler(Exception)
@@ -179,7 +143,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     # Don't expose internal errors in production
     error_message = str(exc) if settings.DEBUG else "An unexpected error occurred"
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -191,7 +155,7 @@ async def global_exception_handler(request: Request, exc: Exception):
 @app.get("/")
 async def root():
     """Root endpoint with service information"""
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "service": "Content Creator AI Backend",
             "status": "running",
@@ -204,7 +168,7 @@ async def root():
 @app.get("/health")
 async def health_check(request: Request):
     """Health check endpoint"""
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "status": "healthy",
             "service": "content-creator-backend",
@@ -13,7 +13,7 @@ Reference: https://developers.facebook.com/docs/marketing-api/advantage-campaign
 """
 from enum import Enum
 from typing import Optional, List, Dict
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
 
 
@@ -234,6 +234,22 @@ class CreateAdvantagePlusCampaignRequest(BaseModel):
     2. Supported bid_strategy
     3. Objective: OUTCOME_SALES, OUTCOME_APP_PROMOTION, or OUTCOME_LEADS
     """
+    # Enum fields (defaults included) arrive as plain strings for the Graph API
+    model_config = ConfigDict(
+        use_enum_values=True,
+        validate_default=True,
+        json_schema_extra={
+            "example": {
+                "name": "Q1 2026 Advantage+ Sales Campaign",
+                "objective": "OUTCOME_SALES",
+                "status": "PAUSED",
+                "daily_budget": 5000,
+                "bid_strategy": "LOWEST_COST_WITHOUT_CAP",
+                "special_ad_categories": []
+            }
+        }
+    )
+    
     # Campaign Info
     name: str = Field(..., min_length=1, max_length=400)
     objective: AdvantageObjective = AdvantageObjective.OUTCOME_SALES
@@ -286,18 +302,6 @@ class CreateAdvantagePlusCampaignRequest(BaseModel):
         if self.daily_budget is None and self.lifetime_budget is None:
             raise ValueError("Either daily_budget or lifetime_budget must be provided")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "Q1 2026 Advantage+ Sales Campaign",
-                "objective": "OUTCOME_SALES",
-                "status": "PAUSED",
-                "daily_budget": 5000,
-                "bid_strategy": "LOWEST_COST_WITHOUT_CAP",
-                "special_ad_categories": []
-            }
-        }
-
 
 class CreateAdvantagePlusAdSetRequest(BaseModel):
     """
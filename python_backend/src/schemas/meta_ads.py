@@ -8,7 +8,12 @@ Based on official Meta Marketing API documentation.
 from enum import Enum
 from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+# Request models that handlers forward to the Graph API hold enum fields as
+# plain strings, defaults included - resolved once at parse time
+_ENUM_VALUES_CONFIG = ConfigDict(use_enum_values=True, validate_default=True)
 
 
 # ============================================================================
@@ -428,6 +433,8 @@ class LookalikeSpec(BaseModel):
 
 class UpdateCampaignRequest(BaseModel):
     """Request to update a campaign"""
+    model_config = _ENUM_VALUES_CONFIG
+    
     name: Optional[str] = Field(None, max_length=255)
     status: Optional[CampaignStatus] = None
     budget_amount: Optional[float] = None
@@ -514,6 +521,8 @@ class CreateAdSetRequest(BaseModel):
     - is_adset_budget_sharing_enabled: Share up to 20% budget with other ad sets
     - placement_soft_opt_out: Allow 5% spend on excluded placements
     """
+    model_config = _ENUM_VALUES_CONFIG
+    
     name: str = Field(..., min_length=1, max_length=255)
     campaign_id: str
     status: Optional[AdSetStatus] = AdSetStatus.PAUSED
@@ -563,6 +572,8 @@ class CreateAdSetRequest(BaseModel):
 
 class UpdateAdSetRequest(BaseModel):
     """Request to update an ad set - v24.0 2026"""
+    model_config = _ENUM_VALUES_CONFIG
+    
     name: Optional[str] = Field(None, max_length=255)
     status: Optional[AdSetStatus] = None
     budget_amount: Optional[float] = None
@@ -666,6 +677,8 @@ class AdCreative(BaseModel):
     
     Note: For v24.0 2026, prefer using object_story_spec for new creatives
     """
+    model_config = _ENUM_VALUES_CONFIG
+    
     title: Optional[str] = Field(None, max_length=40)
     body: Optional[str] = Field(None, max_length=125)
     call_to_action_type: Optional[CallToActionType] = None
@@ -730,6 +743,8 @@ class AdCreative(BaseModel):
 
 class CreateAdRequest(BaseModel):
     """Request to create an ad"""
+    model_config = _ENUM_VALUES_CONFIG
+    
     name: str = Field(..., min_length=1, max_length=255)
     adset_id: str
     status: Optional[AdStatus] = AdStatus.PAUSED
@@ -741,6 +756,8 @@ class CreateAdRequest(BaseModel):
 
 class UpdateAdRequest(BaseModel):
     """Request to update an ad"""
+    model_config = _ENUM_VALUES_CONFIG
+    
     status: Optional[AdStatus] = None
     name: Optional[str] = Field(None, max_length=255)
 
@@ -766,6 +783,9 @@ class AdResponse(BaseModel):
 
 class CreateAdDraftRequest(BaseModel):
     """Request to create or update an ad draft"""
+    model_config = _ENUM_VALUES_CONFIG
+    
+    id: Optional[str] = None  # Existing draft to update; omitted creates a new draft
     ad_type: AdType = AdType.SINGLE_IMAGE
     platform: Optional[str] = "facebook"
     objective: Optional[str] = None
@@ -13,18 +13,107 @@ Handles:
 - Business portfolio management
 - Insights/Analytics
 """
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
 import logging
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlencode
 from datetime import datetime, timezone
 
+import httpx
+
 from ...config import settings
-from .meta_sdk_client import create_meta_sdk_client, MetaSDKError
+from .meta_sdk_client import build_object_story_spec, create_meta_sdk_client, MetaSDKError
 
 logger = logging.getLogger(__name__)
 
 # Meta API Configuration - v24.0 (2026 standards)
 META_API_VERSION = "v24.0"
 
+# Fields for the batched account listing - same fields the SDK fetches use
+LISTING_FIELDS: Dict[str, List[str]] = {
+    "campaigns": [
+        "id", "name", "objective", "status", "effective_status",
+        "daily_budget", "lifetime_budget", "special_ad_categories",
+        "created_time", "updated_time", "configured_status",
+        "bid_strategy", "adset_bid_amounts", "promoted_object",
+    ],
+    "adsets": [
+        "id", "name", "campaign_id", "status", "effective_status",
+        "daily_budget", "lifetime_budget", "targeting", "optimization_goal",
+        "billing_event", "start_time", "end_time", "created_time",
+    ],
+    "ads": [
+        "id", "name", "adset_id", "campaign_id", "status", "effective_status",
+        "creative", "created_time", "updated_time",
+    ],
+}
+
+# Page size for listing subrequests (fewer paging round trips)
+LISTING_PAGE_SIZE = 500
+
+# Business use case usage (percent of limit) that gets logged as a warning
+BUSINESS_USAGE_WARN_PERCENT = 75
+
+# Shared HTTP client for direct Graph API calls - keeps connections and TLS
+# sessions to graph.facebook.com alive across requests
+_graph_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_graph_http_client() -> httpx.AsyncClient:
+    """Get or create the pooled HTTP client used for direct Graph API calls"""
+    global _graph_http_client
+    
+    if _graph_http_client is None:
+        _graph_http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+        )
+    
+    return _graph_http_client
+
+
+async def close_http_client() -> None:
+    """Close the pooled Graph API client (called on application shutdown)"""
+    global _graph_http_client
+    
+    if _graph_http_client is not None:
+        await _graph_http_client.aclose()
+        _graph_http_client = None
+
+
+# App secret encoded once - every server-side Meta call signs with it
+_APP_SECRET_BYTES = (settings.FACEBOOK_APP_SECRET or "").encode('utf-8')
+
+
+@lru_cache(maxsize=1024)
+def generate_appsecret_proof(access_token: str) -> Optional[str]:
+    """
+    Generate appsecret_proof for Meta API server-side calls
+    
+    Memoized per access token - one token signs many Meta calls per session.
+    """
+    if not _APP_SECRET_BYTES:
+        return None
+    
+    return hmac.new(
+        _APP_SECRET_BYTES,
+        access_token.encode('utf-8'),
+        hashlib.sha256
+    ).hexdigest()
+
+
+def invalidate_appsecret_cache() -> None:
+    """Re-read the app secret and drop memoized proofs (call after rotating the secret)"""
+    global _APP_SECRET_BYTES
+    _APP_SECRET_BYTES = (settings.FACEBOOK_APP_SECRET or "").encode('utf-8')
+    generate_appsecret_proof.cache_clear()
+
+
 # Objective mapping - strictly OUTCOME-based (v24.0 2026 standards)
 # Legacy objectives (LINK_CLICKS, TRAFFIC, etc.) are purged for 2026 compliance.
 OBJECTIVE_MAPPING: Dict[str, str] = {
@@ -118,8 +207,121 @@ class MetaAdsService:
             logger.error(f"Error fetching campaigns: {e}")
             return {"data": None, "error": str(e)}
     
-
+    async def fetch_campaigns_adsets_ads_batched(
+        self,
+        account_id: str,
+        access_token: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch campaigns, ad sets and ads for an ad account in one Graph batch call
+        
+        Returns {"campaigns": ..., "adsets": ..., "ads": ...}, each shaped like
+        fetch_campaigns. Later result pages are followed directly; a listing
+        whose subrequest failed falls back to its SDK fetch.
+        """
+        fetchers = {
+            "campaigns": self.fetch_campaigns,
+            "adsets": self.fetch_adsets,
+            "ads": self.fetch_ads,
+        }
+        
+        batch = [
+            {
+                "method": "GET",
+                "relative_url": f"act_{account_id}/{edge}?fields={','.join(fields)}&limit={LISTING_PAGE_SIZE}"
+            }
+            for edge, fields in LISTING_FIELDS.items()
+        ]
+        
+        bodies: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        try:
+            data = {
+                "access_token": access_token,
+                "batch": json.dumps(batch),
+                "include_headers": "false",
+            }
+            app_secret_proof = generate_appsecret_proof(access_token)
+            if app_secret_proof:
+                data["appsecret_proof"] = app_secret_proof
+            
+            client = get_graph_http_client()
+            response = await client.post(
+                f"https://graph.facebook.com/{META_API_VERSION}/",
+                data=data
+            )
+            self._log_business_usage(response.headers)
+            
+            if response.status_code == 200:
+                for i, item in enumerate(response.json()):
+                    # Items are null when Meta timed out that subrequest
+                    if item and item.get("code") == 200:
+                        bodies[i] = json.loads(item.get("body") or "{}")
+            else:
+                logger.error(f"Graph API batch request failed: {response.status_code}")
+            
+            # Follow the paging cursors of every listing concurrently
+            pages = await asyncio.gather(*(
+                self._follow_pages(client, body) for body in bodies
+            ))
+        except Exception as e:
+            logger.error(f"Error batch fetching campaigns, ad sets and ads: {e}")
+            pages = [None] * len(batch)
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        for name, data in zip(LISTING_FIELDS, pages):
+            if data is None:
+                results[name] = await fetchers[name](account_id, access_token)
+            else:
+                results[name] = {"data": data, "error": None}
+        return results
+    
+    async def _follow_pages(
+        self,
+        client: Any,
+        body: Optional[Dict[str, Any]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Collect every page of a Graph listing, starting from its first page body"""
+        if body is None:
+            return None
+        
+        data = list(body.get("data", []))
+        next_url = body.get("paging", {}).get("next")
+        
+        while next_url:
+            response = await client.get(next_url)
+            self._log_business_usage(response.headers)
+            if response.status_code != 200:
+                logger.error(f"Graph API paging request failed: {response.status_code}")
+                return None
+            page = response.json()
+            data.extend(page.get("data", []))
+            next_url = page.get("paging", {}).get("next")
+        
+        return data
     
+    @staticmethod
+    def _log_business_usage(headers: Any) -> None:
+        """Warn when Meta reports an ad account is close to its rate limit"""
+        usage_header = headers.get("x-business-use-case-usage")
+        if not usage_header:
+            return
+        try:
+            usage = json.loads(usage_header)
+        except ValueError:
+            return
+        
+        for business_id, entries in usage.items():
+            for entry in entries:
+                peak = max(
+                    entry.get("call_count", 0),
+                    entry.get("total_cputime", 0),
+                    entry.get("total_time", 0)
+                )
+                if peak >= BUSINESS_USAGE_WARN_PERCENT:
+                    logger.warning(
+                        f"Meta {entry.get('type')} usage for {business_id} at {peak}% "
+                        f"(regains access in {entry.get('estimated_time_to_regain_access', 0)} min)"
+                    )
 
 
     async def update_campaign(
@@ -579,6 +781,126 @@ class MetaAdsService:
         except Exception as e:
             return {"data": None, "error": str(e)}
     
+    async def create_ad_with_creative(
+        self,
+        account_id: str,
+        access_token: str,
+        page_id: str,
+        name: str,
+        adset_id: str,
+        creative_name: str,
+        image_hash: Optional[str] = None,
+        video_id: Optional[str] = None,
+        body: Optional[str] = None,
+        link_url: Optional[str] = None,
+        call_to_action_type: str = "LEARN_MORE",
+        status: str = "PAUSED"
+    ) -> Dict[str, Any]:
+        """
+        Create a creative and the ad that uses it in one Graph batch request
+        
+        The ad references the creative's id through a batch JSONPath result
+        reference, and a third subrequest reads back the created ad, so the
+        whole sequence is one HTTP round trip. The creative is built the same
+        way as create_ad_creative (single image/link or video).
+        """
+        try:
+            object_story_spec = build_object_story_spec(
+                page_id, image_hash, video_id, body, link_url, call_to_action_type
+            )
+        except ValueError as e:
+            return {"success": False, "creative_id": None, "ad": None, "error": str(e)}
+        
+        batch = [
+            {
+                "method": "POST",
+                "name": "creative",
+                "omit_response_on_success": False,
+                "relative_url": f"act_{account_id}/adcreatives",
+                "body": urlencode({
+                    "name": creative_name,
+                    "object_story_spec": json.dumps(object_story_spec),
+                }),
+            },
+            {
+                "method": "POST",
+                "name": "ad",
+                "omit_response_on_success": False,
+                "relative_url": f"act_{account_id}/ads",
+                # Meta only substitutes result references that are left
+                # unencoded, so the creative param is appended as-is
+                "body": urlencode({
+                    "name": name,
+                    "adset_id": adset_id,
+                    "status": status,
+                }) + '&creative={"creative_id":"{result=creative:$.id}"}',
+            },
+            {
+                "method": "GET",
+                "relative_url": "{result=ad:$.id}?fields=id,name,adset_id,campaign_id,status,effective_status,creative",
+            },
+        ]
+        
+        data = {
+            "access_token": access_token,
+            "batch": json.dumps(batch),
+            "include_headers": "false",
+        }
+        app_secret_proof = generate_appsecret_proof(access_token)
+        if app_secret_proof:
+            data["appsecret_proof"] = app_secret_proof
+        
+        try:
+            client = get_graph_http_client()
+            response = await client.post(
+                f"https://graph.facebook.com/{META_API_VERSION}/",
+                data=data
+            )
+            self._log_business_usage(response.headers)
+            
+            if response.status_code != 200:
+                error_data = response.json() if response.content else {}
+                error_msg = error_data.get("error", {}).get("message", f"Batch request failed ({response.status_code})")
+                return {"success": False, "creative_id": None, "ad": None, "error": error_msg}
+            
+            creative_item, ad_item, read_item = response.json()
+            
+            creative_body, creative_error = self._batch_item_body(creative_item)
+            if creative_error:
+                return {"success": False, "creative_id": None, "ad": None, "error": creative_error}
+            creative_id = creative_body.get("id")
+            
+            ad_body, ad_error = self._batch_item_body(ad_item)
+            if ad_error:
+                return {"success": False, "creative_id": creative_id, "ad": None, "error": ad_error}
+            
+            # The read-back is best effort - the ad exists either way
+            ad, _ = self._batch_item_body(read_item)
+            if not ad:
+                ad = {"id": ad_body.get("id"), "name": name, "adset_id": adset_id, "status": status}
+            
+            return {"success": True, "creative_id": creative_id, "ad": ad, "error": None}
+            
+        except Exception as e:
+            logger.error(f"Error creating ad with creative: {e}")
+            return {"success": False, "creative_id": None, "ad": None, "error": str(e)}
+    
+    @staticmethod
+    def _batch_item_body(item: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Parse one Graph batch response item into (body, error message)"""
+        # Items are null when Meta timed out that subrequest
+        if not item:
+            return None, "Request timed out"
+        
+        try:
+            body = json.loads(item.get("body") or "{}")
+        except ValueError:
+            body = {}
+        
+        if item.get("code") != 200:
+            return None, body.get("error", {}).get("message", f"Request failed ({item.get('code')})")
+        return body, None
+    
     async def update_ad(
         self,
         ad_id: str,
@@ -1225,62 +1547,54 @@ class MetaAdsService:
         
         Note: Direct upload using httpx as SDK requires local file
         """
-        import httpx
-        import hmac
-        import hashlib
-        
         try:
             # Download image
             async with httpx.AsyncClient() as client:
                 img_response = await client.get(image_url)
                 img_response.raise_for_status()
                 image_data = img_response.content
-            
+
             # Determine content type from URL
             content_type = 'image/png' if '.png' in image_url.lower() else 'image/jpeg'
             extension = '.png' if content_type == 'image/png' else '.jpg'
             file_name = (name or 'image') + extension
             
-            # Generate app secret proof
-            app_secret_proof = hmac.new(
-                self.app_secret.encode('utf-8'),
-                access_token.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
-            
             # Normalize account ID
             if not account_id.startswith('act_'):
                 account_id = f'act_{account_id}'
             
             # Upload to Meta using 'bytes' field per Meta API docs
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                import base64
-                response = await client.post(
-                    f'https://graph.facebook.com/v24.0/{account_id}/adimages',
-                    data={
-                        'access_token': access_token,
-                        'appsecret_proof': app_secret_proof,
-                        'bytes': base64.b64encode(image_data).decode('utf-8')
+            client = get_graph_http_client()
+            data = {
+                'access_token': access_token,
+                'bytes': base64.b64encode(image_data).decode('utf-8')
+            }
+            app_secret_proof = generate_appsecret_proof(access_token)
+            if app_secret_proof:
+                data['appsecret_proof'] = app_secret_proof
+            response = await client.post(
+                f'https://graph.facebook.com/v24.0/{account_id}/adimages',
+                data=data,
+                timeout=60.0
+            )
+            
+            logger.info(f"Image upload response: {response.status_code}")
+            
+            if response.is_success:
+                data = response.json()
+                images = data.get('images', {})
+                if images:
+                    first_key = list(images.keys())[0]
+                    return {
+                        "data": {"hash": images[first_key].get('hash')},
+                        "error": None
                     }
-                )
-                
-                logger.info(f"Image upload response: {response.status_code}")
-                
-                if response.is_success:
-                    data = response.json()
-                    images = data.get('images', {})
-                    if images:
-                        first_key = list(images.keys())[0]
-                        return {
-                            "data": {"hash": images[first_key].get('hash')},
-                            "error": None
-                        }
-                
-                error_data = response.json() if response.content else {}
-                error_msg = error_data.get("error", {}).get("message", "Upload failed")
-                logger.error(f"Meta image upload error: {error_msg} - Full response: {error_data}")
-                return {"data": None, "error": error_msg}
             
+            error_data = response.json() if response.content else {}
+            error_msg = error_data.get("error", {}).get("message", "Upload failed")
+            logger.error(f"Meta image upload error: {error_msg} - Full response: {error_data}")
+            return {"data": None, "error": error_msg}
+        
         except Exception as e:
             logger.error(f"Error uploading ad image: {e}")
             return {"data": None, "error": str(e)}
@@ -13,15 +13,19 @@ Handles:
 import logging
 import json
 import base64
-import hmac
 import hashlib
+import time
+import asyncio
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone, timedelta
 from cryptography.fernet import Fernet
 
 from ..supabase_service import get_supabase_admin_client
 from .meta_sdk_client import create_meta_sdk_client, MetaSDKError
+from .meta_ads_service import generate_appsecret_proof, get_graph_http_client
 from ...config import settings
+from ...utils.cache import TTLCache
+from ...utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +35,50 @@ TOKEN_EXPIRY_WARNING_DAYS = 7
 # Token refresh threshold (days before expiration to trigger refresh)
 TOKEN_REFRESH_THRESHOLD_DAYS = 14
 
+# Meta platforms in credential priority order
+META_PLATFORM_PRIORITY = ("meta_ads", "facebook", "instagram")
+
+# Connected Meta rows per workspace are reused for this many seconds, so the
+# several credential lookups made for one request share a Supabase read
+META_ROWS_CACHE_SECONDS = 5
+_meta_rows_cache = TTLCache(maxsize=1024, ttl=META_ROWS_CACHE_SECONDS)
+
+# Concurrent cache misses for a workspace (e.g. lookups gathered by one handler)
+# share a single in-flight read
+_meta_rows_flight = SingleFlight()
+
+# Assembled get_connection_status payloads - dashboards poll it, and it costs a
+# Supabase read plus capability checks
+CONNECTION_STATUS_CACHE_SECONDS = 15
+_connection_status_cache = TTLCache(maxsize=4096, ttl=CONNECTION_STATUS_CACHE_SECONDS)
+
+# Assembled get_ads_credentials results per workspace - every Meta Ads endpoint
+# resolves credentials first. Kept as short as the rows cache because the
+# Next.js app rotates tokens and disconnects accounts by writing social_accounts
+# directly, without invalidating here. Entries never outlive the token either.
+ADS_CREDENTIALS_CACHE_SECONDS = META_ROWS_CACHE_SECONDS
+ADS_CREDENTIALS_EXPIRY_MARGIN_SECONDS = 60
+_ads_credentials_cache = TTLCache(maxsize=10_000, ttl=ADS_CREDENTIALS_CACHE_SECONDS)
+_ads_credentials_flight = SingleFlight()
+
+# Max subrequests Meta accepts in one Graph API batch call
+GRAPH_BATCH_LIMIT = 50
+
+# Ad account fields returned with business portfolio lookups
+AD_ACCOUNT_FIELDS = "id,account_id,name,account_status,currency,timezone_name"
+
+# Successful debug_token results are reused for up to this many seconds
+# (never past the token's own expiry)
+TOKEN_VALIDATION_CACHE_SECONDS = 300
+
+# Valid token info keyed by a hash of the access token - raw tokens are never kept as keys
+_token_info_cache = TTLCache(maxsize=1024, ttl=TOKEN_VALIDATION_CACHE_SECONDS)
+
+
+def _token_cache_key(access_token: str) -> str:
+    """Hash an access token for use as a cache key"""
+    return hashlib.blake2b(access_token.encode("utf-8"), digest_size=16).hexdigest()
+
 
 class MetaCredentialsService:
     """
@@ -69,28 +117,16 @@ class MetaCredentialsService:
         - token_info: Detailed token info (if validated)
         """
         try:
-            client = get_supabase_admin_client()
-            platforms = ["meta_ads", "facebook", "instagram"]
+            try:
+                rows = await MetaCredentialsService._get_meta_rows(workspace_id)
+            except Exception as query_error:
+                logger.warning(f"Query error for Meta credentials: {query_error}")
+                return None
             
-            for platform in platforms:
-                try:
-                    # Use limit(1) instead of maybe_single() - safer for empty results
-                    result = client.table("social_accounts").select(
-                        "id, platform, credentials_encrypted, page_id, page_name, "
-                        "account_id, account_name, username, expires_at, access_token_expires_at, "
-                        "is_connected"
-                    ).eq("workspace_id", workspace_id).eq("platform", platform).eq("is_connected", True).limit(1).execute()
-                    
-                    # Check if we got any results
-                    if not result.data or len(result.data) == 0:
-                        continue
-                    
-                    row = result.data[0]
-                    
-                    if not row.get("credentials_encrypted"):
-                        continue
-                except Exception as query_error:
-                    logger.warning(f"Query error for {platform}: {query_error}")
+            for platform in META_PLATFORM_PRIORITY:
+                row = rows.get(platform)
+                
+                if not row or not row.get("credentials_encrypted"):
                     continue
                 
                 # Decrypt credentials
@@ -153,6 +189,58 @@ class MetaCredentialsService:
             logger.error(f"Error getting Meta credentials: {e}")
             return None
     
+    @staticmethod
+    async def _get_meta_rows(workspace_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get connected Meta social_accounts rows for a workspace, keyed by platform
+        
+        One query covers all Meta platforms, and the result is cached for
+        META_ROWS_CACHE_SECONDS so the get_*_credentials calls made while serving
+        one dashboard load share a single Supabase read.
+        """
+        rows = _meta_rows_cache.get(workspace_id)
+        if rows is not None:
+            return rows
+        
+        return await _meta_rows_flight.do(
+            workspace_id,
+            lambda: MetaCredentialsService._fetch_meta_rows(workspace_id),
+        )
+    
+    @staticmethod
+    async def _fetch_meta_rows(workspace_id: str) -> Dict[str, Dict[str, Any]]:
+        """Read connected Meta rows from Supabase and cache them"""
+        client = get_supabase_admin_client()
+        result = await asyncio.to_thread(
+            client.table("social_accounts").select(
+                "id, platform, credentials_encrypted, page_id, page_name, "
+                "account_id, account_name, username, expires_at, access_token_expires_at, "
+                "is_connected"
+            ).eq("workspace_id", workspace_id).in_(
+                "platform", list(META_PLATFORM_PRIORITY)
+            ).eq("is_connected", True).execute
+        )
+        
+        # First row per platform, matching the previous per-platform limit(1)
+        rows = {}
+        for row in result.data or []:
+            rows.setdefault(row.get("platform"), row)
+        
+        # Skip caching if the workspace was invalidated while this read ran
+        if _meta_rows_flight.owns(workspace_id):
+            _meta_rows_cache.set(workspace_id, rows)
+        return rows
+    
+    @staticmethod
+    def invalidate_workspace_cache(workspace_id: str) -> None:
+        """Drop cached Meta rows, credentials and connection status after a workspace's social_accounts change"""
+        _meta_rows_cache.pop(workspace_id, None)
+        _connection_status_cache.pop(workspace_id, None)
+        _ads_credentials_cache.pop(workspace_id, None)
+        # Loads already running may have read the old rows - let the next call start fresh
+        _meta_rows_flight.forget(workspace_id)
+        _ads_credentials_flight.forget(workspace_id)
+    
     # =========================================================================
     # TOKEN VALIDATION (Using SDK)
     # =========================================================================
@@ -171,9 +259,12 @@ class MetaCredentialsService:
             - scopes: List of granted permissions
             - error: Error message (if invalid)
         """
+        cache_key = _token_cache_key(access_token)
+        cached_info = _token_info_cache.get(cache_key)
+        if cached_info is not None:
+            return cached_info
+        
         try:
-            import httpx
-            
             app_id = settings.FACEBOOK_APP_ID
             app_secret = settings.FACEBOOK_APP_SECRET
             
@@ -183,41 +274,50 @@ class MetaCredentialsService:
             # Generate app access token
             app_access_token = f"{app_id}|{app_secret}"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"https://graph.facebook.com/v24.0/debug_token",
-                    params={
-                        "input_token": access_token,
-                        "access_token": app_access_token
-                    }
-                )
+            client = get_graph_http_client()
+            response = await client.get(
+                f"https://graph.facebook.com/v24.0/debug_token",
+                params={
+                    "input_token": access_token,
+                    "access_token": app_access_token
+                }
+            )
+            
+            if response.is_success:
+                data = response.json().get("data", {})
                 
-                if response.is_success:
-                    data = response.json().get("data", {})
+                is_valid = data.get("is_valid", False)
+                
+                if is_valid:
+                    expires_at = data.get("expires_at")
+                    token_info = {
+                        "is_valid": True,
+                        "app_id": data.get("app_id"),
+                        "user_id": data.get("user_id"),
+                        "expires_at": datetime.fromtimestamp(expires_at, tz=timezone.utc).isoformat() if expires_at else None,
+                        "scopes": data.get("scopes", []),
+                        "type": data.get("type"),
+                        "issued_at": data.get("issued_at"),
+                    }
                     
-                    is_valid = data.get("is_valid", False)
+                    # Only valid results are cached - failures may be transient
+                    ttl = TOKEN_VALIDATION_CACHE_SECONDS
+                    if expires_at:
+                        ttl = min(ttl, expires_at - time.time())
+                    if ttl > 0:
+                        _token_info_cache.set(cache_key, token_info, ttl=ttl)
                     
-                    if is_valid:
-                        expires_at = data.get("expires_at")
-                        return {
-                            "is_valid": True,
-                            "app_id": data.get("app_id"),
-                            "user_id": data.get("user_id"),
-                            "expires_at": datetime.fromtimestamp(expires_at, tz=timezone.utc).isoformat() if expires_at else None,
-                            "scopes": data.get("scopes", []),
-                            "type": data.get("type"),
-                            "issued_at": data.get("issued_at"),
-                        }
-                    else:
-                        error = data.get("error", {})
-                        return {
-                            "is_valid": False,
-                            "error": error.get("message", "Token is invalid"),
-                            "error_code": error.get("code"),
-                        }
+                    return token_info
                 else:
-                    return {"is_valid": False, "error": "Failed to validate token"}
-                    
+                    error = data.get("error", {})
+                    return {
+                        "is_valid": False,
+                        "error": error.get("message", "Token is invalid"),
+                        "error_code": error.get("code"),
+                    }
+            else:
+                return {"is_valid": False, "error": "Failed to validate token"}
+                
         except Exception as e:
             logger.error(f"Error validating token: {e}")
             return {"is_valid": False, "error": str(e)}
@@ -248,54 +348,52 @@ class MetaCredentialsService:
             Dict with new token info or error
         """
         try:
-            import httpx
-            
             app_id = settings.FACEBOOK_APP_ID
             app_secret = settings.FACEBOOK_APP_SECRET
             
             if not app_id or not app_secret:
                 return {"success": False, "error": "App credentials not configured"}
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://graph.facebook.com/v24.0/oauth/access_token",
-                    params={
-                        "grant_type": "fb_exchange_token",
-                        "client_id": app_id,
-                        "client_secret": app_secret,
-                        "fb_exchange_token": access_token
-                    }
-                )
+            client = get_graph_http_client()
+            response = await client.get(
+                "https://graph.facebook.com/v24.0/oauth/access_token",
+                params={
+                    "grant_type": "fb_exchange_token",
+                    "client_id": app_id,
+                    "client_secret": app_secret,
+                    "fb_exchange_token": access_token
+                }
+            )
+            
+            if response.is_success:
+                data = response.json()
+                new_token = data.get("access_token")
+                expires_in = data.get("expires_in", 5184000)  # Default 60 days
+                
+                expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+                
+                result = {
+                    "success": True,
+                    "access_token": new_token,
+                    "expires_in": expires_in,
+                    "expires_at": expires_at.isoformat(),
+                    "token_type": data.get("token_type", "bearer")
+                }
+                
+                # Update in database if workspace_id provided
+                if workspace_id and new_token:
+                    await MetaCredentialsService._update_token_in_db(
+                        workspace_id, new_token, expires_at
+                    )
+                
+                return result
+            else:
+                error_data = response.json() if response.content else {}
+                return {
+                    "success": False,
+                    "error": error_data.get("error", {}).get("message", "Token refresh failed")
+                }
                 
-                if response.is_success:
-                    data = response.json()
-                    new_token = data.get("access_token")
-                    expires_in = data.get("expires_in", 5184000)  # Default 60 days
-                    
-                    expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
-                    
-                    result = {
-                        "success": True,
-                        "access_token": new_token,
-                        "expires_in": expires_in,
-                        "expires_at": expires_at.isoformat(),
-                        "token_type": data.get("token_type", "bearer")
-                    }
-                    
-                    # Update in database if workspace_id provided
-                    if workspace_id and new_token:
-                        await MetaCredentialsService._update_token_in_db(
-                            workspace_id, new_token, expires_at
-                        )
-                    
-                    return result
-                else:
-                    error_data = response.json() if response.content else {}
-                    return {
-                        "success": False,
-                        "error": error_data.get("error", {}).get("message", "Token refresh failed")
-                    }
-                    
         except Exception as e:
             logger.error(f"Error refreshing token: {e}")
             return {"success": False, "error": str(e)}
@@ -339,6 +437,7 @@ class MetaCredentialsService:
                     "access_token_expires_at": expires_at.isoformat(),
                     "updated_at": datetime.now(timezone.utc).isoformat()
                 }).eq("id", record["id"]).execute()
+                MetaCredentialsService.invalidate_workspace_cache(workspace_id)
                 
                 logger.info(f"Updated token in database for workspace {workspace_id}")
                 return True
@@ -506,7 +605,65 @@ class MetaCredentialsService:
         """
         Get credentials specifically for Meta Ads operations
         Uses userAccessToken for ads API calls (not Page token)
+        
+        Results are cached per workspace for ADS_CREDENTIALS_CACHE_SECONDS, or
+        until shortly before the token expires if that is sooner.
         """
+        cached = _ads_credentials_cache.get(workspace_id)
+        if cached is not None:
+            return dict(cached)
+        
+        ads_credentials = await _ads_credentials_flight.do(
+            workspace_id,
+            lambda: MetaCredentialsService._load_and_cache_ads_credentials(workspace_id, user_id),
+        )
+        # Each caller gets its own copy of the shared result
+        return dict(ads_credentials) if ads_credentials else ads_credentials
+    
+    @staticmethod
+    async def _load_and_cache_ads_credentials(
+        workspace_id: str,
+        user_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Load ads credentials and cache them unless the workspace was invalidated meanwhile"""
+        ads_credentials = await MetaCredentialsService._load_ads_credentials(workspace_id, user_id)
+        
+        # Only complete, unexpired credentials are cached - a missing ad account
+        # is retried on the next call
+        if (
+            ads_credentials
+            and ads_credentials["account_id"]
+            and not ads_credentials["is_expired"]
+            and _ads_credentials_flight.owns(workspace_id)
+        ):
+            ttl = MetaCredentialsService._ads_credentials_ttl(ads_credentials["expires_at"])
+            if ttl > 0:
+                _ads_credentials_cache.set(workspace_id, dict(ads_credentials), ttl=ttl)
+        
+        return ads_credentials
+    
+    @staticmethod
+    def _ads_credentials_ttl(expires_at: Optional[str]) -> float:
+        """Cache lifetime for ads credentials, capped by the token's own expiry"""
+        if not expires_at:
+            return ADS_CREDENTIALS_CACHE_SECONDS
+        
+        try:
+            expiry_date = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+        except ValueError:
+            return 0
+        if expiry_date.tzinfo is None:
+            expiry_date = expiry_date.replace(tzinfo=timezone.utc)
+        
+        remaining = (expiry_date - datetime.now(timezone.utc)).total_seconds()
+        return min(ADS_CREDENTIALS_CACHE_SECONDS, remaining - ADS_CREDENTIALS_EXPIRY_MARGIN_SECONDS)
+    
+    @staticmethod
+    async def _load_ads_credentials(
+        workspace_id: str,
+        user_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Build Meta Ads credentials from the stored Meta credentials"""
         credentials = await MetaCredentialsService.get_meta_credentials(workspace_id, user_id)
         
         if not credentials:
@@ -551,86 +708,72 @@ class MetaCredentialsService:
     async def _fetch_ad_account_from_sdk(access_token: str) -> Optional[Dict[str, Any]]:
         """Fetch ad account from Meta API using Graph API directly (more reliable than SDK)"""
         try:
-            import httpx
-            
             GRAPH_API_VERSION = "v21.0"
             GRAPH_BASE_URL = f"https://graph.facebook.com/{GRAPH_API_VERSION}"
             
             logger.info("Fetching ad accounts via Graph API")
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # First try to get businesses
-                businesses_url = f"{GRAPH_BASE_URL}/me/businesses"
-                params = {
-                    "access_token": access_token,
-                    "fields": "id,name"
-                }
-                
-                resp = await client.get(businesses_url, params=params)
+            client = get_graph_http_client()
+            # First try businesses (and their ad accounts, in the same request)
+            status_code, data, ad_account_responses = await MetaCredentialsService._get_businesses_with_ad_accounts(
+                client,
+                GRAPH_BASE_URL,
+                access_token,
+                "id,name"
+            )
+            
+            if status_code == 200:
+                businesses = data.get("data", [])
                 
-                if resp.status_code == 200:
-                    data = resp.json()
-                    businesses = data.get("data", [])
-                    
-                    # Get ad accounts from each business
-                    for business in businesses:
-                        ad_accounts_url = f"{GRAPH_BASE_URL}/{business['id']}/owned_ad_accounts"
-                        ad_params = {
-                            "access_token": access_token,
-                            "fields": "id,account_id,name,account_status,currency,timezone_name"
-                        }
-                        
-                        ad_resp = await client.get(ad_accounts_url, params=ad_params)
+                # Take the first business (in Meta's order) that has an ad account
+                for business, ad_data in zip(businesses, ad_account_responses):
+                    if ad_data is not None:
+                        ad_accounts = ad_data.get("data", [])
                         
-                        if ad_resp.status_code == 200:
-                            ad_data = ad_resp.json()
-                            ad_accounts = ad_data.get("data", [])
-                            
-                            if ad_accounts:
-                                first_account = ad_accounts[0]
-                                logger.info(f"Found ad account from business: {first_account.get('name')}")
-                                return {
-                                    "account_id": first_account.get("account_id") or first_account.get("id", "").replace("act_", ""),
-                                    "account_name": first_account.get("name"),
-                                    "currency": first_account.get("currency"),
-                                    "timezone": first_account.get("timezone_name"),
-                                    "business_id": business["id"],
-                                    "business_name": business.get("name"),
-                                }
-                else:
-                    error_data = resp.json() if resp.content else {}
-                    logger.warning(f"Failed to get businesses: {resp.status_code} - {error_data.get('error', {}).get('message', 'Unknown')}")
-                
-                # Fallback: Try getting ad accounts directly from user
-                logger.info("Trying direct ad accounts fallback")
-                ad_accounts_url = f"{GRAPH_BASE_URL}/me/adaccounts"
-                ad_params = {
-                    "access_token": access_token,
-                    "fields": "id,account_id,name,account_status,currency,timezone_name"
-                }
-                
-                ad_resp = await client.get(ad_accounts_url, params=ad_params)
-                
-                if ad_resp.status_code == 200:
-                    ad_data = ad_resp.json()
-                    ad_accounts = ad_data.get("data", [])
-                    
-                    if ad_accounts:
-                        first_account = ad_accounts[0]
-                        logger.info(f"Found direct ad account: {first_account.get('name')}")
-                        return {
-                            "account_id": first_account.get("account_id") or first_account.get("id", "").replace("act_", ""),
-                            "account_name": first_account.get("name"),
-                            "currency": first_account.get("currency"),
-                            "timezone": first_account.get("timezone_name"),
-                        }
-                else:
-                    error_data = ad_resp.json() if ad_resp.content else {}
-                    logger.warning(f"Failed to get direct ad accounts: {ad_resp.status_code} - {error_data.get('error', {}).get('message', 'Unknown')}")
-                
-                logger.warning("No ad accounts found via any method")
-                return None
+                        if ad_accounts:
+                            first_account = ad_accounts[0]
+                            logger.info(f"Found ad account from business: {first_account.get('name')}")
+                            return {
+                                "account_id": first_account.get("account_id") or first_account.get("id", "").replace("act_", ""),
+                                "account_name": first_account.get("name"),
+                                "currency": first_account.get("currency"),
+                                "timezone": first_account.get("timezone_name"),
+                                "business_id": business["id"],
+                                "business_name": business.get("name"),
+                            }
+            else:
+                logger.warning(f"Failed to get businesses: {status_code} - {data.get('error', {}).get('message', 'Unknown')}")
+            
+            # Fallback: Try getting ad accounts directly from user
+            logger.info("Trying direct ad accounts fallback")
+            ad_accounts_url = f"{GRAPH_BASE_URL}/me/adaccounts"
+            ad_params = {
+                "access_token": access_token,
+                "fields": "id,account_id,name,account_status,currency,timezone_name"
+            }
+            
+            ad_resp = await client.get(ad_accounts_url, params=ad_params)
+            
+            if ad_resp.status_code == 200:
+                ad_data = ad_resp.json()
+                ad_accounts = ad_data.get("data", [])
                 
+                if ad_accounts:
+                    first_account = ad_accounts[0]
+                    logger.info(f"Found direct ad account: {first_account.get('name')}")
+                    return {
+                        "account_id": first_account.get("account_id") or first_account.get("id", "").replace("act_", ""),
+                        "account_name": first_account.get("name"),
+                        "currency": first_account.get("currency"),
+                        "timezone": first_account.get("timezone_name"),
+                    }
+            else:
+                error_data = ad_resp.json() if ad_resp.content else {}
+                logger.warning(f"Failed to get direct ad accounts: {ad_resp.status_code} - {error_data.get('error', {}).get('message', 'Unknown')}")
+            
+            logger.warning("No ad accounts found via any method")
+            return None
+            
         except Exception as e:
             logger.error(f"Error fetching ad account from Graph API: {e}", exc_info=True)
             return None
@@ -659,6 +802,7 @@ class MetaCredentialsService:
                 "account_name": account_name,
                 "updated_at": datetime.now(timezone.utc).isoformat()
             }).eq("id", result.data[0]["id"]).execute()
+            MetaCredentialsService.invalidate_workspace_cache(workspace_id)
             
             logger.info(f"Updated ad account info for workspace {workspace_id}")
             return True
@@ -825,15 +969,21 @@ class MetaCredentialsService:
     @staticmethod
     async def get_connection_status(workspace_id: str) -> Dict[str, Any]:
         """Get detailed connection status for all Meta platforms"""
+        cached = _connection_status_cache.get(workspace_id)
+        if cached is not None:
+            return cached
+        
         try:
             client = get_supabase_admin_client()
             
-            result = client.table("social_accounts").select(
-                "platform, is_connected, username, page_id, page_name, "
-                "account_id, account_name, credentials_encrypted, expires_at"
-            ).eq("workspace_id", workspace_id).in_(
-                "platform", ["facebook", "instagram", "meta_ads"]
-            ).execute()
+            result = await asyncio.to_thread(
+                client.table("social_accounts").select(
+                    "platform, is_connected, username, page_id, page_name, "
+                    "account_id, account_name, credentials_encrypted, expires_at"
+                ).eq("workspace_id", workspace_id).in_(
+                    "platform", ["facebook", "instagram", "meta_ads"]
+                ).execute
+            )
             
             status = {
                 "facebook": {"isConnected": False},
@@ -895,6 +1045,7 @@ class MetaCredentialsService:
             ig_cap = await MetaCredentialsService.check_instagram_capability(workspace_id)
             status["canPostInstagram"] = ig_cap.get("has_instagram_access", False)
             
+            _connection_status_cache.set(workspace_id, status)
             return status
             
         except Exception as e:
@@ -938,143 +1089,243 @@ class MetaCredentialsService:
         logger.info(f"Using {'user' if user_token else 'page'} token for business API call")
         
         try:
-            import httpx
-            import hmac
-            import hashlib
-            from src.config.settings import settings
-            
             # Use Graph API directly for reliability
             GRAPH_API_VERSION = "v24.0"
             GRAPH_BASE_URL = f"https://graph.facebook.com/{GRAPH_API_VERSION}"
             
-            # Generate appsecret_proof - required for server-side API calls
-            app_secret = settings.FACEBOOK_APP_SECRET
-            appsecret_proof = hmac.new(
-                app_secret.encode('utf-8'),
-                access_token.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest() if app_secret else ""
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Get user's businesses
-                businesses_url = f"{GRAPH_BASE_URL}/me/businesses"
-                params = {
-                    "access_token": access_token,
-                    "fields": "id,name,primary_page,created_time",
-                    "appsecret_proof": appsecret_proof
-                }
-                
-                logger.info(f"Fetching businesses from Graph API for workspace {workspace_id}")
-                resp = await client.get(businesses_url, params=params)
-                
-                if resp.status_code != 200:
-                    error_data = resp.json() if resp.content else {}
-                    error_msg = error_data.get("error", {}).get("message", "Unknown error")
-                    logger.error(f"Graph API error fetching businesses: {resp.status_code} - {error_msg}")
-                    
-                    # If no businesses, try getting ad accounts directly from the user
-                    if "does not have permission" in error_msg or resp.status_code == 403:
-                        logger.info("No business access, trying direct ad accounts")
-                        return await MetaCredentialsService._get_ad_accounts_direct(access_token)
-                    return []
-                
-                data = resp.json()
-                businesses = data.get("data", [])
+            # appsecret_proof - required for server-side API calls when an app secret is set
+            appsecret_proof = generate_appsecret_proof(access_token) or ""
+            
+            client = get_graph_http_client()
+            # Get user's businesses and their ad accounts in one Graph batch request
+            logger.info(f"Fetching businesses from Graph API for workspace {workspace_id}")
+            status_code, data, ad_account_responses = await MetaCredentialsService._get_businesses_with_ad_accounts(
+                client,
+                GRAPH_BASE_URL,
+                access_token,
+                "id,name,primary_page,created_time",
+                appsecret_proof
+            )
+            
+            if status_code != 200:
+                error_msg = data.get("error", {}).get("message", "Unknown error")
+                logger.error(f"Graph API error fetching businesses: {status_code} - {error_msg}")
                 
-                if not businesses:
-                    logger.info(f"No businesses found, trying direct ad accounts for workspace {workspace_id}")
+                # If no businesses, try getting ad accounts directly from the user
+                if "does not have permission" in error_msg or status_code == 403:
+                    logger.info("No business access, trying direct ad accounts")
                     return await MetaCredentialsService._get_ad_accounts_direct(access_token)
+                return []
+            
+            businesses = data.get("data", [])
+            
+            if not businesses:
+                logger.info(f"No businesses found, trying direct ad accounts for workspace {workspace_id}")
+                return await MetaCredentialsService._get_ad_accounts_direct(access_token)
+            
+            result = []
+            for business, ad_data in zip(businesses, ad_account_responses):
+                business_id = business["id"]
                 
-                result = []
-                for business in businesses:
-                    business_id = business["id"]
-                    
-                    # Get ad accounts for this business
-                    ad_accounts_url = f"{GRAPH_BASE_URL}/{business_id}/owned_ad_accounts"
-                    ad_params = {
-                        "access_token": access_token,
-                        "fields": "id,account_id,name,account_status,currency,timezone_name",
-                        "appsecret_proof": appsecret_proof
-                    }
-                    
-                    ad_resp = await client.get(ad_accounts_url, params=ad_params)
-                    
-                    ad_accounts = []
-                    if ad_resp.status_code == 200:
-                        ad_data = ad_resp.json()
-                        ad_accounts = [
-                            {
-                                "id": acc.get("id"),
-                                "account_id": acc.get("account_id"),
-                                "name": acc.get("name"),
-                                "account_status": acc.get("account_status"),
-                                "currency": acc.get("currency"),
-                                "timezone_name": acc.get("timezone_name")
-                            }
-                            for acc in ad_data.get("data", [])
-                        ]
-                    else:
-                        logger.warning(f"Failed to get ad accounts for business {business_id}")
-                    
-                    result.append({
-                        "id": business_id,
-                        "name": business.get("name"),
-                        "primaryPage": business.get("primary_page"),
-                        "adAccounts": ad_accounts
-                    })
-                
-                logger.info(f"Found {len(result)} businesses with ad accounts for workspace {workspace_id}")
-                return result
+                ad_accounts = []
+                if ad_data is not None:
+                    ad_accounts = [
+                        {
+                            "id": acc.get("id"),
+                            "account_id": acc.get("account_id"),
+                            "name": acc.get("name"),
+                            "account_status": acc.get("account_status"),
+                            "currency": acc.get("currency"),
+                            "timezone_name": acc.get("timezone_name")
+                        }
+                        for acc in ad_data.get("data", [])
+                    ]
+                else:
+                    logger.warning(f"Failed to get ad accounts for business {business_id}")
                 
+                result.append({
+                    "id": business_id,
+                    "name": business.get("name"),
+                    "primaryPage": business.get("primary_page"),
+                    "adAccounts": ad_accounts
+                })
+            
+            logger.info(f"Found {len(result)} businesses with ad accounts for workspace {workspace_id}")
+            return result
+            
         except Exception as e:
             logger.error(f"Error fetching businesses via Graph API: {e}", exc_info=True)
             return []
     
+    @staticmethod
+    async def _get_businesses_with_ad_accounts(
+        client: Any,
+        base_url: str,
+        access_token: str,
+        business_fields: str,
+        appsecret_proof: str = ""
+    ) -> Tuple[int, Dict[str, Any], List[Optional[Dict[str, Any]]]]:
+        """
+        Fetch /me/businesses and every business's owned ad accounts in one batch call
+        
+        The ad account subrequest references the business IDs through a
+        JSONPath dependency, so both arrive in a single HTTP round trip. That
+        lookup fails as a whole if any business is inaccessible, in which case
+        accounts are refetched per business through _graph_batch.
+        
+        Returns (status code of the businesses lookup, its parsed body, one
+        owned_ad_accounts body per business in order - None where it failed).
+        """
+        batch = [
+            {
+                "method": "GET",
+                "name": "businesses",
+                "relative_url": f"me/businesses?fields={business_fields}",
+                # Referenced below, but the caller needs this body too
+                "omit_response_on_success": False
+            },
+            {
+                "method": "GET",
+                "relative_url": f"?ids={{result=businesses:$.data.*.id}}"
+                                f"&fields=owned_ad_accounts{{{AD_ACCOUNT_FIELDS}}}"
+            }
+        ]
+        data = {
+            "access_token": access_token,
+            "batch": json.dumps(batch),
+            "include_headers": "false"
+        }
+        if appsecret_proof:
+            data["appsecret_proof"] = appsecret_proof
+        
+        resp = await client.post(f"{base_url}/", data=data)
+        
+        if resp.status_code != 200:
+            return resp.status_code, (resp.json() if resp.content else {}), []
+        
+        businesses_item, accounts_item = resp.json()
+        
+        # Items are null when Meta timed out that subrequest
+        if not businesses_item:
+            return 504, {}, []
+        
+        businesses_body = json.loads(businesses_item.get("body") or "{}")
+        if businesses_item.get("code") != 200:
+            return businesses_item.get("code"), businesses_body, []
+        
+        business_ids = [business["id"] for business in businesses_body.get("data", [])]
+        
+        if accounts_item and accounts_item.get("code") == 200:
+            by_business = json.loads(accounts_item.get("body") or "{}")
+            # Businesses without ad accounts omit the edge entirely
+            return 200, businesses_body, [
+                by_business.get(business_id, {}).get("owned_ad_accounts", {"data": []})
+                for business_id in business_ids
+            ]
+        
+        return 200, businesses_body, await MetaCredentialsService._graph_batch(
+            client,
+            base_url,
+            access_token,
+            [
+                {
+                    "method": "GET",
+                    "relative_url": f"{business_id}/owned_ad_accounts?fields={AD_ACCOUNT_FIELDS}"
+                }
+                for business_id in business_ids
+            ],
+            appsecret_proof
+        )
+    
+    @staticmethod
+    async def _graph_batch(
+        client: Any,
+        base_url: str,
+        access_token: str,
+        requests: List[Dict[str, Any]],
+        appsecret_proof: str = ""
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Run Graph API subrequests through the batch endpoint
+        
+        Sends up to GRAPH_BATCH_LIMIT subrequests per HTTP call instead of one
+        call each. Returns one parsed body per subrequest, in order, or None
+        for subrequests that failed.
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        
+        for start in range(0, len(requests), GRAPH_BATCH_LIMIT):
+            chunk = requests[start:start + GRAPH_BATCH_LIMIT]
+            data = {
+                "access_token": access_token,
+                "batch": json.dumps(chunk),
+                "include_headers": "false"
+            }
+            if appsecret_proof:
+                data["appsecret_proof"] = appsecret_proof
+            
+            resp = await client.post(f"{base_url}/", data=data)
+            
+            if resp.status_code != 200:
+                logger.error(f"Graph API batch request failed: {resp.status_code}")
+                results.extend([None] * len(chunk))
+                continue
+            
+            for item in resp.json():
+                # Items are null when Meta timed out that subrequest
+                if item and item.get("code") == 200:
+                    try:
+                        results.append(json.loads(item.get("body") or "{}"))
+                    except json.JSONDecodeError:
+                        results.append(None)
+                else:
+                    results.append(None)
+        
+        return results
+    
     @staticmethod
     async def _get_ad_accounts_direct(access_token: str) -> List[Dict[str, Any]]:
         """Fallback: Get ad accounts directly from user when no business access"""
         try:
-            import httpx
-            
             GRAPH_API_VERSION = "v24.0"
             GRAPH_BASE_URL = f"https://graph.facebook.com/{GRAPH_API_VERSION}"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                url = f"{GRAPH_BASE_URL}/me/adaccounts"
-                params = {
-                    "access_token": access_token,
-                    "fields": "id,account_id,name,account_status,currency,timezone_name"
-                }
-                
-                resp = await client.get(url, params=params)
-                
-                if resp.status_code != 200:
-                    logger.error(f"Failed to get direct ad accounts: {resp.status_code}")
-                    return []
-                
-                data = resp.json()
-                ad_accounts = [
-                    {
-                        "id": acc.get("id"),
-                        "account_id": acc.get("account_id"),
-                        "name": acc.get("name"),
-                        "account_status": acc.get("account_status"),
-                        "currency": acc.get("currency"),
-                        "timezone_name": acc.get("timezone_name")
-                    }
-                    for acc in data.get("data", [])
-                ]
-                
-                if ad_accounts:
-                    # Return as a "personal" pseudo-business
-                    return [{
-                        "id": "personal",
-                        "name": "Personal Ad Accounts",
-                        "adAccounts": ad_accounts
-                    }]
-                
+            client = get_graph_http_client()
+            url = f"{GRAPH_BASE_URL}/me/adaccounts"
+            params = {
+                "access_token": access_token,
+                "fields": "id,account_id,name,account_status,currency,timezone_name"
+            }
+            
+            resp = await client.get(url, params=params)
+            
+            if resp.status_code != 200:
+                logger.error(f"Failed to get direct ad accounts: {resp.status_code}")
                 return []
-                
+            
+            data = resp.json()
+            ad_accounts = [
+                {
+                    "id": acc.get("id"),
+                    "account_id": acc.get("account_id"),
+                    "name": acc.get("name"),
+                    "account_status": acc.get("account_status"),
+                    "currency": acc.get("currency"),
+                    "timezone_name": acc.get("timezone_name")
+                }
+                for acc in data.get("data", [])
+            ]
+            
+            if ad_accounts:
+                # Return as a "personal" pseudo-business
+                return [{
+                    "id": "personal",
+                    "name": "Personal Ad Accounts",
+                    "adAccounts": ad_accounts
+                }]
+            
+            return []
+            
         except Exception as e:
             logger.error(f"Error fetching direct ad accounts: {e}")
             return []
@@ -1129,6 +1380,7 @@ class MetaCredentialsService:
                     "business_id": business_id,
                     "updated_at": datetime.now(timezone.utc).isoformat()
                 }).eq("id", result.data[0]["id"]).execute()
+                MetaCredentialsService.invalidate_workspace_cache(workspace_id)
             
             return {
                 "success": True,
@@ -1212,6 +1464,7 @@ class MetaCredentialsService:
             else:
                 record["created_at"] = datetime.now(timezone.utc).isoformat()
                 client.table("social_accounts").insert(record).execute()
+            MetaCredentialsService.invalidate_workspace_cache(workspace_id)
             
             logger.info(f"Saved {platform} credentials for workspace {workspace_id}")
             
@@ -1235,6 +1488,7 @@ class MetaCredentialsService:
                 "is_connected": False,
                 "updated_at": datetime.now(timezone.utc).isoformat()
             }).eq("workspace_id", workspace_id).eq("platform", platform).execute()
+            MetaCredentialsService.invalidate_workspace_cache(workspace_id)
             
             logger.info(f"Disconnected {platform} for workspace {workspace_id}")
             
@@ -30,6 +30,8 @@ Ads/Marketing (in src.services.meta_ads):
 For ads/campaigns/adsets, use meta_ads_service.py
 """
 import asyncio
+import hashlib
+import hmac
 import logging
 from typing import Optional, Dict, Any, List
 from functools import wraps
@@ -115,6 +117,47 @@ def async_sdk_call(func):
     return wrapper
 
 
+def build_object_story_spec(
+    page_id: str,
+    image_hash: str = None,
+    video_id: str = None,
+    message: str = None,
+    link: str = None,
+    call_to_action_type: str = 'LEARN_MORE'
+) -> Dict[str, Any]:
+    """
+    Build the object_story_spec for a single image/link or video creative.
+    Link is required for link-based creatives.
+    """
+    if not link and not video_id:
+        raise ValueError("Either link or video_id must be provided for ad creative")
+    
+    object_story_spec = {
+        'page_id': page_id,
+    }
+    
+    if video_id:
+        # Video creative
+        object_story_spec['video_data'] = {
+            'video_id': video_id,
+            'message': message or '',
+            'call_to_action': {'type': call_to_action_type}
+        }
+        if link:
+            object_story_spec['video_data']['call_to_action']['value'] = {'link': link}
+    else:
+        # Link creative (requires link)
+        object_story_spec['link_data'] = {
+            'message': message or '',
+            'link': link,
+            'call_to_action': {'type': call_to_action_type}
+        }
+        if image_hash:
+            object_story_spec['link_data']['image_hash'] = image_hash
+    
+    return object_story_spec
+
+
 class MetaSDKClient:
     """
     Meta Business SDK Client - Core Initialization
@@ -180,9 +223,6 @@ class MetaSDKClient:
         
         Required for server-side API calls to Meta's Graph API.
         """
-        import hmac
-        import hashlib
-        
         if not self.app_secret or not self._access_token:
             return ""
         return hmac.new(
@@ -690,33 +730,11 @@ class MetaSDKClient:
         """
         Create ad creative. Link is required for link-based creatives.
         """
-        if not link and not video_id:
-            raise ValueError("Either link or video_id must be provided for ad creative")
+        object_story_spec = build_object_story_spec(
+            page_id, image_hash, video_id, message, link, call_to_action_type
+        )
         
         account = AdAccount(f'act_{ad_account_id}')
-        object_story_spec = {
-            'page_id': page_id,
-        }
-        
-        if video_id:
-            # Video creative
-            object_story_spec['video_data'] = {
-                'video_id': video_id,
-                'message': message or '',
-                'call_to_action': {'type': call_to_action_type}
-            }
-            if link:
-                object_story_spec['video_data']['call_to_action']['value'] = {'link': link}
-        else:
-            # Link creative (requires link)
-            object_story_spec['link_data'] = {
-                'message': message or '',
-                'link': link,
-                'call_to_action': {'type': call_to_action_type}
-            }
-            if image_hash:
-                object_story_spec['link_data']['image_hash'] = image_hash
-        
         params = {'name': name, 'object_story_spec': object_story_spec}
         result = account.create_ad_creative(params=params)
         return {'id': result.get('id'), 'creative_id': result.get('id')}
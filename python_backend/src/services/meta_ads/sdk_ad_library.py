@@ -12,7 +12,7 @@ import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 
-import httpx
+from .meta_ads_service import get_graph_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -91,50 +91,50 @@ class AdLibraryService:
             if media_type:
                 params["media_type"] = media_type
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(AD_LIBRARY_API, params=params)
+            client = get_graph_http_client()
+            response = await client.get(AD_LIBRARY_API, params=params)
+            
+            if response.status_code == 200:
+                data = response.json()
+                ads = data.get("data", [])
+                
+                # Process and enrich ads
+                processed_ads = []
+                for ad in ads:
+                    processed_ads.append({
+                        "id": ad.get("id"),
+                        "page_name": ad.get("page_name"),
+                        "page_id": ad.get("page_id"),
+                        "ad_text": (ad.get("ad_creative_bodies") or [""])[0],
+                        "headline": (ad.get("ad_creative_link_titles") or [""])[0],
+                        "description": (ad.get("ad_creative_link_descriptions") or [""])[0],
+                        "snapshot_url": ad.get("ad_snapshot_url"),
+                        "platforms": ad.get("publisher_platforms", []),
+                        "start_date": ad.get("ad_delivery_start_time"),
+                        "end_date": ad.get("ad_delivery_stop_time"),
+                        "impressions": ad.get("impressions", {}),
+                        "spend": ad.get("spend", {}),
+                        "audience_size": ad.get("estimated_audience_size", {}),
+                        "target_ages": ad.get("target_ages"),
+                        "target_gender": ad.get("target_gender"),
+                        "target_locations": ad.get("target_locations", []),
+                        "languages": ad.get("languages", []),
+                        "is_active": ad.get("ad_delivery_stop_time") is None
+                    })
+                
+                return {
+                    "success": True,
+                    "ads": processed_ads,
+                    "total": len(processed_ads),
+                    "paging": data.get("paging")
+                }
+            else:
+                error = response.json().get("error", {})
+                return {
+                    "success": False,
+                    "error": error.get("message", "API request failed")
+                }
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    ads = data.get("data", [])
-                    
-                    # Process and enrich ads
-                    processed_ads = []
-                    for ad in ads:
-                        processed_ads.append({
-                            "id": ad.get("id"),
-                            "page_name": ad.get("page_name"),
-                            "page_id": ad.get("page_id"),
-                            "ad_text": (ad.get("ad_creative_bodies") or [""])[0],
-                            "headline": (ad.get("ad_creative_link_titles") or [""])[0],
-                            "description": (ad.get("ad_creative_link_descriptions") or [""])[0],
-                            "snapshot_url": ad.get("ad_snapshot_url"),
-                            "platforms": ad.get("publisher_platforms", []),
-                            "start_date": ad.get("ad_delivery_start_time"),
-                            "end_date": ad.get("ad_delivery_stop_time"),
-                            "impressions": ad.get("impressions", {}),
-                            "spend": ad.get("spend", {}),
-                            "audience_size": ad.get("estimated_audience_size", {}),
-                            "target_ages": ad.get("target_ages"),
-                            "target_gender": ad.get("target_gender"),
-                            "target_locations": ad.get("target_locations", []),
-                            "languages": ad.get("languages", []),
-                            "is_active": ad.get("ad_delivery_stop_time") is None
-                        })
-                    
-                    return {
-                        "success": True,
-                        "ads": processed_ads,
-                        "total": len(processed_ads),
-                        "paging": data.get("paging")
-                    }
-                else:
-                    error = response.json().get("error", {})
-                    return {
-                        "success": False,
-                        "error": error.get("message", "API request failed")
-                    }
-                    
         except Exception as e:
             logger.error(f"Ad Library search error: {e}")
             return {"success": False, "error": str(e)}
@@ -289,50 +289,50 @@ class AdLibraryService:
             if media_type:
                 params["media_type"] = media_type
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(AD_LIBRARY_API, params=params)
+            client = get_graph_http_client()
+            response = await client.get(AD_LIBRARY_API, params=params)
+            
+            if response.status_code == 200:
+                data = response.json()
+                ads = data.get("data", [])
+                
+                # Process and enrich ads
+                processed_ads = []
+                for ad in ads:
+                    processed_ads.append({
+                        "id": ad.get("id"),
+                        "page_name": ad.get("page_name"),
+                        "page_id": ad.get("page_id"),
+                        "ad_text": (ad.get("ad_creative_bodies") or [""])[0],
+                        "headline": (ad.get("ad_creative_link_titles") or [""])[0],
+                        "description": (ad.get("ad_creative_link_descriptions") or [""])[0],
+                        "snapshot_url": ad.get("ad_snapshot_url"),
+                        "platforms": ad.get("publisher_platforms", []),
+                        "start_date": ad.get("ad_delivery_start_time"),
+                        "end_date": ad.get("ad_delivery_stop_time"),
+                        "impressions": ad.get("impressions", {}),
+                        "spend": ad.get("spend", {}),
+                        "audience_size": ad.get("estimated_audience_size", {}),
+                        "target_ages": ad.get("target_ages"),
+                        "target_gender": ad.get("target_gender"),
+                        "target_locations": ad.get("target_locations", []),
+                        "languages": ad.get("languages", []),
+                        "is_active": ad.get("ad_delivery_stop_time") is None
+                    })
+                
+                return {
+                    "success": True,
+                    "ads": processed_ads,
+                    "total": len(processed_ads),
+                    "paging": data.get("paging")
+                }
+            else:
+                error = response.json().get("error", {})
+                return {
+                    "success": False,
+                    "error": error.get("message", "API request failed")
+                }
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    ads = data.get("data", [])
-                    
-                    # Process and enrich ads
-                    processed_ads = []
-                    for ad in ads:
-                        processed_ads.append({
-                            "id": ad.get("id"),
-                            "page_name": ad.get("page_name"),
-                            "page_id": ad.get("page_id"),
-                            "ad_text": (ad.get("ad_creative_bodies") or [""])[0],
-                            "headline": (ad.get("ad_creative_link_titles") or [""])[0],
-                            "description": (ad.get("ad_creative_link_descriptions") or [""])[0],
-                            "snapshot_url": ad.get("ad_snapshot_url"),
-                            "platforms": ad.get("publisher_platforms", []),
-                            "start_date": ad.get("ad_delivery_start_time"),
-                            "end_date": ad.get("ad_delivery_stop_time"),
-                            "impressions": ad.get("impressions", {}),
-                            "spend": ad.get("spend", {}),
-                            "audience_size": ad.get("estimated_audience_size", {}),
-                            "target_ages": ad.get("target_ages"),
-                            "target_gender": ad.get("target_gender"),
-                            "target_locations": ad.get("target_locations", []),
-                            "languages": ad.get("languages", []),
-                            "is_active": ad.get("ad_delivery_stop_time") is None
-                        })
-                    
-                    return {
-                        "success": True,
-                        "ads": processed_ads,
-                        "total": len(processed_ads),
-                        "paging": data.get("paging")
-                    }
-                else:
-                    error = response.json().get("error", {})
-                    return {
-                        "success": False,
-                        "error": error.get("message", "API request failed")
-                    }
-                    
         except Exception as e:
             logger.error(f"Ad Library search error: {e}")
             return {"success": False, "error": str(e)}
@@ -8,9 +8,12 @@ Uses:
 - Create/manage custom audiences and lookalike audiences
 """
 import asyncio
+import hashlib
 import json
 import logging
-from typing import Optional, Dict, Any, List
+import re
+import secrets
+from typing import Callable, Optional, Dict, Any, List
 
 from facebook_business.adobjects.adaccount import AdAccount
 from facebook_business.adobjects.customaudience import CustomAudience
@@ -23,6 +26,62 @@ logger = logging.getLogger(__name__)
 # API Version
 META_API_VERSION = "v24.0"
 
+# Max rows Meta accepts per custom audience users call, and how many batches
+# of one upload session are sent at once
+AUDIENCE_UPLOAD_BATCH_SIZE = 10_000
+AUDIENCE_UPLOAD_CONCURRENCY = 4
+
+_NON_DIGITS = re.compile(r"\D")
+_NON_LETTERS = re.compile(r"[\W\d_]")
+_SHA256_HEX = re.compile(r"[0-9a-f]{64}")
+
+
+def _two_digits(value: str) -> str:
+    digits = _NON_DIGITS.sub("", value)
+    return digits.zfill(2) if digits else ""
+
+
+# Meta's normalization for each customer-data schema field before SHA-256
+# hashing. EXTERN_ID is the advertiser's own ID and is sent unhashed.
+_CUSTOMER_FIELD_NORMALIZERS: Dict[str, Callable[[str], str]] = {
+    "EMAIL": lambda v: v.strip().lower(),
+    "PHONE": lambda v: _NON_DIGITS.sub("", v).lstrip("0"),
+    "FN": lambda v: _NON_LETTERS.sub("", v.lower()),
+    "LN": lambda v: _NON_LETTERS.sub("", v.lower()),
+    "CT": lambda v: _NON_LETTERS.sub("", v.lower()),
+    "ST": lambda v: _NON_LETTERS.sub("", v.lower()),
+    "ZIP": lambda v: "".join(v.lower().split()),
+    "COUNTRY": lambda v: _NON_LETTERS.sub("", v.lower()),
+    "DOBY": lambda v: _NON_DIGITS.sub("", v),
+    "DOBM": _two_digits,
+    "DOBD": _two_digits,
+    "GEN": lambda v: v.strip().lower()[:1],
+}
+
+
+def hash_customer_data(schema: List[str], data: List[List[Any]]) -> List[List[str]]:
+    """
+    Normalize and SHA-256 hash customer data rows for audience uploads
+    
+    Values that are already SHA-256 hex digests pass through unchanged, so
+    pre-hashed uploads are not hashed twice. CPU-bound on large uploads -
+    callers run it in a worker thread.
+    """
+    normalizers = [_CUSTOMER_FIELD_NORMALIZERS.get(field) for field in schema]
+    sha256 = hashlib.sha256
+    
+    hashed_rows = []
+    for row in data:
+        hashed_row = []
+        for normalize, value in zip(normalizers, row):
+            value = "" if value is None else str(value)
+            if normalize is not None and not _SHA256_HEX.fullmatch(value):
+                normalized = normalize(value)
+                value = sha256(normalized.encode("utf-8")).hexdigest() if normalized else ""
+            hashed_row.append(value)
+        hashed_rows.append(hashed_row)
+    return hashed_rows
+
 
 class CustomAudiencesService:
     """Service for custom audience management using Meta SDK."""
@@ -278,7 +337,11 @@ class CustomAudiencesService:
     # =========================================================================
     
     def _upload_audience_users_sync(
-        self, audience_id: str, schema: List[str], data: List[List[str]]
+        self,
+        audience_id: str,
+        schema: List[str],
+        data: List[List[str]],
+        session: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Upload users to a custom audience."""
         try:
@@ -288,9 +351,11 @@ class CustomAudiencesService:
             params = {
                 'payload': {
                     'schema': schema,
-                    'data': data
+                    'data': hash_customer_data(schema, data)
                 }
             }
+            if session:
+                params['session'] = session
             
             result = audience.create_user(params=params)
             
@@ -307,10 +372,56 @@ class CustomAudiencesService:
     async def upload_audience_users(
         self, audience_id: str, schema: List[str], data: List[List[str]]
     ) -> Dict[str, Any]:
-        """Upload users to a custom audience (async)."""
-        return await asyncio.to_thread(
-            self._upload_audience_users_sync, audience_id, schema, data
-        )
+        """
+        Upload users to a custom audience (async).
+        
+        Uploads over AUDIENCE_UPLOAD_BATCH_SIZE rows are split into batches of
+        one Meta upload session. All but the last batch are sent concurrently,
+        then the last one closes the session. Counts are summed across batches.
+        """
+        if len(data) <= AUDIENCE_UPLOAD_BATCH_SIZE:
+            return await asyncio.to_thread(
+                self._upload_audience_users_sync, audience_id, schema, data
+            )
+        
+        batches = [
+            data[start:start + AUDIENCE_UPLOAD_BATCH_SIZE]
+            for start in range(0, len(data), AUDIENCE_UPLOAD_BATCH_SIZE)
+        ]
+        session_id = secrets.randbits(63)
+        semaphore = asyncio.Semaphore(AUDIENCE_UPLOAD_CONCURRENCY)
+        
+        async def _send(batch_seq: int, batch: List[List[str]]) -> Dict[str, Any]:
+            session = {
+                'session_id': session_id,
+                'batch_seq': batch_seq,
+                'last_batch_flag': batch_seq == len(batches),
+                'estimated_num_total': len(data)
+            }
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._upload_audience_users_sync, audience_id, schema, batch, session
+                )
+        
+        results = list(await asyncio.gather(*(
+            _send(batch_seq, batch)
+            for batch_seq, batch in enumerate(batches[:-1], start=1)
+        )))
+        
+        # Leave the session open (no last batch) if anything failed
+        for result in results:
+            if not result.get('success'):
+                return result
+        
+        results.append(await _send(len(batches), batches[-1]))
+        if not results[-1].get('success'):
+            return results[-1]
+        
+        return {
+            'success': True,
+            'num_received': sum(result.get('num_received', 0) for result in results),
+            'num_invalid_entries': sum(result.get('num_invalid_entries', 0) for result in results)
+        }
     
     def _remove_audience_users_sync(
         self, audience_id: str, schema: List[str], data: List[List[str]]
@@ -320,10 +431,11 @@ class CustomAudiencesService:
             self._init_api()
             audience = CustomAudience(fbid=audience_id)
             
+            # Removal matches on the same digests the upload sent
             params = {
                 'payload': {
                     'schema': schema,
-                    'data': data
+                    'data': hash_customer_data(schema, data)
                 }
             }
             
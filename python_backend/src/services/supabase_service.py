@@ -2,6 +2,7 @@
 Supabase Service
 Production-ready implementation for Supabase storage, database, and authentication
 """
+import asyncio
 import logging
 import base64
 import uuid
@@ -16,7 +17,9 @@ from ..config import settings
 
 logger = logging.getLogger(__name__)
 
-# Client instances
+# Client instances - created lazily once per process and reused by every request.
+# Each client keeps a single PostgREST httpx session, so connections stay alive
+# across requests. Don't build these at import time: settings may be unset.
 _supabase_client: Optional[Client] = None
 _supabase_admin_client: Optional[Client] = None
 
@@ -421,7 +424,9 @@ async def verify_jwt(token: str) -> Dict[str, Any]:
     """Verify JWT token and fetch user profile"""
     try:
         client = get_supabase_client()
-        user_resp = client.auth.get_user(token)
+        # supabase-py is synchronous - keep both auth round-trips off the event loop,
+        # since every authenticated request awaits this
+        user_resp = await asyncio.to_thread(client.auth.get_user, token)
         
         if not user_resp or not user_resp.user:
             return {"success": False, "error": "Invalid token"}
@@ -436,9 +441,11 @@ async def verify_jwt(token: str) -> Dict[str, Any]:
         
         # Fetch profile using admin client to bypass RLS
         admin = get_supabase_admin_client()
-        profile_resp = admin.table("users").select(
-            "workspace_id, role, is_active"
-        ).eq("id", user_id).single().execute()
+        profile_resp = await asyncio.to_thread(
+            admin.table("users").select(
+                "workspace_id, role, is_active"
+            ).eq("id", user_id).single().execute
+        )
         
         if profile_resp.data:
             profile = profile_resp.data
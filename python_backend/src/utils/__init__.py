@@ -5,7 +5,18 @@ Utility modules for the content creator backend.
 from .document_processor import (
     process_document_from_base64,
 )
+from .cache import TTLCache
+from .rate_limiter import AdaptiveRateLimiter, is_rate_limit_error
+from .singleflight import SingleFlight, request_key
+from .bulkhead import Bulkhead, BulkheadFullError
 
 __all__ = [
     "process_document_from_base64",
+    "TTLCache",
+    "AdaptiveRateLimiter",
+    "is_rate_limit_error",
+    "SingleFlight",
+    "request_key",
+    "Bulkhead",
+    "BulkheadFullError",
 ]
@@ -0,0 +1,59 @@
+"""
+Bulkhead Utility
+
+Per-provider concurrency isolation. Each upstream provider gets its own
+bounded slot pool and a short wait queue, so a slow or failing provider
+can only tie up its own requests - excess callers fail fast instead of
+queueing behind it and exhausting shared workers and connection pools.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+
+class BulkheadFullError(Exception):
+    """Raised when a bulkhead has no free slot and its wait queue is full"""
+
+    def __init__(self, name: str):
+        super().__init__(f"{name} is at capacity")
+        self.name = name
+
+
+class Bulkhead:
+    """
+    Bounded concurrency with a bounded wait queue.
+
+    Usage:
+        async with bulkhead.slot():
+            result = await call_provider()
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_waiting: int = 0):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_waiting = max_waiting
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers currently queued for a slot"""
+        return self._waiting
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of a call, or raise BulkheadFullError"""
+        if self._semaphore.locked() and self._waiting >= self.max_waiting:
+            raise BulkheadFullError(self.name)
+
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            yield
+        finally:
+            self._semaphore.release()
@@ -0,0 +1,92 @@
+"""
+In-Process Cache Utility
+
+Small TTL + LRU cache for memoizing hot reads (LLM responses, API lookups)
+inside a single worker process. Not shared across workers.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    LRU cache whose entries expire ``ttl`` seconds after being stored.
+
+    With ``maxweight`` and a ``weigher`` (e.g. payload size in bytes), least
+    recently used entries are also evicted while the total weight is over
+    the limit, and a single value heavier than the limit is not stored.
+
+    Access is synchronous and never awaits, so it is safe to use from
+    coroutines on a single event loop without a lock.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        maxweight: Optional[int] = None,
+        weigher: Optional[Callable[[Any], int]] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxweight = maxweight
+        self.weigher = weigher
+        self.weight = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value, _ = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting least recently used entries if full"""
+        weight = self.weigher(value) if self.weigher else 0
+        self._remove(key)
+        if self.maxweight is not None and weight > self.maxweight:
+            return
+
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value, weight)
+        self.weight += weight
+
+        while len(self._data) > self.maxsize or (
+            self.maxweight is not None and self.weight > self.maxweight
+        ):
+            _, (_, _, evicted_weight) = self._data.popitem(last=False)
+            self.weight -= evicted_weight
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (expired or not)"""
+        entry = self._remove(key)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+        self.weight = 0
+
+    def _remove(self, key: Hashable) -> Optional[Tuple[float, Any, int]]:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.weight -= entry[2]
+        return entry
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
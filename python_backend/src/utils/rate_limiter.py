@@ -0,0 +1,94 @@
+"""
+Adaptive Rate Limiter Utility
+
+Client-side limiter for upstream AI provider calls. Combines a sliding-window
+request rate (e.g. 60 RPM) with an AIMD concurrency cap: each rate-limited
+(429) response halves the allowed concurrency, each success grows it back by
+about one slot per round of calls. This keeps bursts from turning into
+429-induced retry storms.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Best-effort detection of provider 429 / quota-exhausted errors"""
+    for attr in ("status_code", "code", "status"):
+        if getattr(error, attr, None) == 429:
+            return True
+
+    message = str(error)
+    return "429" in message or "RESOURCE_EXHAUSTED" in message
+
+
+class AdaptiveRateLimiter:
+    """
+    Sliding-window rate limiter with AIMD concurrency control.
+
+    Usage:
+        async with limiter.slot():
+            result = await call_provider()
+    """
+
+    def __init__(self, max_rate: int, time_period: float = 60.0, max_concurrency: int = 8):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.max_concurrency = max_concurrency
+        self._concurrency = float(max_concurrency)
+        self._active = 0
+        self._calls: Deque[float] = deque()
+        self._condition = asyncio.Condition()
+
+    @property
+    def concurrency(self) -> int:
+        """Currently allowed number of concurrent calls"""
+        return max(1, int(self._concurrency))
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one concurrency + rate slot for the duration of a call"""
+        await self._acquire_concurrency()
+        throttled = False
+        try:
+            await self._acquire_rate()
+            yield
+        except Exception as e:
+            throttled = is_rate_limit_error(e)
+            raise
+        finally:
+            await self._release(throttled)
+
+    async def _acquire_concurrency(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.concurrency)
+            self._active += 1
+
+    async def _acquire_rate(self) -> None:
+        while True:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= self.time_period:
+                self._calls.popleft()
+
+            if len(self._calls) < self.max_rate:
+                self._calls.append(now)
+                return
+
+            await asyncio.sleep(self.time_period - (now - self._calls[0]))
+
+    async def _release(self, throttled: bool) -> None:
+        async with self._condition:
+            self._active -= 1
+            if throttled:
+                # Multiplicative decrease
+                self._concurrency = max(1.0, self._concurrency / 2)
+            else:
+                # Additive increase - roughly +1 slot per full round of calls
+                self._concurrency = min(
+                    float(self.max_concurrency),
+                    self._concurrency + 1 / self.concurrency,
+                )
+            self._condition.notify_all()
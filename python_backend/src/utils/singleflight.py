@@ -0,0 +1,60 @@
+"""
+Single-Flight Utility
+
+Coalesces concurrent identical calls: the first caller for a key starts the
+work, later callers with the same key await that same task instead of
+repeating an expensive upstream call (LLM, image/video generation).
+"""
+
+import asyncio
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+import orjson
+
+
+def request_key(namespace: str, payload: Any) -> str:
+    """Stable hash of a namespace plus a JSON-serializable payload"""
+    body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return namespace + ":" + hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class SingleFlight:
+    """
+    In-process single-flight group.
+
+    Usage:
+        result = await group.do(key, lambda: call_provider(request))
+
+    A factory that caches its result should check owns(key) first, so a call
+    forgotten by an invalidation doesn't write stale data back.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory() once per key among concurrent callers and share its result"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        # Shielded so one caller disconnecting doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+    def forget(self, key: Hashable) -> None:
+        """Detach the in-flight call for key so the next caller starts a fresh one"""
+        self._inflight.pop(key, None)
+
+    def owns(self, key: Hashable) -> bool:
+        """Whether the running task is still the in-flight call for key (not forgotten)"""
+        return self._inflight.get(key) is asyncio.current_task()
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._inflight)
@@ -0,0 +1,62 @@
+import hashlib
+
+from src.services.meta_ads.sdk_custom_audiences import hash_customer_data
+
+
+def sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def hash_one(field: str, value):
+    return hash_customer_data([field], [[value]])[0][0]
+
+
+def test_email_is_trimmed_lowercased_and_hashed():
+    assert hash_one("EMAIL", "  Test@Example.COM ") == (
+        "973dfe463ec85785f5f95af5ba3906eedb2d931c24e69824a89ea65dba4e813b"
+    )
+
+
+def test_phone_keeps_digits_without_leading_zeros():
+    assert hash_one("PHONE", "+1 (650) 555-1212") == sha256("16505551212")
+    assert hash_one("PHONE", "00447911123456") == sha256("447911123456")
+
+
+def test_names_and_places_keep_lowercase_letters_only():
+    assert hash_one("FN", "Mary-Ann") == sha256("maryann")
+    assert hash_one("LN", "O'Brien 3rd") == sha256("obrienrd")
+    assert hash_one("FN", "Zoë") == sha256("zoë")
+    assert hash_one("CT", "San Francisco") == sha256("sanfrancisco")
+    assert hash_one("ST", "CA") == sha256("ca")
+    assert hash_one("COUNTRY", " US ") == sha256("us")
+
+
+def test_zip_is_lowercased_without_whitespace():
+    assert hash_one("ZIP", "SW1A 1AA") == sha256("sw1a1aa")
+
+
+def test_date_of_birth_parts_are_zero_padded_digits():
+    assert hash_one("DOBY", "1990") == sha256("1990")
+    assert hash_one("DOBM", "3") == sha256("03")
+    assert hash_one("DOBD", "07") == sha256("07")
+
+
+def test_gender_is_first_letter():
+    assert hash_one("GEN", "Female") == sha256("f")
+    assert hash_one("GEN", " M ") == sha256("m")
+
+
+def test_empty_values_stay_empty_instead_of_hashing_blank():
+    schema = ["EMAIL", "PHONE", "DOBM", "FN"]
+    assert hash_customer_data(schema, [["", None, "", "123"]]) == [["", "", "", ""]]
+
+
+def test_prehashed_values_are_not_hashed_twice():
+    digest = sha256("test@example.com")
+    assert hash_one("EMAIL", digest) == digest
+
+
+def test_extern_id_is_sent_unhashed():
+    schema = ["EXTERN_ID", "EMAIL"]
+    rows = hash_customer_data(schema, [["crm-42", "a@b.co"], [17, "c@d.co"]])
+    assert rows == [["crm-42", sha256("a@b.co")], ["17", sha256("c@d.co")]]
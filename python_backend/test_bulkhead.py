@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from src.utils.bulkhead import Bulkhead, BulkheadFullError
+
+
+@pytest.mark.asyncio
+async def test_full_bulkhead_rejects_beyond_wait_queue():
+    bulkhead = Bulkhead("provider", max_concurrency=1, max_waiting=1)
+    release = asyncio.Event()
+
+    async def call():
+        async with bulkhead.slot():
+            await release.wait()
+
+    running = asyncio.create_task(call())
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(call())
+    await asyncio.sleep(0)
+    assert bulkhead.waiting == 1
+
+    with pytest.raises(BulkheadFullError) as excinfo:
+        async with bulkhead.slot():
+            pass
+    assert excinfo.value.name == "provider"
+
+    release.set()
+    await asyncio.gather(running, queued)
+    assert bulkhead.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_is_released_when_call_fails():
+    bulkhead = Bulkhead("provider", max_concurrency=1)
+
+    with pytest.raises(RuntimeError):
+        async with bulkhead.slot():
+            raise RuntimeError("provider error")
+
+    async with bulkhead.slot():
+        pass
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    bulkhead = Bulkhead("provider", max_concurrency=1, max_waiting=1)
+    release = asyncio.Event()
+
+    async def call():
+        async with bulkhead.slot():
+            await release.wait()
+
+    running = asyncio.create_task(call())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(call())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert bulkhead.waiting == 0
+
+    release.set()
+    await running
@@ -0,0 +1,61 @@
+from src.utils.cache import TTLCache
+
+
+def test_expired_entries_are_missing():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("fresh", 1)
+    cache.set("stale", 2, ttl=-1)
+
+    assert cache.get("fresh") == 1
+    assert cache.get("stale", "default") == "default"
+    assert "stale" not in cache
+
+
+def test_maxsize_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_weight_bound_evicts_least_recently_used():
+    cache = TTLCache(maxsize=10, ttl=60, maxweight=10, weigher=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "xxxx")
+    cache.get("a")
+    cache.set("c", "xxxx")
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.weight == 8
+
+
+def test_value_heavier_than_limit_is_not_stored():
+    cache = TTLCache(maxsize=10, ttl=60, maxweight=10, weigher=len)
+    cache.set("small", "xx")
+    cache.set("huge", "x" * 11)
+
+    assert "huge" not in cache
+    assert "small" in cache
+    assert cache.weight == 2
+
+
+def test_replacing_and_popping_keep_weight_accurate():
+    cache = TTLCache(maxsize=10, ttl=60, maxweight=100, weigher=len)
+    cache.set("a", "xxxx")
+    cache.set("a", "xx")
+    assert cache.weight == 2
+
+    assert cache.pop("a") == "xx"
+    assert cache.weight == 0
+
+    cache.set("b", "xxx")
+    cache.clear()
+    assert cache.weight == 0
+    assert len(cache) == 0
@@ -0,0 +1,96 @@
+import json
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from src.services.meta_ads import meta_ads_service
+from src.services.meta_ads.meta_ads_service import MetaAdsService
+
+
+def _graph_client(requests, items):
+    """Graph client that records each request and answers with batch items"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=items)
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def graph_requests(monkeypatch):
+    requests = []
+    items = [
+        {"code": 200, "body": json.dumps({"id": "creative_1"})},
+        {"code": 200, "body": json.dumps({"id": "ad_1"})},
+        {"code": 200, "body": json.dumps({"id": "ad_1", "name": "Ad", "status": "PAUSED"})},
+    ]
+    monkeypatch.setattr(meta_ads_service, "_graph_http_client", _graph_client(requests, items))
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_create_ad_with_creative_batch_payload(graph_requests):
+    result = await MetaAdsService().create_ad_with_creative(
+        account_id="123",
+        access_token="token",
+        page_id="page_1",
+        name="Ad",
+        adset_id="adset_1",
+        creative_name="Creative",
+        image_hash="hash_1",
+        link_url="https://example.com",
+    )
+
+    assert result == {
+        "success": True,
+        "creative_id": "creative_1",
+        "ad": {"id": "ad_1", "name": "Ad", "status": "PAUSED"},
+        "error": None,
+    }
+
+    assert len(graph_requests) == 1
+    form = parse_qs(graph_requests[0].content.decode())
+    batch = json.loads(form["batch"][0])
+
+    creative, ad, read_back = batch
+    assert creative["name"] == "creative"
+    assert creative["relative_url"] == "act_123/adcreatives"
+    assert parse_qs(creative["body"])["name"] == ["Creative"]
+
+    # The result reference must reach Meta unencoded or it is never substituted
+    assert ad["name"] == "ad"
+    assert ad["relative_url"] == "act_123/ads"
+    assert ad["body"] == (
+        'name=Ad&adset_id=adset_1&status=PAUSED'
+        '&creative={"creative_id":"{result=creative:$.id}"}'
+    )
+
+    assert read_back == {
+        "method": "GET",
+        "relative_url": "{result=ad:$.id}?fields=id,name,adset_id,campaign_id,status,effective_status,creative",
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_ad_with_creative_reports_creative_error(monkeypatch):
+    items = [
+        {"code": 400, "body": json.dumps({"error": {"message": "Invalid image hash"}})},
+        {"code": 400, "body": json.dumps({"error": {"message": "Dependent request failed"}})},
+        None,
+    ]
+    monkeypatch.setattr(meta_ads_service, "_graph_http_client", _graph_client([], items))
+
+    result = await MetaAdsService().create_ad_with_creative(
+        account_id="123",
+        access_token="token",
+        page_id="page_1",
+        name="Ad",
+        adset_id="adset_1",
+        creative_name="Creative",
+        image_hash="hash_1",
+        link_url="https://example.com",
+    )
+
+    assert result["success"] is False
+    assert result["creative_id"] is None
+    assert result["error"] == "Invalid image hash"
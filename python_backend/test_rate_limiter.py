@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from src.utils.rate_limiter import AdaptiveRateLimiter, is_rate_limit_error
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"provider returned {status_code}")
+        self.status_code = status_code
+
+
+def test_is_rate_limit_error():
+    assert is_rate_limit_error(ProviderError(429))
+    assert is_rate_limit_error(Exception("429 RESOURCE_EXHAUSTED"))
+    assert not is_rate_limit_error(ProviderError(500))
+
+
+@pytest.mark.asyncio
+async def test_concurrency_never_exceeds_limit():
+    limiter = AdaptiveRateLimiter(max_rate=100, max_concurrency=2)
+    active = 0
+    peak = 0
+
+    async def call():
+        nonlocal active, peak
+        async with limiter.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_error_halves_concurrency_and_propagates():
+    limiter = AdaptiveRateLimiter(max_rate=100, max_concurrency=8)
+
+    with pytest.raises(ProviderError):
+        async with limiter.slot():
+            raise ProviderError(429)
+    assert limiter.concurrency == 4
+
+    async with limiter.slot():
+        pass
+    assert limiter.concurrency == 4
+
+
+@pytest.mark.asyncio
+async def test_other_errors_do_not_reduce_concurrency():
+    limiter = AdaptiveRateLimiter(max_rate=100, max_concurrency=4)
+
+    with pytest.raises(ProviderError):
+        async with limiter.slot():
+            raise ProviderError(500)
+    assert limiter.concurrency == 4
+
+
+@pytest.mark.asyncio
+async def test_calls_over_the_rate_wait_for_the_window():
+    limiter = AdaptiveRateLimiter(max_rate=2, time_period=0.2, max_concurrency=4)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    for _ in range(3):
+        async with limiter.slot():
+            pass
+
+    assert loop.time() - started >= 0.15
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from src.utils.singleflight import SingleFlight, request_key
+
+
+def test_request_key_ignores_dict_order():
+    assert request_key("ns", {"a": 1, "b": 2}) == request_key("ns", {"b": 2, "a": 1})
+    assert request_key("ns", {"a": 1}) != request_key("other", {"a": 1})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    group = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "result"
+
+    callers = [asyncio.create_task(group.do("key", work)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert len(group) == 1
+
+    release.set()
+    assert await asyncio.gather(*callers) == ["result"] * 5
+    assert calls == 1
+    assert len(group) == 0
+
+
+@pytest.mark.asyncio
+async def test_calls_after_completion_run_again():
+    group = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await group.do("key", work) == 1
+    assert await group.do("key", work) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    group = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "result"
+
+    first = asyncio.create_task(group.do("key", work))
+    second = asyncio.create_task(group.do("key", work))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    release.set()
+    assert await second == "result"
+
+
+@pytest.mark.asyncio
+async def test_error_reaches_every_caller_and_is_not_kept():
+    group = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise ValueError("upstream failed")
+
+    callers = [asyncio.create_task(group.do("key", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*callers, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(group) == 0
+
+    async def working():
+        return "recovered"
+
+    assert await group.do("key", working) == "recovered"
+
+
+@pytest.mark.asyncio
+async def test_forget_starts_a_fresh_call_and_revokes_ownership():
+    group = SingleFlight()
+    release = asyncio.Event()
+    owned = []
+
+    async def work(value):
+        await release.wait()
+        owned.append((value, group.owns("key")))
+        return value
+
+    stale = asyncio.create_task(group.do("key", lambda: work("stale")))
+    await asyncio.sleep(0)
+    group.forget("key")
+    fresh = asyncio.create_task(group.do("key", lambda: work("fresh")))
+    await asyncio.sleep(0)
+
+    release.set()
+    assert await stale == "stale"
+    assert await fresh == "fresh"
+    assert sorted(owned) == [("fresh", True), ("stale", False)]
@@ -0,0 +1,43 @@
+-- Migration: Add disconnect_platform_and_log RPC
+-- Date: 2026-10-17
+-- Description: Disconnecting a non-Meta platform deleted the social_accounts row and
+--              then inserted an activity_logs row in a second request. This function
+--              does both in one transaction, so the API makes a single RPC call and
+--              the log can never diverge from the connection state.
+
+CREATE OR REPLACE FUNCTION public.disconnect_platform_and_log(
+    p_workspace uuid,
+    p_user uuid,
+    p_platform text
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    deleted_count integer;
+BEGIN
+    DELETE FROM public.social_accounts
+    WHERE workspace_id = p_workspace
+    AND platform::text = p_platform;
+
+    GET DIAGNOSTICS deleted_count = ROW_COUNT;
+
+    -- resource_id is a uuid column, so the platform name goes in details
+    INSERT INTO public.activity_logs (workspace_id, user_id, action, resource_type, details)
+    VALUES (
+        p_workspace,
+        p_user,
+        'disconnect',
+        'credential',
+        jsonb_build_object('platform', p_platform)
+    );
+
+    RETURN deleted_count;
+END;
+$$;
+
+-- Only the backend (service role) may call this - it bypasses RLS
+REVOKE EXECUTE ON FUNCTION public.disconnect_platform_and_log(uuid, uuid, text) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.disconnect_platform_and_log(uuid, uuid, text) TO service_role;